@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import logging
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 import yarl
-from amcrest_api.camera import Camera as AmcrestApiCamera
 from amcrest_api.ptz import PtzBasicMove, PtzPresetData, PtzRelativeMove
 from homeassistant.components import zeroconf
 from homeassistant.components.zeroconf import IPVersion
@@ -23,18 +23,31 @@ from homeassistant.const import (
 from homeassistant.exceptions import ConfigEntryError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.json import save_json
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util import dt as dt_util
 from homeassistant.util import ssl as hass_ssl
 
-from .const import DOMAIN
+from . import tracing, websocket_api
+from .api import AmcrestApi
+from .bus import AmcrestEventPublisher
+from .const import CONF_API_METRICS, DOMAIN, SIGNAL_COORDINATOR_READY
 from .coordinator import AmcrestDataCoordinator
+from .metrics import ApiMetrics
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant, ServiceCall
     from zeroconf import ServiceInfo
 
+_LOGGER = logging.getLogger(__name__)
+
 PLATFORMS = [
     Platform.BINARY_SENSOR,
+    Platform.BUTTON,
     Platform.CAMERA,
+    Platform.EVENT,
+    Platform.IMAGE,
     Platform.SELECT,
     Platform.SENSOR,
     Platform.SWITCH,
@@ -54,6 +67,9 @@ SERVICE_CLEAR_PTZ_PRESET = "remove_ptz_preset"
 SERVICE_PRESET_ID = "preset_id"
 SERVICE_PRESET_NAME = "preset_name"
 
+SERVICE_START_TRACE = "start_trace"
+SERVICE_STOP_TRACE = "stop_trace"
+
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
 
@@ -78,6 +94,16 @@ def async_coordinator_from_service_call(
 async def async_handle_ptz(call: ServiceCall) -> None:
     """Handle PTZ service calls."""
     coordinator = async_coordinator_from_service_call(call)
+    with tracing.span(call.service, "ptz") as span_args:
+        if span_args is not None:
+            span_args.update(call.data)
+        await _async_move_ptz(coordinator, call)
+    await coordinator.async_request_refresh()
+
+
+async def _async_move_ptz(
+    coordinator: AmcrestDataCoordinator, call: ServiceCall
+) -> None:
     if call.data.get("move_mode") == "relative":
         move = PtzRelativeMove()
         if (direction := call.data.get(SERVICE_PAN_DIRECTION)) is not None:
@@ -102,7 +128,6 @@ async def async_handle_ptz(call: ServiceCall) -> None:
             await coordinator.api.async_ptz_move(move, duration)
         elif move_mode == "stop":
             await coordinator.api.async_ptz_stop(move)
-    await coordinator.async_request_refresh()
 
 
 async def async_handle_update_ptz_preset(call: ServiceCall) -> None:
@@ -112,7 +137,8 @@ async def async_handle_update_ptz_preset(call: ServiceCall) -> None:
     preset = PtzPresetData(
         index=index, name=call.data.get(SERVICE_PRESET_NAME, f"Preset{index}")
     )
-    await coordinator.api.async_set_ptz_preset(preset)
+    with tracing.span(call.service, "ptz", {"preset": index}):
+        await coordinator.api.async_set_ptz_preset(preset)
     await coordinator.async_request_refresh()
 
 
@@ -120,10 +146,32 @@ async def async_handle_clear_ptz_preset(call: ServiceCall) -> None:
     """Handles clearing a PTZ preset."""
     coordinator = async_coordinator_from_service_call(call)
     index = int(call.data[SERVICE_PRESET_ID])
-    await coordinator.api.async_clear_ptz_preset(index)
+    with tracing.span(call.service, "ptz", {"preset": index}):
+        await coordinator.api.async_clear_ptz_preset(index)
     await coordinator.async_request_refresh()
 
 
+async def async_handle_start_trace(call: ServiceCall) -> None:
+    """Start recording a trace of every camera's work."""
+    if tracing.start() is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="trace_already_started"
+        )
+
+
+async def async_handle_stop_trace(call: ServiceCall) -> None:
+    """Stop the trace, writing it to the config directory."""
+    if (tracer := tracing.stop()) is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="trace_not_started"
+        )
+    path = call.hass.config.path(
+        f"{DOMAIN}_trace_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    await call.hass.async_add_executor_job(save_json, path, tracer.as_dict())
+    _LOGGER.info("Wrote a trace of %d events to %s", len(tracer.events), path)
+
+
 # pylint: disable=unused-argument
 async def async_setup(hass: HomeAssistant, config: Any) -> bool:
     """Set up the integration."""
@@ -135,6 +183,13 @@ async def async_setup(hass: HomeAssistant, config: Any) -> bool:
     hass.services.async_register(
         DOMAIN, SERVICE_CLEAR_PTZ_PRESET, async_handle_clear_ptz_preset
     )
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_START_TRACE, async_handle_start_trace
+    )
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_STOP_TRACE, async_handle_stop_trace
+    )
+    websocket_api.async_setup(hass)
     return True
 
 
@@ -171,7 +226,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: AmcrestConfigEntry) -> b
     else:
         url = yarl.URL(entry.data[CONF_URL])
 
-    api = AmcrestApiCamera(
+    api = AmcrestApi(
         host=url.host,
         port=url.port,
         username=entry.data[CONF_USERNAME],
@@ -179,17 +234,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: AmcrestConfigEntry) -> b
         scheme=url.scheme,
         verify=hass_ssl.get_default_context(),
     )
+    if entry.options.get(CONF_API_METRICS, False):
+        api.metrics = ApiMetrics()
 
     coordinator = AmcrestDataCoordinator(hass, api)
-    await coordinator.async_config_entry_first_refresh()
+    with tracing.span("first refresh", "setup", {"camera": url.host}):
+        await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
+    publisher = AmcrestEventPublisher(hass, entry)
+    entry.async_on_unload(publisher.async_start())
+    entry.async_on_unload(entry.add_update_listener(publisher.async_options_updated))
+    entry.async_on_unload(entry.add_update_listener(async_update_api_metrics))
+    # Subscribes whatever follows this entry's events, the publisher included
+    async_dispatcher_send(
+        hass, SIGNAL_COORDINATOR_READY.format(entry.entry_id), coordinator
+    )
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    with tracing.span("platforms", "setup", {"camera": url.host}):
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+async def async_update_api_metrics(
+    hass: HomeAssistant, entry: AmcrestConfigEntry
+) -> None:
+    """Reload to add or remove the metrics sensors when they are toggled."""
+    if entry.options.get(CONF_API_METRICS, False) != (
+        entry.runtime_data.api.metrics is not None
+    ):
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: AmcrestConfigEntry) -> bool:
     """Unload a config entry."""
     did_unload = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
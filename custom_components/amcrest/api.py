@@ -0,0 +1,161 @@
+"""Amcrest camera API, extended where amcrest-api falls short."""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from amcrest_api.camera import Camera as AmcrestApiCamera
+from amcrest_api.const import ApiEndpoints
+
+from . import tracing
+from .const import REQUEST_HISTORY_SIZE
+from .events import parse_event
+from .metrics import endpoint_name
+from .mjpeg import MultipartParser
+from .stats import EventHistory
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable
+
+    import httpx
+    from amcrest_api.event import EventBase
+
+    from .metrics import ApiMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+_BOUNDARY_RE = re.compile(r"boundary=\"?([^\";]+)")
+
+
+@dataclass(slots=True)
+class _RequestRecord:
+    """A request being recorded, filled in by the client's event hooks."""
+
+    trace: Callable[[str, dict[str, Any]], Awaitable[None]] | None = None
+    response: httpx.Response | None = None
+
+
+# The request each task is recording, if any
+_request_record: ContextVar[_RequestRecord | None] = ContextVar(
+    "amcrest_request_record", default=None
+)
+
+
+async def _async_trace_request(request: httpx.Request) -> None:
+    """Trace the phases of a request being recorded while a trace is active."""
+    if (record := _request_record.get()) is not None and record.trace is not None:
+        request.extensions["trace"] = record.trace
+
+
+async def _async_record_response(response: httpx.Response) -> None:
+    """Keep the last response to a request being recorded."""
+    if (record := _request_record.get()) is not None:
+        record.response = response
+
+
+class AmcrestApi(AmcrestApiCamera):  # type: ignore[misc]
+    """
+    Camera API that reads event codes unknown to amcrest-api, and records
+    request metrics when given somewhere to record them, and spans of its
+    requests while a trace is active.
+    The times of recent requests are always kept, for their rate.
+    """
+
+    metrics: ApiMetrics | None = None
+    _client: httpx.AsyncClient | None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the API."""
+        super().__init__(*args, **kwargs)
+        self.request_history = EventHistory(REQUEST_HISTORY_SIZE)
+
+    def _create_async_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        client: httpx.AsyncClient = super()._create_async_client(
+            event_hooks={
+                "request": [_async_trace_request],
+                "response": [_async_record_response],
+            },
+            **kwargs,
+        )
+        return client
+
+    async def _async_api_request(
+        self,
+        endpoint: str,
+        *,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        self.request_history.add(time.monotonic())
+        metrics, tracer = self.metrics, tracing.tracer
+        if metrics is None and tracer is None:
+            return await super()._async_api_request(
+                endpoint, method=method, params=params
+            )
+        # TODO: Move to amcrest-api once it can report on its requests
+        name = endpoint_name(endpoint, params)
+        record = _RequestRecord(trace=tracer.http_trace() if tracer else None)
+        token = _request_record.set(record)
+        with tracing.span(name, "request", {"camera": self._host}) as span_args:
+            start = time.monotonic()
+            try:
+                result = await super()._async_api_request(
+                    endpoint, method=method, params=params
+                )
+            except Exception as e:
+                if metrics is not None:
+                    metrics.add_error(name, time.monotonic() - start, e)
+                raise
+            finally:
+                _request_record.reset(token)
+            size = len(response.content) if (response := record.response) else 0
+            if metrics is not None:
+                metrics.add(name, time.monotonic() - start, size)
+            if span_args is not None and response is not None:
+                span_args["status"] = response.status_code
+                span_args["bytes"] = size
+                # digest auth answers a challenge by sending the request again
+                span_args["auth_challenges"] = len(response.history)
+        return result
+
+    async def async_listen_events(
+        self,
+        *,
+        heartbeat_seconds: int = 10,
+        filter_events: list[str] | None = None,
+    ) -> AsyncGenerator[EventBase]:
+        """
+        Listen to the camera's events.
+        Unlike amcrest-api, messages of unknown codes are skipped rather than
+        ending the stream, and doorbell codes are parsed.
+        """
+        # TODO: Move to amcrest-api once it reads events of any code
+        filter_events = filter_events or await self.async_supported_events
+        async with (
+            self._create_async_client(timeout=heartbeat_seconds * 2) as client,
+            client.stream(
+                "GET",
+                ApiEndpoints.EVENT_MANAGER,
+                params={
+                    "action": "attach",
+                    "codes": f"[{','.join(filter_events)}]",
+                    "heartbeat": heartbeat_seconds,
+                },
+            ) as response,
+        ):
+            response.raise_for_status()
+            match = _BOUNDARY_RE.search(response.headers.get("content-type", ""))
+            parser = MultipartParser(match.group(1) if match else "myboundary")
+            async for chunk in response.aiter_bytes():
+                for part in parser.feed(chunk):
+                    try:
+                        event = parse_event(part.decode())
+                    except ValueError:
+                        _LOGGER.debug("Skipping unknown event message %s", part)
+                        continue
+                    yield event
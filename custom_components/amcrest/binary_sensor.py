@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from amcrest_api.event import EventAction, EventMessageType
+from amcrest_api.event import EventAction
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
@@ -12,12 +12,15 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.core import HomeAssistant, callback
 
 from .entity import AmcrestEntity
+from .events import EVENT_TYPES
 
 if TYPE_CHECKING:
+    from amcrest_api.event import EventBase
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from . import AmcrestConfigEntry
     from .coordinator import AmcrestDataCoordinator
+    from .events import AmcrestEventType
 
 
 # pylint: disable=unused-argument
@@ -28,71 +31,131 @@ async def async_setup_entry(
 ) -> None:
     """Set up Amcrest binary sensors."""
     coordinator = entry.runtime_data
+    supported_events = coordinator.fixed_config.supported_events
+    event_types = {
+        code: event_type
+        for code, event_type in EVENT_TYPES.items()
+        if event_type.stateful
+        and (event_type.always_created or code in supported_events)
+    }
 
     async_add_entities(
-        [AmcrestVideoMotionSensor(coordinator), AmcrestAudioMutationSensor(coordinator)]
+        AmcrestEventSensor(coordinator, code, event_type)
+        for code, event_type in event_types.items()
     )
 
+    added_regions: set[tuple[str, str]] = set()
 
-class AmcrestVideoMotionSensor(AmcrestEntity, BinarySensorEntity):
-    """Binary sensor for Amcrest camera motion detection."""
+    @callback
+    def async_add_region_sensors() -> None:
+        """Add sensors for regions that are new to the coordinator."""
+        new_regions = [
+            (code, region)
+            for code, regions in coordinator.known_event_regions.items()
+            if code in event_types and event_types[code].regions
+            for region in regions
+            if (code, region) not in added_regions
+        ]
+        if not new_regions:
+            return
+        added_regions.update(new_regions)
+        async_add_entities(
+            AmcrestEventRegionSensor(coordinator, code, event_types[code], region)
+            for code, region in new_regions
+        )
+
+    async_add_region_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(async_add_region_sensors))
 
-    _attr_has_entity_name = True
-    _attr_device_class = BinarySensorDeviceClass.MOTION
-    _attr_translation_key = "motion_detected"
 
-    def __init__(self, coordinator: AmcrestDataCoordinator) -> None:
+class AmcrestEventSensor(AmcrestEntity, BinarySensorEntity):
+    """Binary sensor that is on between an event's Start and Stop."""
+
+    _attr_has_entity_name = True
+    _region: str | None = None
+
+    def __init__(
+        self,
+        coordinator: AmcrestDataCoordinator,
+        event_code: str,
+        event_type: AmcrestEventType,
+    ) -> None:
         """Initialize entity."""
         super().__init__(coordinator=coordinator)
-        self._attr_unique_id = f"{coordinator.fixed_config.serial_number}-motion_sensor"
+        self._event_code = event_code
+        self._event_type = event_type
+        self._attr_unique_id = (
+            f"{coordinator.fixed_config.serial_number}-{event_type.key}"
+        )
+        self._attr_translation_key = event_type.translation_key
+        if isinstance(event_type.device_class, BinarySensorDeviceClass):
+            self._attr_device_class = event_type.device_class
+        self._attr_entity_registry_enabled_default = event_type.enabled_default
+
+    async def async_added_to_hass(self) -> None:
+        """Receive events with this sensor's code directly."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_event_listener(
+                self._event_code, self._async_handle_event, region=self._region
+            )
+        )
+        if self._event_type.always_listen:
+            self.async_on_remove(
+                self.coordinator.async_subscribe_events({self._event_code})
+            )
+        self._async_update_is_on()
+
+    @property
+    def _last_event(self) -> EventBase | None:
+        return self.coordinator.amcrest_data.last_events.get(self._event_code)
 
     @callback
-    def _handle_coordinator_update(self) -> None:
+    def _async_handle_event(self, event: EventBase) -> None:
+        self._attr_is_on = event.action == EventAction.Start
+        self.coordinator.async_schedule_write_state(self, event)
+
+    @callback
+    def _async_update_is_on(self) -> None:
         if (
             self.coordinator.is_listening_for_events
-            and EventMessageType.VideoMotion in self.coordinator.event_listener_filter
+            and self._event_code in self.coordinator.event_listener_filter
         ):
-            if self.coordinator.amcrest_data.last_video_motion_event is None:
-                self._attr_is_on = False
-            else:
-                self._attr_is_on = (
-                    self.coordinator.amcrest_data.last_video_motion_event.action
-                    == EventAction.Start
-                )
+            last_event = self._last_event
+            self._attr_is_on = (
+                last_event is not None and last_event.action == EventAction.Start
+            )
         else:
             # Unavailable if not listening
             self._attr_is_on = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_update_is_on()
         self.async_write_ha_state()
 
 
-class AmcrestAudioMutationSensor(AmcrestEntity, BinarySensorEntity):
-    """Binary sensor for Amcrest camera audio mutation."""
+class AmcrestEventRegionSensor(AmcrestEventSensor):
+    """Binary sensor for an event in one region, or of one IVS rule."""
 
-    _attr_has_entity_name = True
-    _attr_device_class = BinarySensorDeviceClass.SOUND
-    _attr_translation_key = "audio_detected"
+    _region: str
 
-    def __init__(self, coordinator: AmcrestDataCoordinator) -> None:
+    def __init__(
+        self,
+        coordinator: AmcrestDataCoordinator,
+        event_code: str,
+        event_type: AmcrestEventType,
+        region: str,
+    ) -> None:
         """Initialize entity."""
-        super().__init__(coordinator=coordinator)
-        self._attr_unique_id = (
-            f"{coordinator.fixed_config.serial_number}-audio_mutation_sensor"
+        super().__init__(coordinator, event_code, event_type)
+        self._region = region
+        self._attr_unique_id = f"{self._attr_unique_id}-{region}"
+        self._attr_translation_key = f"{event_type.translation_key}_region"
+        self._attr_translation_placeholders = {"region": region}
+
+    @property
+    def _last_event(self) -> EventBase | None:
+        return self.coordinator.amcrest_data.last_region_events.get(
+            (self._event_code, self._region)
         )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        if (
-            self.coordinator.is_listening_for_events
-            and EventMessageType.AudioMutation in self.coordinator.event_listener_filter
-        ):
-            if self.coordinator.amcrest_data.last_audio_mutation_event is None:
-                self._attr_is_on = False
-            else:
-                self._attr_is_on = (
-                    self.coordinator.amcrest_data.last_audio_mutation_event.action
-                    == EventAction.Start
-                )
-        else:
-            # Unavailable if not listening
-            self._attr_is_on = None
-        self.async_write_ha_state()
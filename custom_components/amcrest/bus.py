@@ -0,0 +1,106 @@
+"""Publication of camera events on the Home Assistant event bus."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from .const import (
+    CONF_BUS_EVENT_CODES,
+    CONF_BUS_EVENT_INTERVAL_SECONDS,
+    CONF_BUS_EVENT_STRIP_FIELDS,
+    DEFAULT_BUS_EVENT_INTERVAL_SECONDS,
+    EVENT_AMCREST,
+)
+from .data import event_code, event_payload
+from .helpers import async_track_camera_events
+
+if TYPE_CHECKING:
+    from amcrest_api.event import EventBase
+
+    from . import AmcrestConfigEntry
+
+
+class AmcrestEventPublisher:
+    """
+    Fires the events of the codes an entry opts in to as `amcrest_event`.
+    Only opted in codes are followed, others are never parsed or copied.
+    A code's repeats of the same action are limited to one an interval,
+    while a change of action always goes through.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: AmcrestConfigEntry) -> None:
+        """Initialize the publisher."""
+        self._hass = hass
+        self._entry = entry
+        self._untrack: CALLBACK_TYPE | None = None
+        self._interval: float = DEFAULT_BUS_EVENT_INTERVAL_SECONDS
+        self._strip_fields: frozenset[str] = frozenset()
+        self._last_fired: dict[str, tuple[str, float]] = {}
+        self._device_id: str | None = None
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start publishing, returning a callback to stop."""
+        self._async_apply_options()
+        return self._async_stop
+
+    @callback
+    def _async_stop(self) -> None:
+        if self._untrack is not None:
+            self._untrack()
+            self._untrack = None
+
+    async def async_options_updated(
+        self, hass: HomeAssistant, entry: AmcrestConfigEntry
+    ) -> None:
+        """Follow the codes of changed options."""
+        self._async_apply_options()
+
+    @callback
+    def _async_apply_options(self) -> None:
+        self._async_stop()
+        options = self._entry.options
+        self._interval = options.get(
+            CONF_BUS_EVENT_INTERVAL_SECONDS, DEFAULT_BUS_EVENT_INTERVAL_SECONDS
+        )
+        self._strip_fields = frozenset(options.get(CONF_BUS_EVENT_STRIP_FIELDS, ()))
+        self._last_fired.clear()
+        if codes := options.get(CONF_BUS_EVENT_CODES):
+            self._untrack = async_track_camera_events(
+                self._hass, self._entry, codes, self._async_handle_event
+            )
+
+    @callback
+    def _async_handle_event(self, event: EventBase) -> None:
+        code = event_code(event)
+        action = event.action.lower()
+        now = self._hass.loop.time()
+        if (
+            (last := self._last_fired.get(code)) is not None
+            and last[0] == action
+            and now - last[1] < self._interval
+        ):
+            return
+        self._last_fired[code] = (action, now)
+        data = event_payload(event)
+        if self._strip_fields:
+            data = {k: v for k, v in data.items() if k not in self._strip_fields}
+        if self._device_id is None and (
+            device := dr.async_get(self._hass).async_get_device(
+                identifiers=self._entry.runtime_data.identifiers
+            )
+        ):
+            self._device_id = device.id
+        self._hass.bus.async_fire(
+            EVENT_AMCREST,
+            {
+                ATTR_DEVICE_ID: self._device_id,
+                "code": code,
+                "action": action,
+                "data": data,
+            },
+        )
@@ -1 +1,98 @@
 """Buttons for Amcrest camera."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.components.button import (
+    ButtonDeviceClass,
+    ButtonEntity,
+    ButtonEntityDescription,
+)
+from homeassistant.const import EntityCategory
+
+from .entity import AmcrestEntity
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from . import AmcrestConfigEntry
+    from .coordinator import AmcrestDataCoordinator
+
+PARALLEL_UPDATES = 0
+
+
+@dataclass(frozen=True, kw_only=True)
+class AmcrestButtonEntityDescription(ButtonEntityDescription):
+    """Describes the Amcrest button entity."""
+
+    exists_fn: Callable[[AmcrestDataCoordinator], bool] = lambda _: True
+    press_fn: Callable[[AmcrestDataCoordinator], Awaitable[None]]
+
+
+DESCRIPTIONS: tuple[AmcrestButtonEntityDescription, ...] = (
+    AmcrestButtonEntityDescription(
+        key="reboot",
+        device_class=ButtonDeviceClass.RESTART,
+        entity_category=EntityCategory.CONFIG,
+        press_fn=lambda coordinator: coordinator.async_reboot(),
+    ),
+    AmcrestButtonEntityDescription(
+        key="snapshot",
+        translation_key="snapshot",
+        icon="mdi:camera",
+        press_fn=lambda coordinator: coordinator.async_take_snapshot(),
+    ),
+    AmcrestButtonEntityDescription(
+        key="ptz_home",
+        translation_key="ptz_home",
+        icon="mdi:home-import-outline",
+        exists_fn=lambda coordinator: (
+            coordinator.fixed_config.ptz_capabilities.pan
+            or coordinator.fixed_config.ptz_capabilities.tilt
+        ),
+        press_fn=lambda coordinator: coordinator.async_ptz_home(),
+    ),
+)
+
+
+# pylint: disable=unused-argument
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: AmcrestConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Amcrest buttons."""
+    coordinator = entry.runtime_data
+    async_add_entities(
+        AmcrestButton(coordinator, description)
+        for description in DESCRIPTIONS
+        if description.exists_fn(coordinator)
+    )
+
+
+class AmcrestButton(AmcrestEntity, ButtonEntity):
+    """Button for a camera action."""
+
+    _attr_has_entity_name = True
+    entity_description: AmcrestButtonEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AmcrestDataCoordinator,
+        description: AmcrestButtonEntityDescription,
+    ) -> None:
+        """Initialize the button."""
+        super().__init__(coordinator=coordinator)
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{coordinator.fixed_config.serial_number}-{description.key}"
+        )
+
+    async def async_press(self) -> None:
+        """Press the button."""
+        await self.entity_description.press_fn(self.coordinator)
@@ -4,18 +4,39 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from amcrest_api.const import StreamType
-from amcrest_api.event import EventMessageType
+from amcrest_api.event import EventAction, EventMessageType
+from homeassistant.components.camera import DOMAIN as CAMERA_DOMAIN
 from homeassistant.components.camera import Camera as CameraEntity
 from homeassistant.components.camera import CameraEntityFeature
-from homeassistant.core import callback
+from homeassistant.components.stream import (
+    CONF_EXTRA_PART_WAIT_TIME,
+    CONF_RTSP_TRANSPORT,
+    CONF_USE_WALLCLOCK_AS_TIMESTAMPS,
+    HLS_PROVIDER,
+)
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 
+from . import tracing
+from .const import (
+    CONF_PRELOAD_IDLE_SECONDS,
+    CONF_PRELOAD_STREAM,
+    DEFAULT_PRELOAD_IDLE_SECONDS,
+    DOMAIN,
+)
 from .entity import AmcrestEntity
+from .mjpeg import MjpegStreamHub, async_iter_mjpeg_frames
 
 if TYPE_CHECKING:
+    from aiohttp import web
+    from amcrest_api.event import VideoMotionEvent
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import (
         AddEntitiesCallback,
@@ -28,19 +49,53 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # pylint: disable=unused-argument
+    hass: HomeAssistant,
     entry: AmcrestConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the IP Camera from config entry."""
     coordinator: AmcrestDataCoordinator = entry.runtime_data
-    cameras = [AmcrestCameraEntity(coordinator=coordinator)]
-    # set up subfeeds
-    for i in range(1, coordinator.fixed_config.max_extra_stream + 1):
-        cameras.append(
-            AmcrestCameraEntity(coordinator=coordinator, stream_type=StreamType(i))
-        )
-    async_add_entities(cameras)
+    cameras: dict[StreamType, AmcrestCameraEntity] = {}
+
+    @callback
+    def async_sync_streams() -> None:
+        """Create entities for selected streams, remove the rest."""
+        selected = coordinator.selected_streams
+        ent_reg = er.async_get(hass)
+        for stream_type in coordinator.fixed_config.supported_streams:
+            if (
+                stream_type in selected
+                or (
+                    entity_id := ent_reg.async_get_entity_id(
+                        CAMERA_DOMAIN,
+                        DOMAIN,
+                        AmcrestCameraEntity.build_unique_id(coordinator, stream_type),
+                    )
+                )
+                is None
+            ):
+                continue
+            # removing from the registry also removes the entity from hass
+            ent_reg.async_remove(entity_id)
+            cameras.pop(stream_type, None)
+
+        new_cameras = {
+            stream_type: AmcrestCameraEntity(
+                coordinator=coordinator, stream_type=stream_type
+            )
+            for stream_type in selected
+            if stream_type not in cameras
+        }
+        cameras.update(new_cameras)
+        async_add_entities(new_cameras.values())
+
+    async def async_update_streams(
+        _hass: HomeAssistant, _entry: AmcrestConfigEntry
+    ) -> None:
+        async_sync_streams()
+
+    async_sync_streams()
+    entry.async_on_unload(entry.add_update_listener(async_update_streams))
 
 
 @dataclass(kw_only=True)
@@ -84,9 +139,25 @@ class AmcrestCameraEntity(CameraEntity, RestoreEntity, AmcrestEntity):
             self._attr_supported_features |= CameraEntityFeature.ON_OFF
 
         self._stream_type = stream_type
-        self._attr_unique_id = (
-            f"{self.coordinator.fixed_config.serial_number}-{self._stream_type}"
-        )
+        self._attr_unique_id = self.build_unique_id(coordinator, stream_type)
+
+        # Wall clock timestamps smooth over the camera's irregular RTP clock,
+        # and parts are allowed to wait for the next keyframe.
+        self.stream_options = {
+            CONF_RTSP_TRANSPORT: "tcp",
+            CONF_USE_WALLCLOCK_AS_TIMESTAMPS: True,
+        }
+        if (encode := coordinator.encode_config.get(stream_type)) is not None:
+            self._attr_extra_state_attributes = {
+                "video_codec": encode.codec,
+                "frame_rate": encode.fps,
+                "gop": encode.gop,
+            }
+            if (keyframe_interval := encode.keyframe_interval_seconds) is not None:
+                self.stream_options[CONF_EXTRA_PART_WAIT_TIME] = keyframe_interval
+                self._attr_extra_state_attributes["keyframe_interval"] = round(
+                    keyframe_interval, 3
+                )
         if stream_type == StreamType.MAIN:
             self._attr_translation_key = "main_stream"
         elif stream_type == StreamType.SUBSTREAM1:
@@ -96,6 +167,21 @@ class AmcrestCameraEntity(CameraEntity, RestoreEntity, AmcrestEntity):
         else:
             self._attr_translation_key = "unknown_stream"
 
+        self._mjpeg_hub = MjpegStreamHub(
+            lambda: async_iter_mjpeg_frames(
+                self.coordinator.api, subtype=self._stream_type
+            ),
+            name=self._attr_unique_id,
+        )
+        self._cancel_preload_keepalive: CALLBACK_TYPE | None = None
+
+    @staticmethod
+    def build_unique_id(
+        coordinator: AmcrestDataCoordinator, stream_type: StreamType
+    ) -> str:
+        """Unique ID of the camera entity for a stream."""
+        return f"{coordinator.fixed_config.serial_number}-{stream_type}"
+
     @property
     def extra_restore_state_data(self) -> ExtraStoredData | None:
         """Return motion detection state."""
@@ -115,6 +201,17 @@ class AmcrestCameraEntity(CameraEntity, RestoreEntity, AmcrestEntity):
             **extra_data.as_dict()
         ).motion_detection_enabled:
             await self.async_enable_motion_detection()
+        self.async_on_remove(
+            self.coordinator.async_add_event_listener(
+                EventMessageType.VideoMotion, self._async_handle_motion_event
+            )
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Disconnect any MJPEG viewers."""
+        self._async_stop_preload_keepalive()
+        await self._mjpeg_hub.async_close()
+        await super().async_will_remove_from_hass()
 
     async def async_turn_on(self) -> None:
         """
@@ -164,19 +261,101 @@ class AmcrestCameraEntity(CameraEntity, RestoreEntity, AmcrestEntity):
     ) -> bytes | None:
         """Return a still image response from the camera."""
         if self._attr_is_on:
-            return bytes(
-                await self.coordinator.api.async_snapshot(subtype=self._stream_type)
-            )
+            with tracing.span("snapshot", "snapshot", {"entity_id": self.entity_id}):
+                return bytes(
+                    await self.coordinator.api.async_snapshot(subtype=self._stream_type)
+                )
         return None
 
+    async def handle_async_mjpeg_stream(
+        self, request: web.Request
+    ) -> web.StreamResponse | None:
+        """Proxy the camera's MJPEG stream, shared between all viewers."""
+        if not self._attr_is_on:
+            return None
+        return await self._mjpeg_hub.async_handle_request(request)
+
     async def stream_source(self) -> str | None:
         """Return the source of the stream."""
         if self._attr_is_streaming:
-            return str(
-                await self.coordinator.api.async_get_rtsp_url(subtype=self._stream_type)
-            )
+            return await self.coordinator.async_get_stream_source(self._stream_type)
         return None
 
+    @property
+    def _preload_on_motion(self) -> bool:
+        """This stream is selected to be preloaded while there is motion."""
+        return self.coordinator.config_entry.options.get(CONF_PRELOAD_STREAM) == str(
+            int(self._stream_type)
+        )
+
+    @property
+    def _preload_idle_seconds(self) -> int:
+        return int(
+            self.coordinator.config_entry.options.get(
+                CONF_PRELOAD_IDLE_SECONDS, DEFAULT_PRELOAD_IDLE_SECONDS
+            )
+        )
+
+    async def _async_preload_stream(self) -> None:
+        """
+        Start the stream worker ahead of a viewer opening the camera.
+        The HLS output is kept alive while motion lasts and for the idle
+        period after it stops, then the stream component stops the worker.
+        """
+        idle_seconds = self._preload_idle_seconds
+        try:
+            if (stream := await self.async_create_stream()) is None:
+                return
+            stream.add_provider(HLS_PROVIDER, timeout=idle_seconds).idle_timer.awake()
+            await stream.start()
+        except HomeAssistantError as e:
+            _LOGGER.debug("Unable to preload stream for %s: %s", self.entity_id, e)
+
+    async def _async_keep_preload_awake(self, _now: datetime | None = None) -> None:
+        """Restart the idle period of the preloaded HLS output."""
+        if self.stream is not None and (
+            provider := self.stream.outputs().get(HLS_PROVIDER)
+        ):
+            provider.idle_timer.awake()
+
+    @callback
+    def _async_stop_preload_keepalive(self) -> None:
+        if self._cancel_preload_keepalive is not None:
+            self._cancel_preload_keepalive()
+            self._cancel_preload_keepalive = None
+
+    @callback
+    def _async_handle_motion_event(self, event: VideoMotionEvent) -> None:
+        if event.action == EventAction.Stop:
+            if self._cancel_preload_keepalive is not None:
+                self._async_stop_preload_keepalive()
+                # the idle period counts from the end of motion
+                self.coordinator.config_entry.async_create_task(
+                    self.hass,
+                    self._async_keep_preload_awake(),
+                    f"amcrest preload idle {self.entity_id}",
+                )
+            return
+        if not (
+            event.action == EventAction.Start
+            and self._attr_is_streaming
+            and self._preload_on_motion
+        ):
+            return
+        self.coordinator.config_entry.async_create_task(
+            self.hass,
+            self._async_preload_stream(),
+            f"amcrest preload {self.entity_id}",
+        )
+        # The camera sends nothing while motion lasts, so the output is kept
+        # awake until it stops
+        if self._cancel_preload_keepalive is None:
+            self._cancel_preload_keepalive = async_track_time_interval(
+                self.hass,
+                self._async_keep_preload_awake,
+                timedelta(seconds=self._preload_idle_seconds / 2),
+            )
+
     @callback
     def _handle_coordinator_update(self) -> None:
         self._attr_is_on = not self.coordinator.amcrest_data.privacy_mode_on
@@ -6,7 +6,12 @@ import voluptuous as vol
 import yarl
 from amcrest_api.camera import Camera as AmcrestApiCamera
 from amcrest_api.const import StreamType
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import (
     ATTR_SERIAL_NUMBER,
     CONF_HOST,
@@ -18,8 +23,13 @@ from homeassistant.const import (
     CONF_URL,
     CONF_USERNAME,
 )
+from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
@@ -32,7 +42,26 @@ from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 from homeassistant.util import ssl as hass_ssl
 from httpx import HTTPStatusError
 
-from .const import CONF_MDNS, CONF_STREAMS, DOMAIN
+from .const import (
+    CONF_API_METRICS,
+    CONF_BUS_EVENT_CODES,
+    CONF_BUS_EVENT_INTERVAL_SECONDS,
+    CONF_BUS_EVENT_STRIP_FIELDS,
+    CONF_EVENT_INGEST_THREAD,
+    CONF_EVENT_MERGE_MS,
+    CONF_EVENT_MIN_ON_SECONDS,
+    CONF_MDNS,
+    CONF_PRELOAD_IDLE_SECONDS,
+    CONF_PRELOAD_STREAM,
+    CONF_STREAMS,
+    DEFAULT_BUS_EVENT_INTERVAL_SECONDS,
+    DEFAULT_EVENT_MERGE_MS,
+    DEFAULT_EVENT_MIN_ON_SECONDS,
+    DEFAULT_PRELOAD_IDLE_SECONDS,
+    DOMAIN,
+    PRELOAD_STREAM_NONE,
+)
+from .events import KNOWN_EVENT_CODES
 
 if TYPE_CHECKING:
     from amcrest_api.config import Config as AmcrestFixedConfig
@@ -53,6 +82,12 @@ class AmcrestConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._config: dict[str, Any] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Create the options flow."""
+        return AmcrestOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -217,3 +252,149 @@ class AmcrestConfigFlow(ConfigFlow, domain=DOMAIN):
         }
 
         return await self.async_step_user()
+
+
+class AmcrestOptionsFlow(OptionsFlow):
+    """Amcrest options flow."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            user_input[CONF_STREAMS] = [int(x) for x in user_input[CONF_STREAMS]]
+            for key in (
+                CONF_PRELOAD_IDLE_SECONDS,
+                CONF_EVENT_MIN_ON_SECONDS,
+                CONF_EVENT_MERGE_MS,
+                CONF_BUS_EVENT_INTERVAL_SECONDS,
+            ):
+                user_input[key] = int(user_input[key])
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        coordinator = self.config_entry.runtime_data
+        supported_streams = [
+            SelectOptionDict(value=str(k), label=str(v))
+            for k, v in coordinator.fixed_config.supported_streams.items()
+        ]
+        preload_streams = [
+            SelectOptionDict(value=PRELOAD_STREAM_NONE, label="None")
+        ] + supported_streams
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_STREAMS,
+                        default=[str(x) for x in coordinator.selected_streams],
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=supported_streams,
+                            mode=SelectSelectorMode.LIST,
+                            multiple=True,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_PRELOAD_STREAM,
+                        default=options.get(CONF_PRELOAD_STREAM, PRELOAD_STREAM_NONE),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=preload_streams,
+                            mode=SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_PRELOAD_IDLE_SECONDS,
+                        default=options.get(
+                            CONF_PRELOAD_IDLE_SECONDS, DEFAULT_PRELOAD_IDLE_SECONDS
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=10,
+                            max=3600,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="s",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_EVENT_MIN_ON_SECONDS,
+                        default=options.get(
+                            CONF_EVENT_MIN_ON_SECONDS, DEFAULT_EVENT_MIN_ON_SECONDS
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=300,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="s",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_EVENT_MERGE_MS,
+                        default=options.get(
+                            CONF_EVENT_MERGE_MS, DEFAULT_EVENT_MERGE_MS
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=60000,
+                            step=100,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="ms",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_EVENT_INGEST_THREAD,
+                        default=options.get(CONF_EVENT_INGEST_THREAD, False),
+                    ): BooleanSelector(),
+                    vol.Required(
+                        CONF_BUS_EVENT_CODES,
+                        default=options.get(CONF_BUS_EVENT_CODES, []),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[
+                                code
+                                for code in coordinator.fixed_config.supported_events
+                                if code in KNOWN_EVENT_CODES
+                            ],
+                            mode=SelectSelectorMode.LIST,
+                            multiple=True,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_BUS_EVENT_INTERVAL_SECONDS,
+                        default=options.get(
+                            CONF_BUS_EVENT_INTERVAL_SECONDS,
+                            DEFAULT_BUS_EVENT_INTERVAL_SECONDS,
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=3600,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="s",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_BUS_EVENT_STRIP_FIELDS,
+                        default=options.get(CONF_BUS_EVENT_STRIP_FIELDS, []),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[],
+                            mode=SelectSelectorMode.DROPDOWN,
+                            multiple=True,
+                            custom_value=True,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_API_METRICS,
+                        default=options.get(CONF_API_METRICS, False),
+                    ): BooleanSelector(),
+                }
+            ),
+        )
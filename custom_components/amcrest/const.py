@@ -9,6 +9,63 @@ MANUFACTURER: Final = "Amcrest"
 DEFAULT_PORT_HTTP = 80
 CONF_MDNS: Final = "mdns"
 CONF_STREAMS: Final = "streams"
+CONF_PRELOAD_STREAM: Final = "preload_stream"
+CONF_PRELOAD_IDLE_SECONDS: Final = "preload_idle_seconds"
+CONF_EVENT_MIN_ON_SECONDS: Final = "event_min_on_seconds"
+CONF_EVENT_MERGE_MS: Final = "event_merge_ms"
+CONF_EVENT_INGEST_THREAD: Final = "event_ingest_thread"
+CONF_BUS_EVENT_CODES: Final = "bus_event_codes"
+CONF_BUS_EVENT_INTERVAL_SECONDS: Final = "bus_event_interval_seconds"
+CONF_BUS_EVENT_STRIP_FIELDS: Final = "bus_event_strip_fields"
+CONF_API_METRICS: Final = "api_metrics"
+
+PRELOAD_STREAM_NONE: Final = "none"
+DEFAULT_PRELOAD_IDLE_SECONDS: Final = 60
+DEFAULT_EVENT_MIN_ON_SECONDS: Final = 0
+DEFAULT_EVENT_MERGE_MS: Final = 0
+DEFAULT_BUS_EVENT_INTERVAL_SECONDS: Final = 1
+
+EVENT_HEARTBEAT_SECONDS: Final = 10
+EVENT_WATCHDOG_SECONDS: Final = 25
+EVENT_RECONNECT_MIN_SECONDS: Final = 1.0
+EVENT_RECONNECT_MAX_SECONDS: Final = 60.0
+EVENT_QUEUE_SIZE: Final = 64
+EVENT_DRAIN_BATCH_SIZE: Final = 16
+EVENT_SUBSCRIPTION_BUFFER_SIZE: Final = 64
+EVENT_HISTORY_SIZE: Final = 256
+EVENT_DURATION_HISTORY_SIZE: Final = 64
+EVENT_RATE_WINDOW_SECONDS: Final = 60
+EVENT_OUTAGE_HISTORY_SIZE: Final = 16
+POLL_HISTORY_SIZE: Final = 32
+API_ERROR_HISTORY_SIZE: Final = 16
+REQUEST_HISTORY_SIZE: Final = 1024
+TRACE_MAX_EVENTS: Final = 100_000
+LATENCY_BUCKETS_MS: Final = (
+    1,
+    2,
+    5,
+    10,
+    20,
+    50,
+    100,
+    200,
+    500,
+    1000,
+    2000,
+    5000,
+    10000,
+    30000,
+    60000,
+)
+EVENT_SUBSCRIPTION_INTERVAL_SECONDS: Final = 0.1
+
+# Fired on the event bus for the codes an entry opts in to
+EVENT_AMCREST: Final = f"{DOMAIN}_event"
+
+# Dispatcher signals, formatted with the config entry ID
+SIGNAL_COORDINATOR_READY: Final = f"{DOMAIN}_{{}}_ready"
+SIGNAL_CAMERA_EVENT: Final = f"{DOMAIN}_{{}}_event_{{}}"
+SIGNAL_CAMERA_EVENTS: Final = f"{DOMAIN}_{{}}_events"
 
 
 class PtzAxes(StrEnum):
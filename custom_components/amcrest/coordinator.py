@@ -1,22 +1,69 @@
 """Data coordinator for Amcrest integration."""
 
 import asyncio
+import random
 from asyncio import Task
+from collections import Counter
+from collections.abc import Iterable
 from dataclasses import asdict
 from datetime import datetime, timedelta
-from logging import Logger, getLogger
+from http import HTTPStatus
+from logging import DEBUG, WARNING, Logger, getLogger
 from typing import Any
 
-from amcrest_api.camera import Camera as AmcrestApiCamera
 from amcrest_api.config import Config as AmcrestFixedConfig
-from amcrest_api.event import AudioMutationEvent, EventMessageType, VideoMotionEvent
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant, callback
+from amcrest_api.const import ApiEndpoints, StreamType
+from amcrest_api.event import EventAction, EventBase, EventMessageType
+from amcrest_api.ptz import PtzAccuratePosition
+from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+from httpx import HTTPError, HTTPStatusError
 
-from .const import DOMAIN
-from .data import AmcrestData
+from . import tracing
+from .api import AmcrestApi
+from .const import (
+    CONF_EVENT_INGEST_THREAD,
+    CONF_EVENT_MERGE_MS,
+    CONF_EVENT_MIN_ON_SECONDS,
+    CONF_STREAMS,
+    DEFAULT_EVENT_MERGE_MS,
+    DEFAULT_EVENT_MIN_ON_SECONDS,
+    DOMAIN,
+    EVENT_DRAIN_BATCH_SIZE,
+    EVENT_HEARTBEAT_SECONDS,
+    EVENT_QUEUE_SIZE,
+    EVENT_RECONNECT_MAX_SECONDS,
+    EVENT_RECONNECT_MIN_SECONDS,
+    EVENT_WATCHDOG_SECONDS,
+    SIGNAL_CAMERA_EVENT,
+    SIGNAL_CAMERA_EVENTS,
+)
+from .data import (
+    AmcrestData,
+    CacheStats,
+    EventStreamOutage,
+    EventStreamStats,
+    PollCycle,
+    StreamEncodeConfig,
+    event_code,
+    event_region_names,
+    motion_regions_from_response,
+)
+from .events import (
+    FAST_PATH_EVENT_CODES,
+    STATEFUL_EVENT_CODES,
+    EventCallback,
+    EventCoalescer,
+    EventQueue,
+    create_event,
+)
+from .ingest import async_get_event_ingest_worker
+from .stats import EventLatency, EventStats, PollStats
 
 _LOGGER: Logger = getLogger(__package__)
 
@@ -29,14 +76,13 @@ class AmcrestDataCoordinator(DataUpdateCoordinator):
     """Amcrest camera update coordinator."""
 
     _event_listener_task: Task | None = None
-    _should_listen_for_events: bool = False
-    event_listener_filter: set[str] = set()
     amcrest_data: AmcrestData
     fixed_config: AmcrestFixedConfig
-    api: AmcrestApiCamera
+    encode_config: dict[StreamType, StreamEncodeConfig]
+    api: AmcrestApi
     data: dict[str, Any]
 
-    def __init__(self, hass: HomeAssistant, api: AmcrestApiCamera) -> None:
+    def __init__(self, hass: HomeAssistant, api: AmcrestApi) -> None:
         """Initialize coordinator."""
         super().__init__(
             hass,
@@ -47,6 +93,32 @@ class AmcrestDataCoordinator(DataUpdateCoordinator):
         self.api = api
         self.amcrest_data = AmcrestData()
         self.data = asdict(self.amcrest_data)
+        self.encode_config = {}
+        self._stream_sources: dict[StreamType, str] = {}
+        self._stream_sources_key: tuple[str, str, str] | None = None
+        self._event_subscriptions: Counter[str] = Counter()
+        self._enabled_events: dict[str, CALLBACK_TYPE] = {}
+        self._attached_event_codes: frozenset[str] = frozenset()
+        self._reattach_requested = False
+        self._event_listeners: dict[tuple[str, str | None], list[EventCallback]] = {}
+        self.known_event_regions: dict[str, set[str]] = {}
+        self.event_stream_stats = EventStreamStats()
+        self.event_stats = EventStats()
+        self.event_latency = EventLatency()
+        self.camera_clock_offset = timedelta()
+        self._failing_polls: set[str] = set()
+        self.poll_stats = PollStats()
+        self.stream_source_cache = CacheStats()
+        self.event_coalescer = EventCoalescer(hass, self.async_dispatch_event)
+        self.event_queue = EventQueue(EVENT_QUEUE_SIZE)
+        self._event_drain_task: Task | None = None
+        self._event_stream_down_since: float | None = None
+        self._reconnect_attempt = 0
+        self._pending_state_writes: dict[Entity, EventBase | None] = {}
+        self._state_write_handle: asyncio.Handle | None = None
+        self._update_listeners_handle: asyncio.Handle | None = None
+        self.snapshot: bytes | None = None
+        self.snapshot_time: datetime | None = None
 
     def _has_ptz_caps(self) -> bool:
         ptz_caps = self.fixed_config.ptz_capabilities
@@ -65,6 +137,7 @@ class AmcrestDataCoordinator(DataUpdateCoordinator):
         camera_time: datetime = await self.api.async_get_current_time()
         current_time = datetime.now()
 
+        self.camera_clock_offset = camera_time - current_time
         if abs(camera_time - current_time) > timedelta(days=1):
             _LOGGER.warning(
                 "Camera's current time of %s, differs by more than one day from system time.",  # noqa E501
@@ -72,8 +145,87 @@ class AmcrestDataCoordinator(DataUpdateCoordinator):
             )
             _LOGGER.warning("Setting the time on the camera at %s", self.api.url)
             await self.api.async_set_current_time(current_time)
+            self.camera_clock_offset = timedelta()
         return await self.api.async_get_fixed_config()
 
+    async def async_get_encode_config(self) -> dict[StreamType, StreamEncodeConfig]:
+        """Obtain the encode settings of each stream."""
+        # TODO: Move to amcrest-api once it exposes the encode config
+        try:
+            response = await self.api._async_api_request(  # pylint: disable=protected-access
+                ApiEndpoints.CONFIG_MANAGER,
+                params={"action": "getConfig", "name": "Encode"},
+            )
+            return StreamEncodeConfig.create_from_response(response)
+        except (HTTPError, KeyError, ValueError) as e:
+            _LOGGER.debug("Unable to read encode config from %s: %s", self.api.url, e)
+            return {}
+
+    async def async_get_motion_regions(self) -> list[str]:
+        """Obtain the names of the motion detect regions."""
+        # TODO: Move to amcrest-api once it exposes the motion detect config
+        try:
+            response = await self.api._async_api_request(  # pylint: disable=protected-access
+                ApiEndpoints.CONFIG_MANAGER,
+                params={"action": "getConfig", "name": "MotionDetect"},
+            )
+            return motion_regions_from_response(response)
+        except (HTTPError, IndexError, KeyError, ValueError) as e:
+            _LOGGER.debug(
+                "Unable to read motion detect config from %s: %s", self.api.url, e
+            )
+            return []
+
+    async def async_reboot(self) -> None:
+        """Reboot the camera."""
+        # TODO: Move to amcrest-api once it can reboot the camera
+        await self.api._async_api_request(  # pylint: disable=protected-access
+            ApiEndpoints.MAGIC_BOX, params={"action": "reboot"}
+        )
+
+    async def async_take_snapshot(self) -> None:
+        """Take a still from the main stream, kept until the next one."""
+        with tracing.span("snapshot", "snapshot", {"camera": self.api.url.host}):
+            self.snapshot = bytes(await self.api.async_snapshot())
+        self.snapshot_time = dt_util.utcnow()
+        self.async_update_listeners()
+
+    async def async_ptz_home(self) -> None:
+        """Move the PTZ to its home position, zoomed all the way out."""
+        caps = self.fixed_config.ptz_capabilities
+        with tracing.span("ptz home", "ptz", {"camera": self.api.url.host}):
+            await self.api.async_ptz_move_absolute(
+                PtzAccuratePosition(
+                    caps=caps, zoom=caps.zoom_min if caps.zoom else None
+                )
+            )
+        await self.async_request_refresh()
+
+    async def async_get_stream_source(self, stream_type: StreamType) -> str | None:
+        """
+        Get the RTSP URL for a stream.
+
+        The URL only depends on the host and credentials, so it is cached per
+        stream type until either of those change.
+        """
+        key = (
+            str(self.api.url),
+            self.config_entry.data[CONF_USERNAME],
+            self.config_entry.data[CONF_PASSWORD],
+        )
+        if key != self._stream_sources_key:
+            self._stream_sources.clear()
+            self._stream_sources_key = key
+        if (source := self._stream_sources.get(stream_type)) is not None:
+            self.stream_source_cache.hits += 1
+            return source
+        self.stream_source_cache.misses += 1
+        # RTSP may be disabled on the camera, do not cache that
+        if (url := await self.api.async_get_rtsp_url(subtype=stream_type)) is None:
+            return None
+        source = self._stream_sources[stream_type] = str(url)
+        return source
+
     async def async_poll_endpoints(self) -> AmcrestData:
         """Poll the endpoints for entity data."""
 
@@ -107,12 +259,11 @@ class AmcrestDataCoordinator(DataUpdateCoordinator):
             kw_names.append("smart_track_on")
 
         results: list[Any] = await asyncio.gather(*tasks, return_exceptions=True)
+        self._async_log_poll_failures(kw_names, results)
 
-        # Events are special as they come from a push endpoint, append the existing ones
-        kw_names.append("last_video_motion_event")
-        results.append(self.amcrest_data.last_video_motion_event)
-        kw_names.append("last_audio_mutation_event")
-        results.append(self.amcrest_data.last_audio_mutation_event)
+        # Events are special as they come from a push endpoint, keep the existing ones
+        kw_names += ["last_events", "last_region_events"]
+        results += [self.amcrest_data.last_events, self.amcrest_data.last_region_events]
 
         return AmcrestData(
             **dict(
@@ -122,16 +273,148 @@ class AmcrestDataCoordinator(DataUpdateCoordinator):
             )
         )
 
+    @callback
+    def _async_log_poll_failures(self, names: list[str], results: list[Any]) -> None:
+        """Log once when polling an endpoint starts failing, and when it recovers."""
+        for name, result in zip(names, results, strict=False):
+            if isinstance(result, Exception):
+                if name not in self._failing_polls:
+                    self._failing_polls.add(name)
+                    _LOGGER.warning(
+                        "Polling %s from %s failed: %r", name, self.api.url, result
+                    )
+            elif name in self._failing_polls:
+                self._failing_polls.discard(name)
+                _LOGGER.info("Polling %s from %s recovered", name, self.api.url)
+
     async def _async_setup(self) -> None:
-        self.fixed_config = await self.async_get_fixed_config()
+        with tracing.span("fixed config", "setup", {"camera": self.api.url.host}):
+            self.fixed_config = await self.async_get_fixed_config()
+        with tracing.span("encode config", "setup", {"camera": self.api.url.host}):
+            self.encode_config = await self.async_get_encode_config()
+        if EventMessageType.VideoMotion in self.fixed_config.supported_events:
+            with tracing.span("motion regions", "setup", {"camera": self.api.url.host}):
+                # regions added to the camera later are picked up from their events
+                self._async_add_event_regions(
+                    EventMessageType.VideoMotion, await self.async_get_motion_regions()
+                )
 
     async def _async_update_data(self) -> dict[str, Any]:
-        self.amcrest_data = await self.async_poll_endpoints()
+        started_at = dt_util.utcnow()
+        start = self.hass.loop.time()
+        with tracing.span("poll", "poll", {"camera": self.api.url.host}):
+            self.amcrest_data = await self.async_poll_endpoints()
+        self.poll_stats.add(
+            PollCycle(
+                started_at=started_at,
+                seconds=self.hass.loop.time() - start,
+                failed=tuple(sorted(self._failing_polls)),
+            )
+        )
         # restore the listener if it failed unexpectedly
-        if self._should_listen_for_events and not self.is_listening_for_events:
-            self.async_enable_event_listener(self.event_listener_filter)
+        if self._event_subscriptions and not self.is_listening_for_events:
+            self._async_apply_event_filter()
         return asdict(self.amcrest_data)
 
+    @callback
+    def async_subscribe_events(self, codes: Iterable[str]) -> CALLBACK_TYPE:
+        """
+        Subscribe to event codes from the camera.
+        Subscriptions are reference counted, the camera is only asked for
+        codes that at least one subscriber still holds.
+        """
+        codes = frozenset(codes)
+        self._event_subscriptions.update(codes)
+        self._async_apply_event_filter()
+
+        @callback
+        def async_unsubscribe() -> None:
+            self._event_subscriptions.subtract(codes)
+            for code in codes:
+                if self._event_subscriptions[code] <= 0:
+                    del self._event_subscriptions[code]
+            self._async_apply_event_filter()
+
+        return async_unsubscribe
+
+    @callback
+    def _async_apply_event_filter(self) -> None:
+        """Bring the event listener in line with the subscribed codes."""
+        codes = self.event_listener_filter
+        _LOGGER.debug(
+            "Update event listener for { %s } events on device %s (%s)",
+            ", ".join(sorted(codes)),
+            self.fixed_config.machine_name,
+            self.fixed_config.serial_number,
+        )
+        if not codes:
+            self._reattach_requested = False
+            if self._event_listener_task is not None:
+                self._event_listener_task.cancel()
+        elif not self.is_listening_for_events:
+            # The new task attaches with whatever codes are current when it starts
+            self._reattach_requested = True
+            self._event_listener_task = self.config_entry.async_create_background_task(
+                self.hass,
+                self.async_listen_for_camera_events(),
+                f"amcrest {self.data.get(CONF_NAME)}",
+            )
+        elif self._event_listener_task.cancelling() and not self._reattach_requested:
+            # Emptied earlier in this tick, keep the unwinding listener instead
+            self._reattach_requested = True
+        elif not codes <= self._attached_event_codes and not self._reattach_requested:
+            # Reattach with the new codes, removed codes are filtered in-process
+            self._reattach_requested = True
+            self._event_listener_task.cancel()
+        self._async_schedule_update_listeners()
+
+    @callback
+    def _async_schedule_update_listeners(self) -> None:
+        """Notify the listeners once, after every change in this loop tick."""
+        if self._update_listeners_handle is None:
+            self._update_listeners_handle = self.hass.loop.call_soon(
+                self._async_flush_update_listeners
+            )
+
+    @callback
+    def _async_flush_update_listeners(self) -> None:
+        self._update_listeners_handle = None
+        self.async_update_listeners()
+
+    @callback
+    def async_schedule_write_state(
+        self, entity: Entity, event: EventBase | None = None
+    ) -> None:
+        """
+        Write an entity's state once, after every event in this loop tick.
+        Bursts of events then only write the final state of each entity.
+        """
+        self._pending_state_writes[entity] = event
+        if self._state_write_handle is None:
+            self._state_write_handle = self.hass.loop.call_soon(
+                self._async_flush_state_writes
+            )
+
+    @callback
+    def _async_flush_state_writes(self) -> None:
+        self._state_write_handle = None
+        entities, self._pending_state_writes = self._pending_state_writes, {}
+        with tracing.span("write states", "event") as span_args:
+            if span_args is not None:
+                span_args["entities"] = len(entities)
+            for entity in entities:
+                # writes of entities removed since are ignored by Home Assistant
+                entity.async_write_ha_state()
+        # An event written to several entities, as with regions, counts once
+        events = {id(event): event for event in entities.values() if event is not None}
+        for event in events.values():
+            self.async_record_state_write(event)
+
+    @callback
+    def async_record_state_write(self, event: EventBase) -> None:
+        """Record the latency of an event whose state was just written."""
+        self.event_latency.add(event, dt_util.utcnow(), self.camera_clock_offset)
+
     @callback
     def async_enable_event_listener(
         self, add_to_filter: set[EventMessageType] | EventMessageType
@@ -139,24 +422,8 @@ class AmcrestDataCoordinator(DataUpdateCoordinator):
         """Enable the event listener."""
         if isinstance(add_to_filter, EventMessageType):
             add_to_filter = {add_to_filter}
-        self.event_listener_filter |= add_to_filter
-        _LOGGER.debug(
-            "Update event listener for { %s } events on device %s (%s)",
-            ", ".join(self.event_listener_filter),
-            self.fixed_config.machine_name,
-            self.fixed_config.serial_number,
-        )
-        if len(self.event_listener_filter) > 0:
-            if not self.is_listening_for_events:
-                self._event_listener_task = (
-                    self.config_entry.async_create_background_task(
-                        self.hass,
-                        self.async_listen_for_camera_events(),
-                        f"amcrest {self.data.get(CONF_NAME)}",
-                    )
-                )
-                self._should_listen_for_events = True
-            self.async_update_listeners()
+        for code in add_to_filter - self._enabled_events.keys():
+            self._enabled_events[code] = self.async_subscribe_events({code})
 
     @callback
     async def async_disable_event_listener(
@@ -164,57 +431,76 @@ class AmcrestDataCoordinator(DataUpdateCoordinator):
     ) -> None:
         """Disable the event listener."""
         if remove_from_filter is None:
-            self.event_listener_filter.clear()
-        else:
-            if isinstance(remove_from_filter, EventMessageType):
-                remove_from_filter = {remove_from_filter}
-            self.event_listener_filter -= remove_from_filter
+            remove_from_filter = set(self._enabled_events)
+        elif isinstance(remove_from_filter, EventMessageType):
+            remove_from_filter = {remove_from_filter}
+        for code in remove_from_filter & self._enabled_events.keys():
+            self._enabled_events.pop(code)()
+        if not self._event_subscriptions and self._event_listener_task is not None:
+            try:
+                self._event_listener_task.cancel()
+                await self._event_listener_task
+            finally:
+                self._event_listener_task = None
+
+    async def async_listen_for_camera_events(self) -> None:
+        """
+        Supervise the event stream.
+        The stream is reattached when new codes are subscribed, and reconnected
+        with jittered exponential backoff when it fails or heartbeats stop.
+        """
         _LOGGER.debug(
-            "Update event listener for { %s } events on device %s (%s)",
-            ", ".join(self.event_listener_filter),
+            "Starting listener task on device %s (%s)",
             self.fixed_config.machine_name,
             self.fixed_config.serial_number,
         )
-        if len(self.event_listener_filter) == 0:
-            if self._event_listener_task is not None:
-                try:
-                    self._event_listener_task.cancel()
-                    await self._event_listener_task
-                finally:
-                    self._event_listener_task = None
-            self._should_listen_for_events = False
-        self.async_update_listeners()
-
-    async def async_listen_for_camera_events(self) -> None:
-        """Listen for events."""
+        delay = 0.0
         try:
-            _LOGGER.debug(
-                "Starting listener task on device %s (%s)",
-                self.fixed_config.machine_name,
-                self.fixed_config.serial_number,
-            )
-            async for event in self.api.async_listen_events(
-                heartbeat_seconds=30, filter_events=list(self.event_listener_filter)
-            ):
-                _LOGGER.debug(
-                    "Received %s event on %s (%s)",
-                    event,
-                    self.fixed_config.machine_name,
-                    self.fixed_config.serial_number,
-                )
-                if isinstance(event, VideoMotionEvent):
-                    self.amcrest_data.last_video_motion_event = event
-                    self.async_update_listeners()
-                elif isinstance(event, AudioMutationEvent):
-                    self.amcrest_data.last_audio_mutation_event = event
-                    self.async_update_listeners()
-        except Exception as e:
-            _LOGGER.error(
-                "An exception occurred on event listener for device %s (%s): %s",
-                self.fixed_config.machine_name,
-                self.fixed_config.serial_number,
-                e,
-            )
+            while True:
+                try:
+                    if delay:
+                        await asyncio.sleep(delay)
+                        self.event_stream_stats.reconnects += 1
+                    self._reattach_requested = False
+                    self._attached_event_codes = frozenset(self._event_subscriptions)
+                    await self._async_read_event_stream(self._attached_event_codes)
+                    if (task := asyncio.current_task()) and task.cancelling():
+                        # The stream swallowed a pending cancellation
+                        raise asyncio.CancelledError
+                    error = "event stream closed by the camera"
+                except asyncio.CancelledError:
+                    task = asyncio.current_task()
+                    # Only swallow our own cancellation, never a shutdown
+                    if not self._reattach_requested or (
+                        task is not None and task.cancelling() > 1
+                    ):
+                        raise
+                    if task is not None:
+                        task.uncancel()
+                    _LOGGER.debug(
+                        "Reattaching event listener on device %s (%s)",
+                        self.fixed_config.machine_name,
+                        self.fixed_config.serial_number,
+                    )
+                    delay = 0.0
+                    continue
+                except TimeoutError:
+                    self.event_stream_stats.heartbeat_timeouts += 1
+                    error = f"no heartbeat within {EVENT_WATCHDOG_SECONDS} s"
+                except (HTTPError, OSError, ValueError) as e:
+                    error = str(e) or type(e).__name__
+                except Exception as e:
+                    # Only the failure that starts an outage gets a traceback
+                    first = self._event_stream_down_since is None
+                    _LOGGER.log(
+                        WARNING if first else DEBUG,
+                        "Unexpected error in the event stream of %s (%s)",
+                        self.fixed_config.machine_name,
+                        self.fixed_config.serial_number,
+                        exc_info=first,
+                    )
+                    error = str(e) or type(e).__name__
+                delay = self._async_event_stream_lost(error)
         except asyncio.CancelledError:
             _LOGGER.info(
                 "Event listener for device %s (%s) cancelled",
@@ -222,12 +508,260 @@ class AmcrestDataCoordinator(DataUpdateCoordinator):
                 self.fixed_config.serial_number,
             )
         finally:
+            self._reattach_requested = False
+            self.event_stream_stats.connected_since = None
+            if self._event_drain_task is not None:
+                self._event_drain_task.cancel()
+                self._event_drain_task = None
+            self.event_queue.clear()
+            self.event_coalescer.async_reset()
             _LOGGER.debug(
                 "Finished listening for motion events %s (%s)",
                 self.fixed_config.machine_name,
                 self.fixed_config.serial_number,
             )
 
+    @callback
+    def _async_event_stream_lost(self, error: str) -> float:
+        """Record a lost event stream, returning the delay before reconnecting."""
+        stats = self.event_stream_stats
+        if first := self._event_stream_down_since is None:
+            self._event_stream_down_since = self.hass.loop.time()
+            stats.connected_since = None
+            stats.outages.append(
+                EventStreamOutage(lost_at=dt_util.utcnow(), error=error)
+            )
+        elif stats.outages:
+            stats.outages[-1].attempts += 1
+        stats.last_error = error
+        backoff = min(
+            EVENT_RECONNECT_MAX_SECONDS,
+            EVENT_RECONNECT_MIN_SECONDS * 2**self._reconnect_attempt,
+        )
+        self._reconnect_attempt += 1
+        delay = random.uniform(backoff / 2, backoff)
+        # Warn once per outage, the restore is logged at info
+        _LOGGER.log(
+            WARNING if first else DEBUG,
+            "Event stream for device %s (%s) lost: %s, reconnecting in %.1f s",
+            self.fixed_config.machine_name,
+            self.fixed_config.serial_number,
+            error,
+            delay,
+        )
+        return delay
+
+    @callback
+    def _async_event_stream_alive(self) -> bool:
+        """
+        Record a message from the event stream, closing any outage.
+        Return True if the stream was just restored.
+        """
+        self._reconnect_attempt = 0
+        stats = self.event_stream_stats
+        if stats.connected_since is None:
+            stats.connected_since = dt_util.utcnow()
+        if self._event_stream_down_since is None:
+            return False
+        gap = self.hass.loop.time() - self._event_stream_down_since
+        self._event_stream_down_since = None
+        stats.last_gap_seconds = gap
+        if stats.outages:
+            stats.outages[-1].gap_seconds = gap
+        stats.max_gap_seconds = max(stats.max_gap_seconds, gap)
+        stats.total_gap_seconds += gap
+        _LOGGER.info(
+            "Event stream for device %s (%s) restored after %.1f s",
+            self.fixed_config.machine_name,
+            self.fixed_config.serial_number,
+            gap,
+        )
+        return True
+
+    async def async_get_active_events(self, codes: Iterable[str]) -> set[str]:
+        """Query which of the event codes are currently in an alarm state."""
+        codes = list(codes)
+        alarming = await asyncio.gather(
+            *(self._async_is_event_active(code) for code in codes)
+        )
+        return {code for code, active in zip(codes, alarming, strict=True) if active}
+
+    async def _async_is_event_active(self, code: str) -> bool:
+        # TODO: Move to amcrest-api once it exposes getEventIndexes
+        try:
+            response = await self.api._async_api_request(  # pylint: disable=protected-access
+                ApiEndpoints.EVENT_MANAGER,
+                params={"action": "getEventIndexes", "code": code},
+            )
+        except HTTPStatusError as e:
+            # The camera answers Bad Request when no channel is alarming
+            if e.response.status_code != HTTPStatus.BAD_REQUEST:
+                raise
+            return False
+        except ValueError:
+            # Some firmware replies "Error" with a success status instead
+            return False
+        return bool(response.get("channels"))
+
+    async def _async_resync_event_states(self, codes: frozenset[str]) -> None:
+        """Correct event states for transitions missed while disconnected."""
+        codes &= STATEFUL_EVENT_CODES
+        try:
+            active = await self.async_get_active_events(codes)
+        except HTTPError as e:
+            _LOGGER.debug("Unable to resync events from %s: %s", self.api.url, e)
+            return
+        last_events = self.amcrest_data.last_events
+        for code in codes:
+            was_active = (
+                last_event := last_events.get(code)
+            ) is not None and last_event.action == EventAction.Start
+            if (code in active) != was_active:
+                action = EventAction.Start if code in active else EventAction.Stop
+                self._async_queue_event(create_event(code, action))
+
+    async def _async_read_event_stream(self, codes: frozenset[str]) -> None:
+        """Read the camera's event stream attached for the given codes."""
+        loop = asyncio.get_running_loop()
+        if self.config_entry.options.get(CONF_EVENT_INGEST_THREAD, False):
+            events = async_get_event_ingest_worker(self.hass).async_listen_events(
+                self.api,
+                heartbeat_seconds=EVENT_HEARTBEAT_SECONDS,
+                filter_events=sorted(codes),
+            )
+        else:
+            events = self.api.async_listen_events(
+                heartbeat_seconds=EVENT_HEARTBEAT_SECONDS, filter_events=sorted(codes)
+            )
+        async with asyncio.timeout(EVENT_WATCHDOG_SECONDS) as watchdog:
+            async for event in events:
+                watchdog.reschedule(loop.time() + EVENT_WATCHDOG_SECONDS)
+                if self._async_event_stream_alive():
+                    await self._async_resync_event_states(codes)
+                _LOGGER.debug(
+                    "Received %s event on %s (%s)",
+                    event,
+                    self.fixed_config.machine_name,
+                    self.fixed_config.serial_number,
+                )
+                # Codes unsubscribed since attaching are dropped here
+                if (code := event_code(event)) not in self._event_subscriptions:
+                    continue
+                with tracing.span(code, "event") as span_args:
+                    if span_args is not None:
+                        span_args["action"] = event.action
+                    self.event_stats.add(code, event.action, loop.time())
+                    # Triggers and subscribers get every event, before any
+                    # coalescing
+                    entry_id = self.config_entry.entry_id
+                    async_dispatcher_send(
+                        self.hass, SIGNAL_CAMERA_EVENT.format(entry_id, code), event
+                    )
+                    async_dispatcher_send(
+                        self.hass, SIGNAL_CAMERA_EVENTS.format(entry_id), event
+                    )
+                    if code in FAST_PATH_EVENT_CODES:
+                        # Presses are rare and wanted at once, not after a burst
+                        self.async_dispatch_event(event)
+                    else:
+                        self._async_queue_event(event)
+
+    @callback
+    def _async_queue_event(self, event: EventBase) -> None:
+        """
+        Queue an event for handling outside of the stream reader.
+        The reader only queues, so the camera's socket keeps being drained
+        even while Home Assistant is slow to handle events.
+        """
+        self.event_queue.put_nowait(event)
+        if self._event_drain_task is None:
+            self._event_drain_task = self.config_entry.async_create_task(
+                self.hass,
+                self._async_drain_event_queue(),
+                f"amcrest {self.data.get(CONF_NAME)} events",
+                eager_start=False,
+            )
+
+    async def _async_drain_event_queue(self) -> None:
+        """Handle queued events in batches, yielding to the loop in between."""
+        try:
+            while self.event_queue:
+                batch = min(EVENT_DRAIN_BATCH_SIZE, len(self.event_queue))
+                with tracing.span("handle events", "event") as span_args:
+                    if span_args is not None:
+                        span_args["events"] = batch
+                    for _ in range(batch):
+                        self._async_coalesce_event(self.event_queue.get_nowait())
+                await asyncio.sleep(0)
+        finally:
+            self._event_drain_task = None
+
+    @callback
+    def _async_coalesce_event(self, event: EventBase) -> None:
+        options = self.config_entry.options
+        self.event_coalescer.async_process(
+            event,
+            min_on_seconds=options.get(
+                CONF_EVENT_MIN_ON_SECONDS, DEFAULT_EVENT_MIN_ON_SECONDS
+            ),
+            merge_seconds=options.get(CONF_EVENT_MERGE_MS, DEFAULT_EVENT_MERGE_MS)
+            / 1000,
+        )
+
+    @callback
+    def async_add_event_listener(
+        self,
+        code: str,
+        event_callback: EventCallback,
+        *,
+        region: str | None = None,
+    ) -> CALLBACK_TYPE:
+        """
+        Listen for events with a code, optionally only those in a region.
+        Only the listeners of an event's code and regions are called for it.
+        """
+        key = (code, region)
+        self._event_listeners.setdefault(key, []).append(event_callback)
+
+        @callback
+        def async_remove_listener() -> None:
+            listeners = self._event_listeners[key]
+            listeners.remove(event_callback)
+            if not listeners:
+                del self._event_listeners[key]
+
+        return async_remove_listener
+
+    @callback
+    def async_dispatch_event(self, event: EventBase) -> None:
+        """Record an event and pass it to the listeners registered for it."""
+        code = event_code(event)
+        self.amcrest_data.last_events[code] = event
+        for event_callback in tuple(self._event_listeners.get((code, None), ())):
+            event_callback(event)
+        if regions := event_region_names(event):
+            self._async_add_event_regions(code, regions)
+        elif event.action == EventAction.Stop:
+            # A Stop without regions, as synthesized on resync, ends them all
+            regions = tuple(self.known_event_regions.get(code, ()))
+        for region in regions:
+            self.amcrest_data.last_region_events[code, region] = event
+            for event_callback in tuple(self._event_listeners.get((code, region), ())):
+                event_callback(event)
+
+    @callback
+    def _async_add_event_regions(self, code: str, regions: Iterable[str]) -> None:
+        """Record regions of an event code, notifying listeners of new ones."""
+        known = self.known_event_regions.setdefault(code, set())
+        if not known.issuperset(regions):
+            known.update(regions)
+            self._async_schedule_update_listeners()
+
+    @property
+    def event_listener_filter(self) -> set[str]:
+        """Event codes with at least one subscriber."""
+        return set(self._event_subscriptions)
+
     @property
     def is_listening_for_events(self) -> bool:
         """Indicate the listener is active."""
@@ -237,6 +771,35 @@ class AmcrestDataCoordinator(DataUpdateCoordinator):
             and not self._event_listener_task.cancelled()
         )
 
+    @property
+    def is_event_stream_connected(self) -> bool:
+        """Indicate the listener is reading the camera's event stream."""
+        return (
+            self.is_listening_for_events
+            and self.event_stream_stats.connected_since is not None
+        )
+
+    @property
+    def is_event_stream_reconnecting(self) -> bool:
+        """Indicate the listener is backing off after losing the event stream."""
+        return (
+            self.is_listening_for_events and self._event_stream_down_since is not None
+        )
+
+    @property
+    def selected_streams(self) -> list[StreamType]:
+        """Streams selected for the integration, every stream if never chosen."""
+        entry = self.config_entry
+        if (streams := entry.options.get(CONF_STREAMS)) is None and (
+            streams := entry.data.get(CONF_STREAMS)
+        ) is None:
+            return list(self.fixed_config.supported_streams)
+        return [
+            StreamType(stream)
+            for stream in streams
+            if stream in self.fixed_config.supported_streams
+        ]
+
     @property
     def identifiers(self) -> set[tuple[str, str]]:
         """Identifiers for device info."""
@@ -1,18 +1,156 @@
 """Dataclass used by integration."""
 
+import json
+from collections import deque
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Any
 
-from amcrest_api.event import EventAction, VideoMotionEvent
+from amcrest_api.const import StreamType
+from amcrest_api.event import AudioMutationEvent, EventBase, EventMessageType
 from amcrest_api.imaging import VideoDayNight, VideoImageControl
 from amcrest_api.ptz import PtzPresetData, PtzStatusData
 from amcrest_api.storage import StorageDeviceInfo
 
+from .const import EVENT_OUTAGE_HISTORY_SIZE
 
-class AudioMutationEvent:
-    # TODO: Stub until added to amcrest-api
-    action: EventAction = EventAction.Start
-    pass
+
+def event_code(event: EventBase) -> str:
+    """Event code the camera used for an event."""
+    # amcrest-api tags audio mutation events with the AudioAnomaly type
+    if isinstance(event, AudioMutationEvent):
+        return str(EventMessageType.AudioMutation)
+    return str(event.event_type)
+
+
+def event_payload(event: EventBase) -> dict[str, Any]:
+    """The data an event carries, empty if it carries none."""
+    if not event.raw_data:
+        return {}
+    try:
+        data = json.loads(event.raw_data)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def event_region_names(event: EventBase) -> tuple[str, ...]:
+    """Names of the regions, or the IVS rule, an event happened in."""
+    if (region_names := getattr(event, "region_name", None)) is not None:
+        return tuple(region_names)
+    # IVS events carry the name of the rule that triggered them
+    name = event_payload(event).get("Name")
+    return (name,) if isinstance(name, str) and name else ()
+
+
+def event_camera_time(event: EventBase, clock_offset: timedelta) -> datetime | None:
+    """
+    When the camera saw an event, by the clock of this host.
+    Cameras stamp events in local time to the second.
+    """
+    locale_time = event_payload(event).get("LocaleTime")
+    if not isinstance(locale_time, str):
+        return None
+    try:
+        camera_time = datetime.strptime(locale_time, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+    # naive local times, as the offset was measured between
+    return (camera_time - clock_offset).astimezone()
+
+
+def motion_regions_from_response(
+    response: dict[str, Any], channel: int = 1
+) -> list[str]:
+    """Names of the motion detect windows from a MotionDetect config response."""
+    windows = response["MotionDetect"][channel - 1].get("MotionDetectWindow", {})
+    return [name for window in windows.values() if (name := window.get("Name"))]
+
+
+@dataclass(kw_only=True)
+class EventStreamOutage:
+    """A loss of the event stream, until a message is read again."""
+
+    lost_at: datetime
+    error: str
+    attempts: int = 1
+    gap_seconds: float | None = None
+
+
+@dataclass(kw_only=True)
+class EventStreamStats:
+    """Health of the camera's event stream."""
+
+    reconnects: int = 0
+    heartbeat_timeouts: int = 0
+    last_error: str | None = None
+    last_gap_seconds: float | None = None
+    max_gap_seconds: float = 0.0
+    total_gap_seconds: float = 0.0
+    connected_since: datetime | None = None
+    outages: deque[EventStreamOutage] = field(
+        default_factory=lambda: deque(maxlen=EVENT_OUTAGE_HISTORY_SIZE)
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class PollCycle:
+    """A poll of the camera's endpoints."""
+
+    started_at: datetime
+    seconds: float
+    failed: tuple[str, ...] = ()
+
+
+@dataclass
+class CacheStats:
+    """Hits and misses of a cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Share of lookups that hit, None before any."""
+        if not (lookups := self.hits + self.misses):
+            return None
+        return self.hits / lookups
+
+
+@dataclass(frozen=True, kw_only=True)
+class StreamEncodeConfig:
+    """Encode settings of a stream, fixed unless reconfigured on the camera."""
+
+    codec: str
+    fps: float
+    gop: int
+
+    @property
+    def keyframe_interval_seconds(self) -> float | None:
+        """Seconds between keyframes."""
+        if self.fps <= 0 or self.gop <= 0:
+            return None
+        return self.gop / self.fps
+
+    @staticmethod
+    def create_from_response(
+        response: dict[str, Any], channel: int = 1
+    ) -> dict[StreamType, "StreamEncodeConfig"]:
+        """Create from an Encode config response."""
+        encode = response["Encode"][channel - 1]
+        formats = {StreamType.MAIN: encode["MainFormat"][0]} | {
+            StreamType(i + 1): extra
+            for i, extra in encode.get("ExtraFormat", {}).items()
+            if i + 1 in StreamType
+        }
+        return {
+            stream_type: StreamEncodeConfig(
+                codec=fmt["Video"].get("Compression", ""),
+                fps=float(fmt["Video"].get("FPS", 0)),
+                gop=int(fmt["Video"].get("GOP", 0)),
+            )
+            for stream_type, fmt in formats.items()
+        }
 
 
 @dataclass
@@ -20,8 +158,9 @@ class AmcrestData:
     """Represents data from Camera."""
 
     ptz_presets: list[PtzPresetData] = field(default_factory=list)
-    last_video_motion_event: VideoMotionEvent | None = None
-    last_audio_mutation_event: AudioMutationEvent | None = None
+    # the latest event of each code, pushed rather than polled
+    last_events: dict[str, EventBase] = field(default_factory=dict)
+    last_region_events: dict[tuple[str, str], EventBase] = field(default_factory=dict)
     privacy_mode_on: bool | None = None  # doubles as on/off
     smart_track_on: bool | None = None
     lighting: Any | None = None  # LightingConfigData
@@ -0,0 +1,147 @@
+"""Provides device triggers for Amcrest camera events."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from amcrest_api.event import EventAction
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.device_automation.exceptions import (
+    InvalidDeviceAutomationConfig,
+)
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_PLATFORM,
+    CONF_TYPE,
+)
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
+
+from .const import DOMAIN
+from .data import event_payload, event_region_names
+from .events import KNOWN_EVENT_CODES
+from .helpers import (
+    async_get_config_entry_for_device,
+    async_get_coordinator_for_device,
+    async_track_camera_events,
+)
+
+if TYPE_CHECKING:
+    from amcrest_api.event import EventBase
+    from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+    from homeassistant.helpers.typing import ConfigType
+
+CONF_ACTION = "action"
+CONF_REGION = "region"
+
+TRIGGER_ACTIONS = [action.lower() for action in EventAction]
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(KNOWN_EVENT_CODES),
+        vol.Optional(CONF_ACTION): vol.In(TRIGGER_ACTIONS),
+        vol.Optional(CONF_REGION): str,
+    }
+)
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List device triggers for the events the camera supports."""
+    if (coordinator := async_get_coordinator_for_device(hass, device_id)) is None:
+        return []
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: code,
+        }
+        for code in coordinator.fixed_config.supported_events
+        if code in KNOWN_EVENT_CODES
+    ]
+
+
+async def async_get_trigger_capabilities(
+    hass: HomeAssistant, config: ConfigType
+) -> dict[str, vol.Schema]:
+    """List the action and region a trigger can be narrowed to."""
+    regions: list[str] = []
+    if (
+        coordinator := async_get_coordinator_for_device(hass, config[CONF_DEVICE_ID])
+    ) is not None:
+        regions = sorted(coordinator.known_event_regions.get(config[CONF_TYPE], ()))
+    return {
+        "extra_fields": vol.Schema(
+            {
+                vol.Optional(CONF_ACTION): SelectSelector(
+                    SelectSelectorConfig(
+                        options=TRIGGER_ACTIONS,
+                        mode=SelectSelectorMode.DROPDOWN,
+                        translation_key=CONF_ACTION,
+                    )
+                ),
+                vol.Optional(CONF_REGION): SelectSelector(
+                    SelectSelectorConfig(
+                        options=regions,
+                        mode=SelectSelectorMode.DROPDOWN,
+                        custom_value=True,
+                    )
+                ),
+            }
+        )
+    }
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """
+    Attach a trigger, called for every event read from the camera.
+    Events are not coalesced first, so short Start and Stop pairs fire both.
+    """
+    device_id = config[CONF_DEVICE_ID]
+    if (entry := async_get_config_entry_for_device(hass, device_id)) is None:
+        raise InvalidDeviceAutomationConfig(f"Device {device_id} is not an Amcrest")
+    code = config[CONF_TYPE]
+    trigger_action = config.get(CONF_ACTION)
+    trigger_region = config.get(CONF_REGION)
+    job = HassJob(action, f"amcrest {code} device trigger")
+    trigger_data = trigger_info["trigger_data"]
+
+    @callback
+    def async_handle_event(event: EventBase) -> None:
+        event_action = event.action.lower()
+        if trigger_action is not None and event_action != trigger_action:
+            return
+        regions = event_region_names(event)
+        if trigger_region is not None and trigger_region not in regions:
+            return
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    **config,
+                    "description": f"{code} {event_action}",
+                    "event": {
+                        CONF_TYPE: code,
+                        CONF_ACTION: event_action,
+                        "regions": list(regions),
+                        "data": event_payload(event),
+                    },
+                }
+            },
+        )
+
+    return async_track_camera_events(hass, entry, {code}, async_handle_event)
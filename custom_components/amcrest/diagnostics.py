@@ -0,0 +1,108 @@
+"""Diagnostics support for Amcrest cameras."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_URL, CONF_USERNAME
+from homeassistant.util import dt as dt_util
+
+from .data import event_region_names
+
+if TYPE_CHECKING:
+    from amcrest_api.event import EventBase
+    from homeassistant.core import HomeAssistant
+
+    from . import AmcrestConfigEntry
+
+TO_REDACT = {
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_URL,
+    CONF_USERNAME,
+    "serial_number",
+    "session_physical_address",
+    # keys of the camera's network config
+    "DefaultGateway",
+    "DnsServers",
+    "Hostname",
+    "IPAddress",
+    "PhysicalAddress",
+}
+
+
+def _event_as_dict(event: EventBase) -> dict[str, Any]:
+    return {
+        "action": event.action,
+        "regions": event_region_names(event),
+        "received_at": event.received_at,
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: AmcrestConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    amcrest_data = coordinator.amcrest_data
+    stream_stats = coordinator.event_stream_stats
+    poll_stats = coordinator.poll_stats
+    stream_sources = coordinator.stream_source_cache
+    return {
+        "options": dict(entry.options),
+        "fixed_config": async_redact_data(asdict(coordinator.fixed_config), TO_REDACT),
+        "data": asdict(amcrest_data)
+        | {
+            "last_events": {
+                code: _event_as_dict(event)
+                for code, event in amcrest_data.last_events.items()
+            },
+            # regions are keyed by their code and name
+            "last_region_events": {
+                f"{code} {region}": _event_as_dict(event)
+                for (code, region), event in amcrest_data.last_region_events.items()
+            },
+        },
+        "polls": {
+            "median_seconds": poll_stats.median,
+            "worst_seconds": poll_stats.worst,
+            "cycles": [asdict(cycle) for cycle in poll_stats.cycles],
+        },
+        "api_metrics": (
+            metrics.as_dict() if (metrics := coordinator.api.metrics) else None
+        ),
+        "event_stream": {
+            "listening": coordinator.is_listening_for_events,
+            "listener_filter": sorted(coordinator.event_listener_filter),
+            "uptime_seconds": (
+                (dt_util.utcnow() - connected_since).total_seconds()
+                if (connected_since := stream_stats.connected_since) is not None
+                else None
+            ),
+            "reconnects": stream_stats.reconnects,
+            "heartbeat_timeouts": stream_stats.heartbeat_timeouts,
+            "last_error": stream_stats.last_error,
+            "max_gap_seconds": stream_stats.max_gap_seconds,
+            "total_gap_seconds": stream_stats.total_gap_seconds,
+            "outages": [asdict(outage) for outage in stream_stats.outages],
+            "queued_events": len(coordinator.event_queue),
+            "dropped_events": coordinator.event_queue.dropped,
+        },
+        "event_latency": coordinator.event_latency.as_dict(),
+        "camera_clock_offset_seconds": (
+            coordinator.camera_clock_offset.total_seconds()
+        ),
+        "caches": {
+            "stream_sources": {
+                "hits": stream_sources.hits,
+                "misses": stream_sources.misses,
+                "hit_ratio": stream_sources.hit_ratio,
+            },
+        },
+        "snapshot": {
+            "taken_at": coordinator.snapshot_time,
+            "bytes": len(snapshot) if (snapshot := coordinator.snapshot) else None,
+        },
+    }
@@ -0,0 +1,106 @@
+"""Support for Amcrest IP camera event entities."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.components.event import EventDeviceClass, EventEntity
+from homeassistant.core import HomeAssistant, callback
+
+from .data import event_payload, event_region_names
+from .entity import AmcrestEntity
+from .events import EVENT_TYPES
+
+if TYPE_CHECKING:
+    from amcrest_api.event import EventBase
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from . import AmcrestConfigEntry
+    from .coordinator import AmcrestDataCoordinator
+    from .events import AmcrestEventType
+
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_REGIONS = "regions"
+
+
+# pylint: disable=unused-argument
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: AmcrestConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Amcrest event entities."""
+    coordinator = entry.runtime_data
+
+    async_add_entities(
+        AmcrestEventEntity(coordinator, code, event_type)
+        for code, event_type in EVENT_TYPES.items()
+        if not event_type.stateful and code in coordinator.fixed_config.supported_events
+    )
+
+
+class AmcrestEventEntity(AmcrestEntity, EventEntity):
+    """Event entity fired for every event of a code."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: AmcrestDataCoordinator,
+        event_code: str,
+        event_type: AmcrestEventType,
+    ) -> None:
+        """Initialize entity."""
+        super().__init__(coordinator=coordinator)
+        self._event_code = event_code
+        self._event_type = event_type
+        self._attr_unique_id = (
+            f"{coordinator.fixed_config.serial_number}-{event_type.key}"
+        )
+        self._attr_translation_key = event_type.translation_key
+        if isinstance(event_type.device_class, EventDeviceClass):
+            self._attr_device_class = event_type.device_class
+        self._attr_entity_registry_enabled_default = event_type.enabled_default
+        self._attr_event_types = list(event_type.event_types)
+
+    async def async_added_to_hass(self) -> None:
+        """Receive events with this entity's code directly."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_event_listener(
+                self._event_code, self._async_handle_event
+            )
+        )
+        if self._event_type.always_listen:
+            self.async_on_remove(
+                self.coordinator.async_subscribe_events({self._event_code})
+            )
+
+    @property
+    def available(self) -> bool:
+        """Available while the camera is sending this entity's events."""
+        return (
+            super().available
+            and self.coordinator.is_listening_for_events
+            and self._event_code in self.coordinator.event_listener_filter
+        )
+
+    @callback
+    def _async_handle_event(self, event: EventBase) -> None:
+        # Every event is a state of its own, so none are batched
+        if (field := self._event_type.event_type_field) is not None:
+            event_type = str(event_payload(event).get(field, "")).lower()
+        else:
+            event_type = event.action.lower()
+        if event_type not in self._event_type.event_types:
+            _LOGGER.debug("Ignoring %s event of type %s", self._event_code, event_type)
+            return
+        attributes = {}
+        if regions := event_region_names(event):
+            attributes[ATTR_REGIONS] = list(regions)
+        self._trigger_event(event_type, attributes)
+        self.async_write_ha_state()
+        self.coordinator.async_record_state_write(event)
@@ -0,0 +1,346 @@
+"""Event pipeline helpers for Amcrest cameras."""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from amcrest_api.event import (
+    EventAction,
+    EventBase,
+    EventMessageType,
+    parse_event_message,
+)
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.event import EventDeviceClass
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .data import event_code, event_region_names
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+type EventCallback = Callable[[EventBase], None]
+
+# Doorbell codes amcrest-api does not know of
+EVENT_DO_TALK_ACTION = "_DoTalkAction_"
+EVENT_CALL_NO_ANSWERED = "CallNoAnswered"
+
+KNOWN_EVENT_CODES = frozenset(
+    {*EventMessageType, EVENT_DO_TALK_ACTION, EVENT_CALL_NO_ANSWERED}
+)
+_EVENT_RE = re.compile(
+    r"^Code=(\w+);action=(\w+);index=\d+(?:;data=(\{.*\})|;data=null|)\s*$",
+    re.DOTALL,
+)
+_EVENT_ACTIONS = {action.lower(): action for action in EventAction}
+
+
+@dataclass(frozen=True, kw_only=True)
+class AmcrestEventType:
+    """
+    How the events of a code are represented.
+    Stateful codes are on between Start and Stop and become binary sensors,
+    the others become event entities.
+    """
+
+    key: str
+    translation_key: str
+    stateful: bool = True
+    device_class: BinarySensorDeviceClass | EventDeviceClass | None = None
+    enabled_default: bool = False
+    # Created even if the camera does not list the code as supported
+    always_created: bool = False
+    # Listened for while the entity exists, rather than while a switch is on
+    always_listen: bool = True
+    # Events name the regions or rules they happened in, each gets a sensor
+    regions: bool = False
+    # Handled as soon as they are read, skipping the queue and coalescing
+    fast_path: bool = False
+    # Event entity types, taken from this payload field rather than the action
+    event_type_field: str | None = None
+    event_types: tuple[str, ...] = tuple(action.lower() for action in EventAction)
+
+
+EVENT_TYPES: dict[str, AmcrestEventType] = {
+    EventMessageType.VideoMotion: AmcrestEventType(
+        key="motion_sensor",
+        translation_key="motion_detected",
+        device_class=BinarySensorDeviceClass.MOTION,
+        enabled_default=True,
+        always_created=True,
+        always_listen=False,
+        regions=True,
+    ),
+    EventMessageType.AudioMutation: AmcrestEventType(
+        key="audio_mutation_sensor",
+        translation_key="audio_detected",
+        device_class=BinarySensorDeviceClass.SOUND,
+        enabled_default=True,
+        always_created=True,
+        always_listen=False,
+    ),
+    EventMessageType.SmartMotionHuman: AmcrestEventType(
+        key="smart_motion_human",
+        translation_key="human_detected",
+        device_class=BinarySensorDeviceClass.OCCUPANCY,
+    ),
+    EventMessageType.SmartMotionVehicle: AmcrestEventType(
+        key="smart_motion_vehicle",
+        translation_key="vehicle_detected",
+        device_class=BinarySensorDeviceClass.MOTION,
+    ),
+    EventMessageType.CrossRegionDetection: AmcrestEventType(
+        key="cross_region_detection",
+        translation_key="intrusion_detected",
+        device_class=BinarySensorDeviceClass.MOTION,
+        regions=True,
+    ),
+    EventMessageType.VideoBlind: AmcrestEventType(
+        key="video_blind",
+        translation_key="video_blind",
+        device_class=BinarySensorDeviceClass.TAMPER,
+    ),
+    EventMessageType.VideoLoss: AmcrestEventType(
+        key="video_loss",
+        translation_key="video_loss",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+    EventMessageType.AlarmLocal: AmcrestEventType(
+        key="alarm_local",
+        translation_key="alarm_input",
+    ),
+    EventMessageType.StorageNotExist: AmcrestEventType(
+        key="storage_not_exist",
+        translation_key="storage_missing",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+    EventMessageType.StorageFailure: AmcrestEventType(
+        key="storage_failure",
+        translation_key="storage_failure",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+    EventMessageType.StorageLowSpace: AmcrestEventType(
+        key="storage_low_space",
+        translation_key="storage_low_space",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+    EventMessageType.CrossLineDetection: AmcrestEventType(
+        key="cross_line_detection",
+        translation_key="line_crossed",
+        stateful=False,
+    ),
+    EventMessageType.LoginFailure: AmcrestEventType(
+        key="login_failure",
+        translation_key="login_failure",
+        stateful=False,
+    ),
+    EVENT_DO_TALK_ACTION: AmcrestEventType(
+        key="doorbell",
+        translation_key="doorbell",
+        stateful=False,
+        device_class=EventDeviceClass.DOORBELL,
+        enabled_default=True,
+        fast_path=True,
+        event_type_field="Action",
+        event_types=("invite", "answer", "hangup"),
+    ),
+    EVENT_CALL_NO_ANSWERED: AmcrestEventType(
+        key="call_no_answered",
+        translation_key="call_not_answered",
+        stateful=False,
+        device_class=EventDeviceClass.DOORBELL,
+        enabled_default=True,
+        fast_path=True,
+    ),
+}
+
+STATEFUL_EVENT_CODES = frozenset(
+    code for code, event_type in EVENT_TYPES.items() if event_type.stateful
+)
+FAST_PATH_EVENT_CODES = frozenset(
+    code for code, event_type in EVENT_TYPES.items() if event_type.fast_path
+)
+
+
+def parse_event(message: str) -> EventBase:
+    """
+    Parse an event message, including the doorbell codes and Pulse actions.
+    Raise ValueError for messages of other unknown codes.
+    """
+    try:
+        return parse_event_message(message)
+    except ValueError:
+        if (match := _EVENT_RE.match(message)) is None:
+            raise
+    code, action, raw_data = match.groups()
+    if code not in KNOWN_EVENT_CODES or action.lower() not in _EVENT_ACTIONS:
+        raise ValueError(f"Unknown event {code} {action}")
+    # amcrest-api types the code as EventMessageType, though it is only stored
+    return EventBase(code, _EVENT_ACTIONS[action.lower()], raw_data)
+
+
+def create_event(code: str, action: EventAction) -> EventBase:
+    """Create an event as if the camera had sent it."""
+    return parse_event(f"Code={code};action={action};index=0;data={{}}")
+
+
+class EventQueue:
+    """
+    Bounded queue of events waiting to be handled.
+    Putting never blocks. When the queue is full, older events are dropped
+    so that only the latest event of each code is kept.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the queue."""
+        self._maxsize = maxsize
+        self._events: deque[EventBase] = deque()
+        self.dropped = 0
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        """Number of queued events."""
+        return len(self._events)
+
+    def put_nowait(self, event: EventBase) -> None:
+        """Queue an event, compacting the queue if it is full."""
+        if len(self._events) >= self._maxsize:
+            self._compact(event_code(event))
+        self._events.append(event)
+        self.max_depth = max(self.max_depth, len(self._events))
+
+    def _compact(self, incoming_code: str) -> None:
+        # keep the latest event of each code, the incoming one supersedes its code
+        latest: dict[str, EventBase] = {}
+        for event in self._events:
+            latest.pop(code := event_code(event), None)
+            latest[code] = event
+        latest.pop(incoming_code, None)
+        kept = deque(latest.values())
+        if len(kept) >= self._maxsize:
+            kept.popleft()
+        self.dropped += len(self._events) - len(kept)
+        self._events = kept
+
+    def get_nowait(self) -> EventBase:
+        """Take the oldest event, raising IndexError if there is none."""
+        return self._events.popleft()
+
+    def clear(self) -> None:
+        """Drop every queued event."""
+        self._events.clear()
+
+
+@dataclass(kw_only=True)
+class _EventEpisode:
+    """Coalescing state of one event code in one set of regions."""
+
+    on: bool = False
+    on_since: float = 0.0
+    cancel_stop: CALLBACK_TYPE | None = None
+
+
+class EventCoalescer:
+    """
+    Collapse flapping Start/Stop events into episodes, one per code and
+    regions. A Stop is held back for the merge window, and until the minimum
+    on-time has passed. A Start arriving in the meantime cancels the Stop,
+    and repeated Starts or Stops are dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant, forward: EventCallback) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._forward = forward
+        self._episodes: dict[tuple[str, tuple[str, ...]], _EventEpisode] = {}
+        self.forwarded = 0
+        self.merged = 0
+        self.deduplicated = 0
+
+    @callback
+    def async_process(
+        self,
+        event: EventBase,
+        *,
+        min_on_seconds: float = 0.0,
+        merge_seconds: float = 0.0,
+    ) -> None:
+        """Forward an event, or hold it back while the episode may continue."""
+        if event.action not in (EventAction.Start, EventAction.Stop):
+            self._async_forward(event)
+            return
+        code = event_code(event)
+        regions = event_region_names(event)
+        if (
+            event.action == EventAction.Stop
+            and not regions
+            and self._async_end_region_episodes(code)
+        ):
+            # A Stop without regions, as synthesized on resync, ends them all
+            self._async_forward(event)
+            return
+        episode = self._episodes.setdefault((code, regions), _EventEpisode())
+        if event.action == EventAction.Start:
+            if episode.cancel_stop is not None:
+                episode.cancel_stop()
+                episode.cancel_stop = None
+                self.merged += 1
+            elif episode.on:
+                self.deduplicated += 1
+            else:
+                episode.on = True
+                episode.on_since = self._hass.loop.time()
+                self._async_forward(event)
+            return
+
+        if not episode.on or episode.cancel_stop is not None:
+            self.deduplicated += 1
+            return
+        elapsed = self._hass.loop.time() - episode.on_since
+        delay = max(merge_seconds, min_on_seconds - elapsed)
+        if delay <= 0:
+            episode.on = False
+            self._async_forward(event)
+            return
+
+        @callback
+        def async_release_stop(_now: datetime) -> None:
+            episode.cancel_stop = None
+            episode.on = False
+            self._async_forward(event)
+
+        episode.cancel_stop = async_call_later(self._hass, delay, async_release_stop)
+
+    @callback
+    def _async_end_region_episodes(self, code: str) -> bool:
+        """End the episodes of a code with regions, returning if any was on."""
+        ended = [
+            self._episodes.pop(key)
+            for key in list(self._episodes)
+            if key[0] == code and key[1]
+        ]
+        for episode in ended:
+            if episode.cancel_stop is not None:
+                episode.cancel_stop()
+        if not any(episode.on for episode in ended):
+            return False
+        self._episodes.pop((code, ()), None)
+        return True
+
+    @callback
+    def async_reset(self) -> None:
+        """Drop held back events and forget every episode."""
+        for episode in self._episodes.values():
+            if episode.cancel_stop is not None:
+                episode.cancel_stop()
+        self._episodes.clear()
+
+    @callback
+    def _async_forward(self, event: EventBase) -> None:
+        self.forwarded += 1
+        self._forward(event)
@@ -0,0 +1,101 @@
+"""Helpers for following camera events from outside of the entities."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import (
+    DOMAIN,
+    SIGNAL_CAMERA_EVENT,
+    SIGNAL_CAMERA_EVENTS,
+    SIGNAL_COORDINATOR_READY,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from . import AmcrestConfigEntry
+    from .coordinator import AmcrestDataCoordinator
+    from .events import EventCallback
+
+
+@callback
+def async_get_config_entry_for_device(
+    hass: HomeAssistant, device_id: str
+) -> AmcrestConfigEntry | None:
+    """Get the camera's config entry from its device ID."""
+    if (device := dr.async_get(hass).async_get(device_id)) is None:
+        return None
+    for entry_id in device.config_entries:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is not None and entry.domain == DOMAIN:
+            return entry
+    return None
+
+
+@callback
+def async_get_coordinator_for_device(
+    hass: HomeAssistant, device_id: str
+) -> AmcrestDataCoordinator | None:
+    """Get the camera's coordinator from its device ID, if loaded."""
+    entry = async_get_config_entry_for_device(hass, device_id)
+    if entry is None or entry.state is not ConfigEntryState.LOADED:
+        return None
+    return entry.runtime_data
+
+
+@callback
+def async_track_camera_events(
+    hass: HomeAssistant,
+    entry: AmcrestConfigEntry,
+    codes: Iterable[str] | None,
+    event_callback: EventCallback,
+) -> CALLBACK_TYPE:
+    """
+    Call back with every event read from a camera, before any coalescing.
+    The camera is subscribed to the codes, while the entry is loaded and
+    across reloads. Without codes, events already subscribed to are passed.
+    """
+    codes = frozenset(codes) if codes is not None else None
+    unsubscribe: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(coordinator: AmcrestDataCoordinator) -> None:
+        nonlocal unsubscribe
+        # Subscriptions held with an unloaded coordinator went with it
+        unsubscribe = coordinator.async_subscribe_events(codes or ())
+
+    if codes is None:
+        remove_listeners = [
+            async_dispatcher_connect(
+                hass, SIGNAL_CAMERA_EVENTS.format(entry.entry_id), event_callback
+            )
+        ]
+    else:
+        remove_listeners = [
+            async_dispatcher_connect(
+                hass, SIGNAL_CAMERA_EVENT.format(entry.entry_id, code), event_callback
+            )
+            for code in codes
+        ]
+        remove_listeners.append(
+            async_dispatcher_connect(
+                hass, SIGNAL_COORDINATOR_READY.format(entry.entry_id), async_subscribe
+            )
+        )
+        if entry.state is ConfigEntryState.LOADED:
+            async_subscribe(entry.runtime_data)
+
+    @callback
+    def async_untrack() -> None:
+        for remove_listener in remove_listeners:
+            remove_listener()
+        if unsubscribe is not None and entry.state is ConfigEntryState.LOADED:
+            unsubscribe()
+
+    return async_untrack
@@ -0,0 +1,43 @@
+"""Snapshot image for Amcrest camera."""
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import AmcrestConfigEntry
+from .coordinator import AmcrestDataCoordinator
+from .entity import AmcrestEntity
+
+
+# pylint: disable=unused-argument
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: AmcrestConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Amcrest snapshot image."""
+    async_add_entities([AmcrestSnapshotImage(entry.runtime_data)])
+
+
+class AmcrestSnapshotImage(AmcrestEntity, ImageEntity):
+    """The still taken by the snapshot button."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "snapshot"
+    _attr_content_type = "image/jpeg"
+
+    def __init__(self, coordinator: AmcrestDataCoordinator) -> None:
+        """Initialize the image."""
+        super().__init__(coordinator=coordinator)
+        ImageEntity.__init__(self, coordinator.hass)
+        self._attr_unique_id = f"{coordinator.fixed_config.serial_number}-snapshot"
+        self._attr_image_last_updated = coordinator.snapshot_time
+
+    async def async_image(self) -> bytes | None:
+        """Return the latest snapshot."""
+        return self.coordinator.snapshot
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._attr_image_last_updated = self.coordinator.snapshot_time
+        self.async_write_ha_state()
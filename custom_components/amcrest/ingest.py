@@ -0,0 +1,180 @@
+"""Off-loop ingestion of Amcrest camera event streams."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Sequence
+
+    from amcrest_api.event import EventBase
+
+    from .api import AmcrestApi
+
+DATA_EVENT_INGEST_WORKER: HassKey[EventIngestWorker] = HassKey(
+    f"{DOMAIN}_event_ingest_worker"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _StreamClosed:
+    """Marks the end of a stream in a batch."""
+
+    error: Exception | None = None
+
+
+class _EventBatches:
+    """Events handed from the worker thread to the event loop in batches."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._pending: list[EventBase | _StreamClosed] = []
+        self._scheduled = False
+        self._batches: deque[list[EventBase | _StreamClosed]] = deque()
+        self._ready = asyncio.Event()
+
+    def put(self, item: EventBase | _StreamClosed) -> None:
+        """Add an item from the worker thread, waking the loop once per batch."""
+        with self._lock:
+            self._pending.append(item)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        # the loop may be closed, then nobody is listening anymore
+        with contextlib.suppress(RuntimeError):
+            self._loop.call_soon_threadsafe(self._release)
+
+    def _release(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._scheduled = False
+        self._batches.append(batch)
+        self._ready.set()
+
+    async def async_get(self) -> list[EventBase | _StreamClosed]:
+        """Wait for the next batch."""
+        while not self._batches:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._batches.popleft()
+
+
+class EventIngestWorker:
+    """A thread that owns the event streams of every camera."""
+
+    def __init__(self) -> None:
+        """Initialize the worker."""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the worker thread if needed, returning its event loop."""
+        with self._lock:
+            if self._loop is None:
+                started = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(started,),
+                    name="amcrest_event_ingest",
+                    daemon=True,
+                )
+                self._thread.start()
+                started.wait()
+            assert self._loop is not None
+            return self._loop
+
+    def stop(self) -> None:
+        """Stop the worker thread, closing every stream it owns."""
+        with self._lock:
+            if (loop := self._loop) is None or self._thread is None:
+                return
+            loop.call_soon_threadsafe(loop.stop)
+            self._thread.join()
+            self._loop = self._thread = None
+
+    def _run(self, started: threading.Event) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        started.set()
+        try:
+            loop.run_forever()
+        finally:
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+
+    async def async_listen_events(
+        self,
+        api: AmcrestApi,
+        *,
+        heartbeat_seconds: int,
+        filter_events: Sequence[str],
+    ) -> AsyncGenerator[EventBase]:
+        """Listen to a camera's events, read and parsed on the worker thread."""
+        if (worker_loop := self._loop) is None:
+            worker_loop = await asyncio.get_running_loop().run_in_executor(
+                None, self.start
+            )
+        batches = _EventBatches(asyncio.get_running_loop())
+        future = asyncio.run_coroutine_threadsafe(
+            self._async_read_stream(api, heartbeat_seconds, filter_events, batches),
+            worker_loop,
+        )
+        try:
+            while True:
+                for item in await batches.async_get():
+                    if isinstance(item, _StreamClosed):
+                        if item.error is not None:
+                            raise item.error
+                        return
+                    yield item
+        finally:
+            future.cancel()
+
+    async def _async_read_stream(
+        self,
+        api: AmcrestApi,
+        heartbeat_seconds: int,
+        filter_events: Sequence[str],
+        batches: _EventBatches,
+    ) -> None:
+        """Read and parse one camera's stream, runs on the worker thread."""
+        error: Exception | None = None
+        try:
+            async for event in api.async_listen_events(
+                heartbeat_seconds=heartbeat_seconds,
+                filter_events=list(filter_events),
+            ):
+                batches.put(event)
+        except Exception as e:
+            # raised again on the listener's loop, which reports it
+            error = e
+        batches.put(_StreamClosed(error))
+
+
+@callback
+def async_get_event_ingest_worker(hass: HomeAssistant) -> EventIngestWorker:
+    """Get the worker shared by every camera, stopped with Home Assistant."""
+    if (worker := hass.data.get(DATA_EVENT_INGEST_WORKER)) is None:
+        worker = hass.data[DATA_EVENT_INGEST_WORKER] = EventIngestWorker()
+
+        async def async_stop_worker(_event: Event) -> None:
+            await hass.async_add_executor_job(worker.stop)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop_worker)
+    return worker
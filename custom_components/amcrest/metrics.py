@@ -0,0 +1,104 @@
+"""Metrics of the requests made to a camera."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import API_ERROR_HISTORY_SIZE
+from .stats import LatencyHistogram
+
+
+def endpoint_name(endpoint: str, params: dict[str, Any] | None) -> str:
+    """
+    Name of an endpoint and the action asked of it.
+    CGI endpoints serve many actions, and configManager many configs.
+    """
+    name = endpoint.rsplit("/", 1)[-1]
+    if params:
+        if (action := params.get("action")) is not None:
+            name = f"{name} {action}"
+        if (config := params.get("name")) is not None:
+            name = f"{name} {config}"
+    return name
+
+
+class EndpointMetrics:
+    """Latency, bytes and errors of the requests to one endpoint."""
+
+    __slots__ = ("bytes_received", "errors", "last_error", "latency", "requests")
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.last_error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """The metrics, for diagnostics."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class ApiMetrics:
+    """Metrics of every request made to a camera, by endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.recent_errors: deque[dict[str, Any]] = deque(maxlen=API_ERROR_HISTORY_SIZE)
+
+    def _endpoint(self, name: str) -> EndpointMetrics:
+        if (metrics := self.endpoints.get(name)) is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    def add(self, name: str, seconds: float, bytes_received: int) -> None:
+        """Record a successful request."""
+        metrics = self._endpoint(name)
+        metrics.requests += 1
+        metrics.bytes_received += bytes_received
+        metrics.latency.add(seconds)
+        self.requests += 1
+        self.bytes_received += bytes_received
+        self.latency.add(seconds)
+
+    def add_error(self, name: str, seconds: float, error: Exception) -> None:
+        """Record a failed request."""
+        metrics = self._endpoint(name)
+        metrics.requests += 1
+        metrics.errors += 1
+        metrics.last_error = repr(error)
+        metrics.latency.add(seconds)
+        self.requests += 1
+        self.errors += 1
+        self.latency.add(seconds)
+        self.recent_errors.append(
+            {"time": dt_util.utcnow(), "endpoint": name, "error": metrics.last_error}
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """The metrics, for diagnostics."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.as_dict(),
+            "recent_errors": list(self.recent_errors),
+            "endpoints": {
+                name: metrics.as_dict() for name, metrics in self.endpoints.items()
+            },
+        }
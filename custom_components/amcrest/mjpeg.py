@@ -0,0 +1,198 @@
+"""MJPEG stream proxy for Amcrest cameras."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import re
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING
+
+import httpx
+from aiohttp import web
+
+if TYPE_CHECKING:
+    from amcrest_api.camera import Camera as AmcrestApiCamera
+
+_LOGGER = logging.getLogger(__name__)
+
+MJPEG_ENDPOINT = "/cgi-bin/mjpg/video.cgi"
+MJPEG_BOUNDARY = "frameboundary"
+MJPEG_READ_TIMEOUT_SECONDS = 10.0
+
+_CONTENT_LENGTH_RE = re.compile(rb"Content-Length:\s*(\d+)", re.IGNORECASE)
+
+type MjpegFrameSource = Callable[[], AsyncIterator[bytes]]
+
+
+class MultipartParser:
+    """Split a multipart/x-mixed-replace byte stream into its parts."""
+
+    def __init__(self, boundary: str) -> None:
+        """Initialize the parser."""
+        self._boundary = b"--" + boundary.removeprefix("--").encode()
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Consume a chunk, returning any parts it completed."""
+        self._buffer += chunk
+        frames: list[bytes] = []
+        while True:
+            start = self._buffer.find(self._boundary)
+            if start < 0:
+                break
+            header_end = self._buffer.find(b"\r\n\r\n", start)
+            if header_end < 0:
+                break
+            headers = bytes(self._buffer[start:header_end])
+            body_start = header_end + 4
+            if (match := _CONTENT_LENGTH_RE.search(headers)) is not None:
+                body_end = body_start + int(match.group(1))
+                if len(self._buffer) < body_end:
+                    break
+            else:
+                body_end = self._buffer.find(self._boundary, body_start)
+                if body_end < 0:
+                    break
+            frames.append(bytes(self._buffer[body_start:body_end]).rstrip(b"\r\n"))
+            del self._buffer[:body_end]
+        return frames
+
+
+async def async_iter_mjpeg_frames(
+    api: AmcrestApiCamera, *, channel: int = 1, subtype: int = 0
+) -> AsyncIterator[bytes]:
+    """Yield JPEG frames from the camera's native MJPEG stream."""
+    # TODO: Move to amcrest-api once it exposes the MJPEG endpoint
+    async with (
+        api._create_async_client(  # pylint: disable=protected-access
+            timeout=httpx.Timeout(MJPEG_READ_TIMEOUT_SECONDS)
+        ) as client,
+        client.stream(
+            "GET", MJPEG_ENDPOINT, params={"channel": channel, "subtype": subtype}
+        ) as response,
+    ):
+        response.raise_for_status()
+        content_type = response.headers.get("content-type", "")
+        match = re.search(r"boundary=\"?([^\";]+)", content_type)
+        parser = MultipartParser(match.group(1) if match else "myboundary")
+        async for chunk in response.aiter_bytes():
+            for frame in parser.feed(chunk):
+                yield frame
+
+
+class MjpegViewer:
+    """A viewer of a shared MJPEG stream holding at most one pending frame."""
+
+    def __init__(self) -> None:
+        """Initialize the viewer."""
+        self._frame: bytes | None = None
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.frames_sent = 0
+        self.frames_dropped = 0
+
+    def put(self, frame: bytes) -> None:
+        """Offer a frame, replacing any frame the viewer has not consumed."""
+        if self._frame is not None:
+            self.frames_dropped += 1
+        self._frame = frame
+        self._ready.set()
+
+    def close(self) -> None:
+        """Signal the viewer that no more frames will arrive."""
+        self._closed = True
+        self._ready.set()
+
+    async def async_get(self) -> bytes | None:
+        """Wait for the next frame, or None once the stream is closed."""
+        await self._ready.wait()
+        self._ready.clear()
+        frame, self._frame = self._frame, None
+        if frame is None or self._closed:
+            return None
+        self.frames_sent += 1
+        return frame
+
+
+class MjpegStreamHub:
+    """Fan one upstream MJPEG connection out to any number of viewers."""
+
+    def __init__(self, frame_source: MjpegFrameSource, *, name: str) -> None:
+        """Initialize the hub."""
+        self._frame_source = frame_source
+        self._name = name
+        self._viewers: set[MjpegViewer] = set()
+        self._upstream_task: asyncio.Task | None = None
+        self.upstream_connections = 0
+
+    @property
+    def viewer_count(self) -> int:
+        """Number of connected viewers."""
+        return len(self._viewers)
+
+    def add_viewer(self) -> MjpegViewer:
+        """Register a viewer, connecting upstream if it is the first."""
+        viewer = MjpegViewer()
+        self._viewers.add(viewer)
+        if self._upstream_task is None or self._upstream_task.done():
+            self.upstream_connections += 1
+            self._upstream_task = asyncio.create_task(
+                self._async_run_upstream(), name=f"amcrest mjpeg {self._name}"
+            )
+        return viewer
+
+    def remove_viewer(self, viewer: MjpegViewer) -> None:
+        """Unregister a viewer, disconnecting upstream if it was the last."""
+        self._viewers.discard(viewer)
+        viewer.close()
+        if not self._viewers and self._upstream_task is not None:
+            self._upstream_task.cancel()
+            self._upstream_task = None
+
+    async def async_close(self) -> None:
+        """Disconnect upstream and every viewer."""
+        for viewer in list(self._viewers):
+            viewer.close()
+        self._viewers.clear()
+        if (task := self._upstream_task) is not None:
+            self._upstream_task = None
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _async_run_upstream(self) -> None:
+        try:
+            async for frame in self._frame_source():
+                for viewer in self._viewers:
+                    viewer.put(frame)
+        except (httpx.HTTPError, OSError) as e:
+            _LOGGER.warning("MJPEG stream for %s failed: %s", self._name, e)
+        finally:
+            # Viewers cannot outlive the upstream connection, unless they are
+            # already served by the one started after this was cancelled
+            if self._upstream_task is asyncio.current_task():
+                for viewer in self._viewers:
+                    viewer.close()
+                self._viewers.clear()
+
+    async def async_handle_request(self, request: web.Request) -> web.StreamResponse:
+        """Serve the shared stream to one HTTP client."""
+        viewer = self.add_viewer()
+        try:
+            response = web.StreamResponse()
+            response.content_type = (
+                f"multipart/x-mixed-replace;boundary={MJPEG_BOUNDARY}"
+            )
+            await response.prepare(request)
+            while (frame := await viewer.async_get()) is not None:
+                await response.write(
+                    b"--%s\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n"
+                    % (MJPEG_BOUNDARY.encode(), len(frame))
+                    + frame
+                    + b"\r\n"
+                )
+        finally:
+            self.remove_viewer(viewer)
+        return response
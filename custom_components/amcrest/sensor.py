@@ -2,21 +2,27 @@
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
 
+from amcrest_api.event import EventMessageType
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import EntityCategory, UnitOfInformation
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
 
 from . import AmcrestConfigEntry
 from .coordinator import AmcrestDataCoordinator
 from .entity import AmcrestEntity
+from .stats import LATENCY_PERCENTILES
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -24,7 +30,28 @@ class AmcrestSensorEntityDescription(SensorEntityDescription):  # type: ignore
     """Describes the Amcrest sensor entity."""
 
     exists_fn: Callable[[AmcrestDataCoordinator], bool] = lambda _: True
-    value_fn: Callable[[AmcrestDataCoordinator], StateType]
+    value_fn: Callable[[AmcrestDataCoordinator], StateType | datetime]
+    attributes_fn: Callable[[AmcrestDataCoordinator], dict[str, Any]] | None = None
+
+
+def _last_event_time(coordinator: AmcrestDataCoordinator) -> datetime | None:
+    if (last := coordinator.event_stats.last) is None:
+        return None
+    age = coordinator.hass.loop.time() - last
+    return dt_util.utcnow() - timedelta(seconds=age)
+
+
+def _event_latency(coordinator: AmcrestDataCoordinator, percent: int) -> float | None:
+    return coordinator.event_latency.total.percentile(percent)
+
+
+def _event_latency_parts(
+    coordinator: AmcrestDataCoordinator, percent: int
+) -> dict[str, Any]:
+    return {
+        "camera": coordinator.event_latency.camera.percentile(percent),
+        "handling": coordinator.event_latency.handling.percentile(percent),
+    }
 
 
 DESCRIPTIONS: tuple[AmcrestSensorEntityDescription, ...] = (
@@ -93,6 +120,105 @@ DESCRIPTIONS: tuple[AmcrestSensorEntityDescription, ...] = (
             coordinator.amcrest_data.storage_info[0].used_bytes
         ),
     ),
+    AmcrestSensorEntityDescription(
+        key="event_rate",
+        translation_key="event_rate",
+        icon="mdi:pulse",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        native_unit_of_measurement="events/min",
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: sum(
+            coordinator.event_stats.events_per_minute(
+                coordinator.hass.loop.time()
+            ).values()
+        ),
+        attributes_fn=lambda coordinator: coordinator.event_stats.events_per_minute(
+            coordinator.hass.loop.time()
+        ),
+    ),
+    AmcrestSensorEntityDescription(
+        key="motion_duration_median",
+        translation_key="motion_duration_median",
+        icon="mdi:motion-sensor",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=1,
+        exists_fn=lambda coordinator: (
+            EventMessageType.VideoMotion in coordinator.fixed_config.supported_events
+        ),
+        value_fn=lambda coordinator: coordinator.event_stats.median_duration(
+            EventMessageType.VideoMotion
+        ),
+    ),
+    AmcrestSensorEntityDescription(
+        key="last_event",
+        translation_key="last_event",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=_last_event_time,
+    ),
+    AmcrestSensorEntityDescription(
+        key="request_latency_p95",
+        translation_key="request_latency_p95",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        exists_fn=lambda coordinator: coordinator.api.metrics is not None,
+        value_fn=lambda coordinator: coordinator.api.metrics.latency.percentile(95),
+        attributes_fn=lambda coordinator: {
+            name: metrics.latency.percentile(95)
+            for name, metrics in coordinator.api.metrics.endpoints.items()
+        },
+    ),
+    AmcrestSensorEntityDescription(
+        key="request_errors",
+        translation_key="request_errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        exists_fn=lambda coordinator: coordinator.api.metrics is not None,
+        value_fn=lambda coordinator: coordinator.api.metrics.errors,
+        attributes_fn=lambda coordinator: {
+            name: metrics.errors
+            for name, metrics in coordinator.api.metrics.endpoints.items()
+            if metrics.errors
+        },
+    ),
+    AmcrestSensorEntityDescription(
+        key="bytes_received",
+        translation_key="bytes_received",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.MEGABYTES,
+        exists_fn=lambda coordinator: coordinator.api.metrics is not None,
+        value_fn=lambda coordinator: coordinator.api.metrics.bytes_received,
+    ),
+    *(
+        AmcrestSensorEntityDescription(
+            key=f"event_latency_p{percent}",
+            translation_key=f"event_latency_p{percent}",
+            icon="mdi:timer-outline",
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            value_fn=partial(_event_latency, percent=percent),
+            attributes_fn=partial(_event_latency_parts, percent=percent),
+        )
+        for percent in LATENCY_PERCENTILES
+    ),
 )
 
 
@@ -130,6 +256,13 @@ class AmcrestSensor(AmcrestEntity, SensorEntity):
         )
 
     @property
-    def native_value(self) -> StateType:
+    def native_value(self) -> StateType | datetime:
         """Native sensor value."""
         return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Attributes of the sensor, if it has any."""
+        if (attributes_fn := self.entity_description.attributes_fn) is None:
+            return None
+        return attributes_fn(self.coordinator)
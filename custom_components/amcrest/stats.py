@@ -0,0 +1,272 @@
+"""Statistics of the events a camera sends and of its polls."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from amcrest_api.event import EventAction
+
+from .const import (
+    EVENT_DURATION_HISTORY_SIZE,
+    EVENT_HISTORY_SIZE,
+    EVENT_RATE_WINDOW_SECONDS,
+    LATENCY_BUCKETS_MS,
+    POLL_HISTORY_SIZE,
+)
+from .data import event_camera_time
+
+if TYPE_CHECKING:
+    from datetime import datetime, timedelta
+
+    from amcrest_api.event import EventBase
+
+    from .data import PollCycle
+
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+class EventHistory:
+    """
+    Times of recent events, in a fixed-size ring.
+    Times leave the rate window as newer events arrive or the rate is read,
+    oldest first, so neither scans the history.
+    """
+
+    __slots__ = ("_count", "_head", "_in_window", "_times")
+
+    def __init__(self, size: int = EVENT_HISTORY_SIZE) -> None:
+        """Initialize the history."""
+        self._times = array("d", [0.0]) * size
+        self._head = 0
+        self._count = 0
+        self._in_window = 0
+
+    def add(self, now: float) -> None:
+        """Record an event at a monotonic time."""
+        size = len(self._times)
+        self._times[self._head] = now
+        self._head = (self._head + 1) % size
+        self._count = min(self._count + 1, size)
+        self._in_window = min(self._in_window + 1, size)
+        self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        size = len(self._times)
+        oldest = now - EVENT_RATE_WINDOW_SECONDS
+        while (
+            self._in_window
+            and self._times[(self._head - self._in_window) % size] < oldest
+        ):
+            self._in_window -= 1
+
+    def events_per_minute(self, now: float) -> float:
+        """Events in the rate window, per minute, at most the ring's size."""
+        self._expire(now)
+        return self._in_window * 60 / EVENT_RATE_WINDOW_SECONDS
+
+    @property
+    def last(self) -> float | None:
+        """Monotonic time of the latest event."""
+        if not self._count:
+            return None
+        return self._times[self._head - 1]
+
+
+class RunningMedian:
+    """Median of the latest values, kept sorted as they arrive."""
+
+    __slots__ = ("_next", "_ring", "_sorted")
+
+    def __init__(self, size: int = EVENT_DURATION_HISTORY_SIZE) -> None:
+        """Initialize the median."""
+        self._ring = array("d", [0.0]) * size
+        self._sorted: list[float] = []
+        self._next = 0
+
+    def add(self, value: float) -> None:
+        """Add a value, replacing the oldest once full."""
+        if len(self._sorted) == len(self._ring):
+            del self._sorted[bisect_left(self._sorted, self._ring[self._next])]
+        self._ring[self._next] = value
+        self._next = (self._next + 1) % len(self._ring)
+        insort(self._sorted, value)
+
+    @property
+    def median(self) -> float | None:
+        """Median of the values, None without any."""
+        if not (count := len(self._sorted)):
+            return None
+        mid = count // 2
+        if count % 2:
+            return self._sorted[mid]
+        return (self._sorted[mid - 1] + self._sorted[mid]) / 2
+
+
+class EventCodeStats:
+    """Rate and durations of one event code."""
+
+    __slots__ = ("_started_at", "durations", "history")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.history = EventHistory()
+        self.durations = RunningMedian()
+        self._started_at: float | None = None
+
+    def add(self, action: EventAction, now: float) -> None:
+        """Record an event, timing each Start until its Stop."""
+        self.history.add(now)
+        if action == EventAction.Start:
+            if self._started_at is None:
+                self._started_at = now
+        elif action == EventAction.Stop and self._started_at is not None:
+            self.durations.add(now - self._started_at)
+            self._started_at = None
+
+
+class EventStats:
+    """Statistics of every event code a camera sends."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.codes: dict[str, EventCodeStats] = {}
+
+    def add(self, code: str, action: EventAction, now: float) -> None:
+        """Record an event as it is read from the camera."""
+        if (stats := self.codes.get(code)) is None:
+            stats = self.codes[code] = EventCodeStats()
+        stats.add(action, now)
+
+    def events_per_minute(self, now: float) -> dict[str, float]:
+        """Events per minute of each code."""
+        return {
+            code: stats.history.events_per_minute(now)
+            for code, stats in self.codes.items()
+        }
+
+    def median_duration(self, code: str) -> float | None:
+        """Median seconds between a code's Start and Stop events."""
+        if (stats := self.codes.get(code)) is None:
+            return None
+        return stats.durations.median
+
+    @property
+    def last(self) -> float | None:
+        """Monotonic time of the latest event of any code."""
+        return max(
+            (
+                last
+                for stats in self.codes.values()
+                if (last := stats.history.last) is not None
+            ),
+            default=None,
+        )
+
+
+class LatencyHistogram:
+    """
+    Counts of latencies in fixed buckets.
+    Percentiles are read from the counts as the upper bound of the bucket
+    they fall in, so recording and reading take constant time.
+    """
+
+    __slots__ = ("_counts", "count")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        # one more bucket for latencies past the last bound
+        self._counts = array("L", [0]) * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        """Record a latency."""
+        self._counts[bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+        self.count += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Milliseconds the given percent of latencies are within."""
+        if not self.count:
+            return None
+        rank = self.count * percent / 100
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self._counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return LATENCY_BUCKETS_MS[-1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Counts and percentiles, for diagnostics."""
+        return {
+            "count": self.count,
+            "buckets_ms": dict(
+                zip(
+                    [*(str(bound) for bound in LATENCY_BUCKETS_MS), "inf"],
+                    self._counts,
+                    strict=True,
+                )
+            ),
+        } | {
+            f"p{percent}_ms": self.percentile(percent)
+            for percent in LATENCY_PERCENTILES
+        }
+
+
+class EventLatency:
+    """
+    Latency of events on their way to Home Assistant's state machine.
+    The camera stage runs from the time in the event's payload, corrected
+    for the camera's clock offset, to its receipt. The handling stage runs
+    from receipt to the state write the event caused.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the latencies."""
+        self.camera = LatencyHistogram()
+        self.handling = LatencyHistogram()
+        self.total = LatencyHistogram()
+
+    def add(
+        self, event: EventBase, written_at: datetime, clock_offset: timedelta
+    ) -> None:
+        """Record the latencies of an event whose state was just written."""
+        received_at = event.received_at
+        self.handling.add((written_at - received_at).total_seconds())
+        if (camera_time := event_camera_time(event, clock_offset)) is not None:
+            self.camera.add((received_at - camera_time).total_seconds())
+            self.total.add((written_at - camera_time).total_seconds())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Histograms of each stage, for diagnostics."""
+        return {
+            "camera": self.camera.as_dict(),
+            "handling": self.handling.as_dict(),
+            "total": self.total.as_dict(),
+        }
+
+
+class PollStats:
+    """Durations of the latest polls of a camera."""
+
+    def __init__(self, size: int = POLL_HISTORY_SIZE) -> None:
+        """Initialize the statistics."""
+        self.cycles: deque[PollCycle] = deque(maxlen=size)
+        self._durations = RunningMedian(size)
+
+    def add(self, cycle: PollCycle) -> None:
+        """Record a poll once it completes."""
+        self.cycles.append(cycle)
+        self._durations.add(cycle.seconds)
+
+    @property
+    def median(self) -> float | None:
+        """Median seconds of the latest polls."""
+        return self._durations.median
+
+    @property
+    def worst(self) -> float | None:
+        """Longest seconds of the latest polls."""
+        return max((cycle.seconds for cycle in self.cycles), default=None)
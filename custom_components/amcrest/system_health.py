@@ -0,0 +1,69 @@
+"""Provide info to system health."""
+
+from __future__ import annotations
+
+import time
+from statistics import median
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.components import system_health
+
+    from .coordinator import AmcrestDataCoordinator
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """
+    Get info for the info page.
+    Everything is read from what the cameras already recorded, none are asked.
+    """
+    entries = hass.config_entries.async_entries(DOMAIN, include_disabled=False)
+    coordinators: list[AmcrestDataCoordinator] = [
+        entry.runtime_data
+        for entry in entries
+        if entry.state is ConfigEntryState.LOADED
+    ]
+    online = sum(coordinator.last_update_success for coordinator in coordinators)
+    # setup is retried with a growing delay while the camera is unreachable
+    backoff = sum(entry.state is ConfigEntryState.SETUP_RETRY for entry in entries)
+    now = time.monotonic()
+    info: dict[str, Any] = {
+        "cameras_configured": len(entries),
+        "cameras_online": online,
+        "cameras_offline": len(entries) - online - backoff,
+        "cameras_in_backoff": backoff,
+        "event_streams_active": sum(
+            coordinator.is_event_stream_connected for coordinator in coordinators
+        ),
+        "event_streams_reconnecting": sum(
+            coordinator.is_event_stream_reconnecting for coordinator in coordinators
+        ),
+        "requests_per_minute": round(
+            sum(
+                coordinator.api.request_history.events_per_minute(now)
+                for coordinator in coordinators
+            ),
+            1,
+        ),
+    }
+    if durations := [
+        cycle.seconds
+        for coordinator in coordinators
+        for cycle in coordinator.poll_stats.cycles
+    ]:
+        info["poll_time_median"] = f"{median(durations):.2f} s"
+        info["poll_time_worst"] = f"{max(durations):.2f} s"
+    return info
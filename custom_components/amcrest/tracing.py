@@ -0,0 +1,163 @@
+"""Opt-in tracing of the integration's work, in Chrome trace format."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from itertools import count
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+from .const import TRACE_MAX_EVENTS
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Generator
+
+# The active trace, shared by every camera. Module level, so that checking
+# for it is all tracing costs while it is off.
+tracer: Tracer | None = None
+
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+class Tracer:
+    """
+    Spans of work as Chrome trace events, in microseconds since the start.
+    Each asyncio task is a thread of the trace, so concurrent work is laid
+    out side by side, and work done in loop callbacks shares a thread.
+    """
+
+    def __init__(self, max_events: int = TRACE_MAX_EVENTS) -> None:
+        """Initialize the tracer."""
+        self._start = time.perf_counter()
+        self._pid = os.getpid()
+        self._max_events = max_events
+        self._tids: WeakKeyDictionary[asyncio.Task, int] = WeakKeyDictionary()
+        self._next_tid = count(1)
+        self.dropped = 0
+        self.events: list[dict[str, Any]] = []
+        self._add_metadata("process_name", 0, "Amcrest")
+        self._add_metadata("thread_name", 0, "loop callbacks")
+
+    def _now(self) -> float:
+        return (time.perf_counter() - self._start) * 1_000_000
+
+    def _add(self, event: dict[str, Any]) -> None:
+        if len(self.events) >= self._max_events:
+            self.dropped += 1
+            return
+        self.events.append(event)
+
+    def _add_metadata(self, name: str, tid: int, value: str) -> None:
+        self._add(
+            {
+                "name": name,
+                "ph": "M",
+                "pid": self._pid,
+                "tid": tid,
+                "args": {"name": value},
+            }
+        )
+
+    def _tid(self) -> int:
+        if (task := asyncio.current_task()) is None:
+            return 0
+        if (tid := self._tids.get(task)) is None:
+            tid = self._tids[task] = next(self._next_tid)
+            self._add_metadata("thread_name", tid, task.get_name())
+        return tid
+
+    def _add_span(
+        self,
+        name: str,
+        category: str,
+        tid: int,
+        start: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start,
+            "dur": self._now() - start,
+            "pid": self._pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    @contextmanager
+    def span(
+        self, name: str, category: str, args: dict[str, Any] | None = None
+    ) -> Generator[dict[str, Any]]:
+        """Record the work done within, with arguments it may add to."""
+        args = {} if args is None else args
+        tid = self._tid()
+        start = self._now()
+        try:
+            yield args
+        except BaseException as e:
+            args["error"] = repr(e)
+            raise
+        finally:
+            self._add_span(name, category, tid, start, args)
+
+    def http_trace(self) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+        """
+        Trace extension for an httpx request, recording its phases.
+        Time before its first phase was spent waiting for a connection.
+        """
+        tid = self._tid()
+        waiting_since: float | None = self._now()
+        started: dict[str, float] = {}
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal waiting_since
+            phase, _, stage = event_name.rpartition(".")
+            if stage == "started":
+                if waiting_since is not None:
+                    self._add_span("wait for connection", "http", tid, waiting_since)
+                    waiting_since = None
+                started[phase] = self._now()
+            elif (start := started.pop(phase, None)) is not None:
+                args = {"error": repr(info["exception"])} if stage == "failed" else None
+                self._add_span(phase, "http", tid, start, args)
+
+        return trace
+
+    def as_dict(self) -> dict[str, Any]:
+        """The trace, as Chrome's trace viewer reads it."""
+        return {
+            "traceEvents": list(self.events),
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": self.dropped},
+        }
+
+
+def span(
+    name: str, category: str, args: dict[str, Any] | None = None
+) -> AbstractContextManager[dict[str, Any] | None]:
+    """A span of work, recorded only while a trace is active."""
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, category, args)
+
+
+def start() -> Tracer | None:
+    """Start a trace, returning None if one is already active."""
+    global tracer
+    if tracer is not None:
+        return None
+    tracer = Tracer()
+    return tracer
+
+
+def stop() -> Tracer | None:
+    """Stop the active trace, returning it."""
+    global tracer
+    stopped, tracer = tracer, None
+    return stopped
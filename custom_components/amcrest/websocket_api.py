@@ -0,0 +1,173 @@
+"""WebSocket API for following Amcrest camera events live."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import (
+    DOMAIN,
+    EVENT_SUBSCRIPTION_BUFFER_SIZE,
+    EVENT_SUBSCRIPTION_INTERVAL_SECONDS,
+)
+from .data import event_code, event_payload, event_region_names
+from .events import KNOWN_EVENT_CODES
+from .helpers import async_get_config_entry_for_device, async_track_camera_events
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from amcrest_api.event import EventBase
+
+    from . import AmcrestConfigEntry
+
+ATTR_EVENT_CODES = "event_codes"
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Register the WebSocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe_events)
+
+
+class _EventSubscription:
+    """
+    Events sent to one subscriber, in batches at most once an interval.
+    Events arriving faster than the subscriber is sent them are buffered up
+    to a bound, dropping the oldest, so a slow client never backs up the
+    connection until Home Assistant closes it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+    ) -> None:
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._buffer: deque[dict[str, Any]] = deque(
+            maxlen=EVENT_SUBSCRIPTION_BUFFER_SIZE
+        )
+        self._dropped = 0
+        self._send_handle: asyncio.TimerHandle | None = None
+        self._last_send = -EVENT_SUBSCRIPTION_INTERVAL_SECONDS
+
+    @callback
+    def async_add_event(self, device_id: str, event: EventBase) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self._dropped += 1
+        self._buffer.append(
+            {
+                ATTR_DEVICE_ID: device_id,
+                "code": event_code(event),
+                "action": event.action.lower(),
+                "regions": list(event_region_names(event)),
+                "data": event_payload(event),
+                "time": event.received_at.isoformat(),
+            }
+        )
+        if self._send_handle is not None:
+            return
+        loop = self._hass.loop
+        self._send_handle = loop.call_at(
+            max(loop.time(), self._last_send + EVENT_SUBSCRIPTION_INTERVAL_SECONDS),
+            self._async_send,
+        )
+
+    @callback
+    def _async_send(self) -> None:
+        self._send_handle = None
+        self._last_send = self._hass.loop.time()
+        self._connection.send_message(
+            websocket_api.event_message(
+                self._msg_id, {"events": list(self._buffer), "dropped": self._dropped}
+            )
+        )
+        self._buffer.clear()
+        self._dropped = 0
+
+    @callback
+    def async_cancel(self) -> None:
+        if self._send_handle is not None:
+            self._send_handle.cancel()
+            self._send_handle = None
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_events",
+        vol.Optional(ATTR_DEVICE_ID): str,
+        vol.Optional(ATTR_EVENT_CODES): vol.All(
+            cv.ensure_list, [vol.In(KNOWN_EVENT_CODES)]
+        ),
+    }
+)
+@callback
+def websocket_subscribe_events(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """
+    Subscribe to events of a camera, or of every camera.
+    Without event codes, the events the cameras already listen for are sent.
+    """
+    entries: list[AmcrestConfigEntry]
+    if (device_id := msg.get(ATTR_DEVICE_ID)) is not None:
+        if (entry := async_get_config_entry_for_device(hass, device_id)) is None:
+            connection.send_error(
+                msg["id"],
+                websocket_api.ERR_NOT_FOUND,
+                f"Device {device_id} is not an Amcrest",
+            )
+            return
+        entries = [entry]
+    else:
+        entries = [
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+        ]
+
+    subscription = _EventSubscription(hass, connection, msg["id"])
+    device_registry = dr.async_get(hass)
+    untrack = [subscription.async_cancel]
+    for entry in entries:
+        if device_id is None:
+            device = device_registry.async_get_device(
+                identifiers=entry.runtime_data.identifiers
+            )
+            if device is None:
+                continue
+            entry_device_id = device.id
+        else:
+            entry_device_id = device_id
+
+        @callback
+        def async_add_event(event: EventBase, device_id: str = entry_device_id) -> None:
+            subscription.async_add_event(device_id, event)
+
+        untrack.append(
+            async_track_camera_events(
+                hass, entry, msg.get(ATTR_EVENT_CODES), async_add_event
+            )
+        )
+
+    @callback
+    def async_unsubscribe() -> None:
+        for remove in untrack:
+            remove()
+
+    connection.subscriptions[msg["id"]] = async_unsubscribe
+    connection.send_result(msg["id"])
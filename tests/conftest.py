@@ -20,6 +20,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.amcrest.const import CONF_MDNS, DOMAIN
 
 from .const import MOCK_FIXED_CONFIG
+from .utils import FakeEventServer
 
 TEST_IP_ADDRESS: str = "10.0.0.2"
 
@@ -62,6 +63,15 @@ def fixture_mock_discovery_info() -> ZeroconfServiceInfo:
     )
 
 
+@pytest.fixture(name="fake_event_server")
+def fixture_fake_event_server(socket_enabled: Any) -> Generator[FakeEventServer]:
+    """Run a fake camera event server."""
+    server = FakeEventServer()
+    server.start()
+    yield server
+    server.stop()
+
+
 @pytest.fixture(name="mock_config_entry")
 def fixture_mock_config_entry(
     user_input_valid_connection: dict[str, Any],
@@ -14,7 +14,7 @@ from amcrest_api.imaging import (
 )
 from amcrest_api.ptz import PtzCapabilityData, PtzPresetData
 
-from custom_components.amcrest.data import AmcrestData
+from custom_components.amcrest.data import AmcrestData, StreamEncodeConfig
 
 MOCK_FIXED_CONFIG = AmcrestFixedConfig(
     machine_name="AMC_TEST",
@@ -70,3 +70,10 @@ MOCK_DATA_UPDATE = AmcrestData(
         ]
     ],
 )
+
+MOCK_ENCODE_CONFIG = {
+    StreamType.MAIN: StreamEncodeConfig(codec="H.265", fps=20.0, gop=40),
+    StreamType.SUBSTREAM1: StreamEncodeConfig(codec="H.264", fps=15.0, gop=30),
+}
+
+MOCK_MOTION_REGIONS = ["Driveway", "Street"]
@@ -1,15 +1,20 @@
 """Test Binary Sensor Entities."""
 
 import asyncio
+import json
+import logging
+from collections import Counter
 from collections.abc import AsyncGenerator, Callable, Iterable
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 from amcrest_api.event import (
     AudioMutationEvent,
     EventAction,
     EventBase,
+    EventMessageType,
     HeartbeatEvent,
     VideoMotionEvent,
 )
@@ -20,15 +25,34 @@ from homeassistant.components.camera import (
 from homeassistant.components.camera.const import DOMAIN as CAMERA_DOMAIN
 from homeassistant.components.switch import SERVICE_TURN_OFF, SERVICE_TURN_ON
 from homeassistant.components.switch.const import DOMAIN as SWITCH_DOMAIN
-from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
     async_fire_time_changed,
 )
 
+from custom_components.amcrest.const import (
+    CONF_EVENT_MERGE_MS,
+    CONF_EVENT_MIN_ON_SECONDS,
+    DOMAIN,
+    EVENT_QUEUE_SIZE,
+    EVENT_RECONNECT_MAX_SECONDS,
+    EVENT_RECONNECT_MIN_SECONDS,
+    EVENT_WATCHDOG_SECONDS,
+)
 from custom_components.amcrest.coordinator import DEFAULT_UPDATE_INTERVAL
-from custom_components.amcrest.data import AmcrestData
+from custom_components.amcrest.data import (
+    event_region_names,
+    motion_regions_from_response,
+)
+from custom_components.amcrest.events import EventCoalescer, EventQueue, create_event
 
 from .utils import setup_integration
 
@@ -76,6 +100,9 @@ async def mock_error_event_generator(
 
 UUT_MOTION_SENSOR = "binary_sensor.amc_test_motion_detected"
 UUT_AUDIO_SENSOR = "binary_sensor.amc_test_audio_detected"
+UUT_DRIVEWAY_SENSOR = "binary_sensor.amc_test_motion_detected_driveway"
+UUT_STREET_SENSOR = "binary_sensor.amc_test_motion_detected_street"
+UUT_GARAGE_SENSOR = "binary_sensor.amc_test_motion_detected_garage"
 UUT_CAMERA = "camera.amc_test_main_stream"
 UUT_MOTION_ENABLE_SWITCH = "switch.amc_test_enable_motion_detection"
 UUT_AUDIO_ENABLE_SWITCH = "switch.amc_test_enable_audio_detection"
@@ -144,6 +171,7 @@ async def test_event_detection(
     disable_event_args: tuple[str, str],
     enable_entity_id: str,
     sensor_entity_id: str,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test binary sensor for motion detection."""
 
@@ -155,8 +183,10 @@ async def test_event_detection(
     TICK = 5.0
     # precondition, unknown state
     assert hass.states.is_state(sensor_entity_id, STATE_UNKNOWN)
-    coordinator.api.async_listen_events = _make_mock_event_generator(
-        mock_events, interval=TICK
+    monkeypatch.setattr(
+        coordinator.api,
+        "async_listen_events",
+        _make_mock_event_generator(mock_events, interval=TICK),
     )
     await hass.services.async_call(
         enable_event_args[0],
@@ -235,13 +265,13 @@ async def test_restore_event_detection(
     enable_event_args: tuple[str, str],
     enable_entity_id: str,
     sensor_entity_id: str,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """
     Test event detection restoration.
 
-    On an error, the listener will go down until the next polling operation.
-    At that point, if the coordinator observes that the loop failed without
-    an explicit shutdown, it will be restored.
+    On an error, the supervisor reconnects after a short backoff instead of
+    waiting for the next polling operation, and records the gap.
     """
 
     entry = await setup_integration(hass, mock_config_entry)
@@ -252,7 +282,12 @@ async def test_restore_event_detection(
     # precondition, unknown state
     assert hass.states.is_state(sensor_entity_id, STATE_UNKNOWN)
 
-    coordinator.api.async_listen_events = mock_error_event_generator
+    monkeypatch.setattr(
+        coordinator.api, "async_listen_events", mock_error_event_generator
+    )
+    monkeypatch.setattr(
+        coordinator, "async_get_active_events", AsyncMock(return_value=set())
+    )
 
     await hass.services.async_call(
         enable_event_args[0],
@@ -265,27 +300,667 @@ async def test_restore_event_detection(
     assert coordinator.is_listening_for_events
     assert hass.states.is_state(sensor_entity_id, STATE_OFF)
 
-    # advance time, expect the exception to be raised, and the sensor to be unavailable
+    # advance time, expect the exception to be raised and a reconnect scheduled
     TICK = 5.0
+    monkeypatch.setattr(
+        coordinator.api,
+        "async_listen_events",
+        _make_mock_event_generator(
+            [],
+            interval=TICK,
+        ),
+    )
     freezer.tick(TICK + 0.01)
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
+    assert coordinator.is_listening_for_events
+    assert coordinator.event_stream_stats.reconnects == 0
+    assert coordinator.event_stream_stats.last_error is not None
+    assert hass.states.is_state(sensor_entity_id, STATE_OFF)
+
+    # reconnected well before the next poll
+    freezer.tick(EVENT_RECONNECT_MIN_SECONDS + 0.01)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.is_listening_for_events
+    assert coordinator.event_stream_stats.reconnects == 1
+    gap = coordinator.event_stream_stats.last_gap_seconds
+    assert gap is not None
+    # the loop clock is not exact to the microsecond
+    assert 0 < gap < EVENT_RECONNECT_MIN_SECONDS + 0.02
+    assert hass.states.is_state(sensor_entity_id, STATE_OFF)
+
+
+async def test_event_heartbeat_watchdog(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a stream that stops sending heartbeats is reconnected."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+
+    connections = 0
+
+    async def mock_silent_event_generator(
+        **kwargs: Any,
+    ) -> AsyncGenerator[EventBase | None]:
+        nonlocal connections
+        connections += 1
+        yield HeartbeatEvent()
+        await asyncio.sleep(3600.0)
+
+    monkeypatch.setattr(
+        coordinator.api, "async_listen_events", mock_silent_event_generator
+    )
+    monkeypatch.setattr(
+        coordinator, "async_get_active_events", AsyncMock(return_value=set())
+    )
+    unsub = coordinator.async_subscribe_events({"VideoMotion"})
+    await hass.async_block_till_done()
+    assert connections == 1
+
+    freezer.tick(EVENT_WATCHDOG_SECONDS + 0.01)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.event_stream_stats.heartbeat_timeouts == 1
+
+    freezer.tick(EVENT_RECONNECT_MIN_SECONDS + 0.01)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert connections == 2
+    assert coordinator.event_stream_stats.reconnects == 1
+    assert coordinator.is_listening_for_events
+
+    unsub()
+    await hass.async_block_till_done()
     assert not coordinator.is_listening_for_events
-    coordinator.async_update_listeners()  # type: ignore
-    assert hass.states.is_state(sensor_entity_id, STATE_UNKNOWN)
 
-    coordinator.api.async_listen_events = _make_mock_event_generator(
-        [],
-        interval=TICK,
+
+@pytest.mark.parametrize(
+    ("error", "unexpected"),
+    [(httpx.ConnectError("refused"), False), (RuntimeError("refused"), True)],
+    ids=["expected", "unexpected"],
+)
+async def test_event_stream_error(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    caplog: pytest.LogCaptureFixture,
+    error: Exception,
+    unexpected: bool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a failed stream is reconnected, warning only of unexpected errors."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+
+    async def mock_failing_event_generator(
+        **kwargs: Any,
+    ) -> AsyncGenerator[EventBase | None]:
+        yield HeartbeatEvent()
+        raise error
+
+    monkeypatch.setattr(
+        coordinator.api, "async_listen_events", mock_failing_event_generator
     )
-    with patch(
-        "custom_components.amcrest.coordinator.AmcrestDataCoordinator.async_poll_endpoints",
-        new_callable=AsyncMock,
-        return_value=AmcrestData(),
-    ):
-        freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    unsub = coordinator.async_subscribe_events({"VideoMotion"})
+    await hass.async_block_till_done()
+    assert coordinator.event_stream_stats.last_error == "refused"
+    assert ("Unexpected error in the event stream" in caplog.text) is unexpected
+
+    unsub()
+    await hass.async_block_till_done()
+
+
+async def test_event_stream_outage_logging(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    caplog: pytest.LogCaptureFixture,
+    freezer: FrozenDateTimeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test an outage warns once, however many attempts it takes to restore."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+    failed_attempts = 4
+    attempts = 0
+
+    async def mock_flaky_event_generator(
+        **kwargs: Any,
+    ) -> AsyncGenerator[EventBase | None]:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            yield HeartbeatEvent()
+        if attempts <= failed_attempts:
+            raise RuntimeError("refused")
+        while True:
+            yield HeartbeatEvent()
+            await asyncio.sleep(30.0)
+
+    monkeypatch.setattr(
+        coordinator.api, "async_listen_events", mock_flaky_event_generator
+    )
+    unsub = coordinator.async_subscribe_events({"VideoMotion"})
+    await hass.async_block_till_done()
+    while attempts <= failed_attempts:
+        freezer.tick(EVENT_RECONNECT_MAX_SECONDS)
         async_fire_time_changed(hass)
         await hass.async_block_till_done()
+    assert coordinator.is_event_stream_connected
+
+    warnings = [
+        record
+        for record in caplog.records
+        if record.name == "custom_components.amcrest"
+        and record.levelno >= logging.WARNING
+    ]
+    assert [record.exc_info is not None for record in warnings] == [True, False]
+    assert "lost: refused" in warnings[1].getMessage()
+    assert caplog.text.count("Unexpected error in the event stream") == failed_attempts
+    assert caplog.text.count("restored after") == 1
+
+    unsub()
+    await hass.async_block_till_done()
 
+
+@pytest.mark.parametrize("active", [False, True], ids=["Stop missed", "Still on"])
+async def test_resync_after_reconnect(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+    active: bool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test motion state is queried after a reconnect."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+
+    async def mock_dropped_event_generator(
+        **kwargs: Any,
+    ) -> AsyncGenerator[EventBase | None]:
+        yield HeartbeatEvent()
+        yield VideoMotionEvent(action=EventAction.Start, raw_data="{}")
+        await asyncio.sleep(1.0)
+        raise builtins.TimeoutError()
+
+    monkeypatch.setattr(
+        coordinator.api, "async_listen_events", mock_dropped_event_generator
+    )
+    get_active_events = AsyncMock(return_value={"VideoMotion"} if active else set())
+    monkeypatch.setattr(coordinator, "async_get_active_events", get_active_events)
+    await hass.services.async_call(
+        CAMERA_DOMAIN,
+        SERVICE_ENABLE_MOTION,
+        target={ATTR_ENTITY_ID: UUT_CAMERA},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert hass.states.is_state(UUT_MOTION_SENSOR, STATE_ON)
+
+    # the stop event is lost along with the connection
+    monkeypatch.setattr(
+        coordinator.api, "async_listen_events", _make_mock_event_generator([])
+    )
+    freezer.tick(1.01)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    get_active_events.assert_not_awaited()
+
+    freezer.tick(EVENT_RECONNECT_MIN_SECONDS + 0.01)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    get_active_events.assert_awaited_once()
+    assert hass.states.is_state(UUT_MOTION_SENSOR, STATE_ON if active else STATE_OFF)
+
+
+async def test_get_active_events(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test parsing the camera's current alarm state."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+
+    def mock_api_request(endpoint: str, *, params: dict[str, Any]) -> Any:
+        if params["code"] == "VideoMotion":
+            return {"channels": {0: "0"}}
+        if params["code"] == "AudioMutation":
+            raise ValueError("Error")
+        request = httpx.Request("GET", endpoint)
+        raise httpx.HTTPStatusError(
+            "Bad Request",
+            request=request,
+            response=httpx.Response(400, request=request),
+        )
+
+    with patch.object(
+        coordinator.api, "_async_api_request", AsyncMock(side_effect=mock_api_request)
+    ):
+        assert await coordinator.async_get_active_events(
+            ["VideoMotion", "AudioMutation", "CrossLineDetection"]
+        ) == {"VideoMotion"}
+
+    # the codes are queried together, not one round trip after another
+    in_flight: set[str] = set()
+    all_sent = asyncio.Event()
+
+    async def mock_slow_api_request(endpoint: str, *, params: dict[str, Any]) -> Any:
+        in_flight.add(params["code"])
+        if len(in_flight) == 3:
+            all_sent.set()
+        async with asyncio.timeout(1.0):
+            await all_sent.wait()
+        return {"channels": {0: "0"}}
+
+    with patch.object(
+        coordinator.api,
+        "_async_api_request",
+        AsyncMock(side_effect=mock_slow_api_request),
+    ):
+        assert await coordinator.async_get_active_events(
+            ["VideoMotion", "AudioMutation", "CrossLineDetection"]
+        ) == {"VideoMotion", "AudioMutation", "CrossLineDetection"}
+
+
+async def test_event_subscription_refcount(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test subscriptions share one stream and only reattach to add codes."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+
+    attached: list[list[str]] = []
+
+    async def mock_listen_events(
+        **kwargs: Any,
+    ) -> AsyncGenerator[EventBase | None]:
+        attached.append(kwargs["filter_events"])
+        while True:
+            await asyncio.sleep(30.0)
+            yield HeartbeatEvent()
+
+    monkeypatch.setattr(coordinator.api, "async_listen_events", mock_listen_events)
+
+    unsub_motion_1 = coordinator.async_subscribe_events({"VideoMotion"})
+    unsub_motion_2 = coordinator.async_subscribe_events({"VideoMotion"})
+    await hass.async_block_till_done()
+    assert attached == [["VideoMotion"]]
+
+    # adding a code reattaches the same listener with both codes
+    task = coordinator._event_listener_task
+    unsub_audio = coordinator.async_subscribe_events({"AudioMutation"})
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+    assert attached == [["VideoMotion"], ["AudioMutation", "VideoMotion"]]
+    assert coordinator._event_listener_task is task
     assert coordinator.is_listening_for_events
-    assert hass.states.is_state(sensor_entity_id, STATE_OFF)
+
+    # removing codes is filtered in-process without reattaching
+    unsub_motion_1()
+    assert coordinator.event_listener_filter == {"VideoMotion", "AudioMutation"}
+    unsub_motion_2()
+    await hass.async_block_till_done()
+    assert coordinator.event_listener_filter == {"AudioMutation"}
+    assert len(attached) == 2
+    assert coordinator.is_listening_for_events
+
+    unsub_audio()
+    await hass.async_block_till_done()
+    assert coordinator.event_listener_filter == set()
+    assert not coordinator.is_listening_for_events
+
+
+@pytest.mark.parametrize("codes", [{"VideoMotion"}, {"AudioMutation"}])
+async def test_event_resubscribe_same_tick(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+    codes: set[str],
+) -> None:
+    """Test subscribing again before the emptied listener unwinds keeps it."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+
+    attached: list[list[str]] = []
+
+    async def mock_listen_events(
+        **kwargs: Any,
+    ) -> AsyncGenerator[EventBase | None]:
+        attached.append(kwargs["filter_events"])
+        while True:
+            await asyncio.sleep(30.0)
+            yield HeartbeatEvent()
+
+    monkeypatch.setattr(coordinator.api, "async_listen_events", mock_listen_events)
+
+    unsub = coordinator.async_subscribe_events({"VideoMotion"})
+    await hass.async_block_till_done()
+    task = coordinator._event_listener_task
+
+    # as when options are applied, or a websocket client resubscribes
+    unsub()
+    unsub = coordinator.async_subscribe_events(codes)
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+    assert coordinator._event_listener_task is task
+    assert coordinator.is_listening_for_events
+    assert attached == [["VideoMotion"], sorted(codes)]
+
+    unsub()
+    await hass.async_block_till_done()
+    assert not coordinator.is_listening_for_events
+
+
+async def test_event_dispatch_fanout(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test an event calls only its listeners, however many the device has."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+    event = VideoMotionEvent(action=EventAction.Start, raw_data='{"RegionName":["0"]}')
+    rounds = 100
+
+    calls: Counter[str] = Counter()
+    for entity_count in (1, 10, 30, 100):
+        calls.clear()
+        removers = [
+            coordinator.async_add_event_listener(
+                "VideoMotion", lambda _event: calls.update(["subscribed"]), region="0"
+            )
+        ] + [
+            # the rest of an NVR's entities, listening on other channels
+            coordinator.async_add_event_listener(
+                "VideoMotion", lambda _event: calls.update(["other"]), region=str(i)
+            )
+            for i in range(1, entity_count)
+        ]
+        for _ in range(rounds):
+            coordinator.async_dispatch_event(event)
+        # the number of calls does not grow with the entities on the device
+        assert calls == {"subscribed": rounds}
+        for remove in removers:
+            remove()
+
+
+async def test_event_coalescing(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test flapping motion is collapsed into one episode."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_entry.data,
+        options={CONF_EVENT_MIN_ON_SECONDS: 10, CONF_EVENT_MERGE_MS: 2000},
+    )
+    entry = await setup_integration(hass, config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+    monkeypatch.setattr(
+        coordinator.api, "async_listen_events", _make_mock_event_generator([])
+    )
+    coordinator.async_subscribe_events({"VideoMotion"})
+    await hass.async_block_till_done()
+
+    states: list[str] = []
+
+    @callback
+    def async_record_state(event: Event[EventStateChangedData]) -> None:
+        if event.data["entity_id"] == UUT_MOTION_SENSOR:
+            states.append(event.data["new_state"].state)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, async_record_state)
+
+    def motion(action: EventAction) -> VideoMotionEvent:
+        return VideoMotionEvent(action=action, raw_data="{}")
+
+    # wind: Start/Stop pairs a second apart, with a repeated Start
+    for _ in range(5):
+        coordinator._async_coalesce_event(motion(EventAction.Start))
+        coordinator._async_coalesce_event(motion(EventAction.Start))
+        freezer.tick(0.5)
+        coordinator._async_coalesce_event(motion(EventAction.Stop))
+        freezer.tick(0.5)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert states == [STATE_ON]
+
+    # the episode ends once the merge window passes without a new Start
+    freezer.tick(10.0)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert states == [STATE_ON, STATE_OFF]
+
+    coalescer = coordinator.event_coalescer
+    assert coalescer.forwarded == 2
+    assert coalescer.merged == 4
+    assert coalescer.deduplicated == 5
+
+
+async def test_event_coalescing_regions(hass: HomeAssistant) -> None:
+    """Test overlapping regions are episodes of their own."""
+    forwarded: list[EventBase] = []
+    coalescer = EventCoalescer(hass, forwarded.append)
+
+    def motion(action: EventAction, region: str) -> VideoMotionEvent:
+        return VideoMotionEvent(
+            action=action, raw_data=json.dumps({"RegionName": [region]})
+        )
+
+    events = [
+        motion(EventAction.Start, "Driveway"),
+        motion(EventAction.Start, "Street"),
+        motion(EventAction.Stop, "Driveway"),
+        motion(EventAction.Stop, "Street"),
+    ]
+    for event in events:
+        coalescer.async_process(event)
+    assert forwarded == events
+    assert coalescer.deduplicated == 0
+
+    # a Stop without regions, as on resync, ends every region's episode
+    forwarded.clear()
+    coalescer.async_process(motion(EventAction.Start, "Driveway"))
+    coalescer.async_process(create_event("VideoMotion", EventAction.Stop))
+    coalescer.async_process(motion(EventAction.Start, "Driveway"))
+    assert [event.action for event in forwarded] == [
+        EventAction.Start,
+        EventAction.Stop,
+        EventAction.Start,
+    ]
+
+
+def test_event_queue_overflow() -> None:
+    """Test a full queue keeps the latest event of each code."""
+    queue = EventQueue(4)
+    motion_start = VideoMotionEvent(action=EventAction.Start, raw_data="{}")
+    motion_stop = VideoMotionEvent(action=EventAction.Stop, raw_data="{}")
+    audio_start = AudioMutationEvent(action=EventAction.Start, raw_data="null")
+    for event in (motion_start, audio_start, motion_stop, motion_start):
+        queue.put_nowait(event)
+    assert queue.dropped == 0
+
+    queue.put_nowait(motion_stop)
+    assert len(queue) == 2
+    assert queue.dropped == 3
+    assert queue.max_depth == 4
+    assert queue.get_nowait() is audio_start
+    assert queue.get_nowait() is motion_stop
+    with pytest.raises(IndexError):
+        queue.get_nowait()
+
+
+async def test_event_burst(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the reader outpacing the handler drops stale events only."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+    handled: list[EventBase] = []
+    coordinator.async_add_event_listener("VideoMotion", handled.append)
+
+    async def mock_burst_event_generator(
+        **kwargs: Any,
+    ) -> AsyncGenerator[EventBase | None]:
+        yield HeartbeatEvent()
+        for i in range(200):
+            action = EventAction.Start if i % 2 == 0 else EventAction.Stop
+            yield VideoMotionEvent(action=action, raw_data="{}")
+        await asyncio.sleep(3600.0)
+
+    monkeypatch.setattr(
+        coordinator.api, "async_listen_events", mock_burst_event_generator
+    )
+    coordinator.async_subscribe_events({"VideoMotion"})
+    await hass.async_block_till_done()
+
+    queue = coordinator.event_queue
+    assert queue.max_depth == EVENT_QUEUE_SIZE
+    assert queue.dropped > 0
+    assert len(queue) == 0
+    assert len(handled) < 200
+    assert handled[-1].action == EventAction.Stop
+    assert hass.states.is_state(UUT_MOTION_SENSOR, STATE_OFF)
+
+
+async def test_state_writes_batched_per_tick(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test events within one loop tick write each entity's final state once."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+    monkeypatch.setattr(
+        coordinator.api, "async_listen_events", _make_mock_event_generator([])
+    )
+    coordinator.async_subscribe_events({"VideoMotion"})
+    await hass.async_block_till_done()
+    handled: list[EventAction] = []
+    coordinator.async_add_event_listener(
+        "VideoMotion", lambda event: handled.append(event.action)
+    )
+    states: list[str] = []
+
+    @callback
+    def async_record_state(event: Event[EventStateChangedData]) -> None:
+        if event.data["entity_id"] == UUT_MOTION_SENSOR:
+            states.append(event.data["new_state"].state)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, async_record_state)
+
+    actions = [EventAction.Start, EventAction.Stop, EventAction.Start]
+    for action in actions:
+        coordinator.async_dispatch_event(VideoMotionEvent(action=action, raw_data="{}"))
+    # listeners see every event in order, the sensor only its final state
+    assert handled == actions
+    await hass.async_block_till_done()
+    assert states == [STATE_ON]
+
+    coordinator.async_dispatch_event(
+        VideoMotionEvent(action=EventAction.Stop, raw_data="{}")
+    )
+    await hass.async_block_till_done()
+    assert states == [STATE_ON, STATE_OFF]
+
+
+async def test_region_sensors(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test motion is reported per region, for known and new regions."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+    monkeypatch.setattr(
+        coordinator.api, "async_listen_events", _make_mock_event_generator([])
+    )
+    await hass.services.async_call(
+        CAMERA_DOMAIN,
+        SERVICE_ENABLE_MOTION,
+        target={ATTR_ENTITY_ID: UUT_CAMERA},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    # regions from the motion detect config
+    assert hass.states.is_state(UUT_DRIVEWAY_SENSOR, STATE_OFF)
+    assert hass.states.is_state(UUT_STREET_SENSOR, STATE_OFF)
+    assert hass.states.get(UUT_GARAGE_SENSOR) is None
+
+    def motion(action: EventAction, *regions: str) -> VideoMotionEvent:
+        return VideoMotionEvent(
+            action=action, raw_data=json.dumps({"RegionName": list(regions)})
+        )
+
+    coordinator.async_dispatch_event(motion(EventAction.Start, "Driveway"))
+    await hass.async_block_till_done()
+    assert hass.states.is_state(UUT_MOTION_SENSOR, STATE_ON)
+    assert hass.states.is_state(UUT_DRIVEWAY_SENSOR, STATE_ON)
+    assert hass.states.is_state(UUT_STREET_SENSOR, STATE_OFF)
+
+    # a region added on the camera since the last poll
+    coordinator.async_dispatch_event(motion(EventAction.Start, "Garage"))
+    await hass.async_block_till_done()
+    assert hass.states.is_state(UUT_GARAGE_SENSOR, STATE_ON)
+
+    coordinator.async_dispatch_event(motion(EventAction.Stop, "Driveway"))
+    await hass.async_block_till_done()
+    assert hass.states.is_state(UUT_DRIVEWAY_SENSOR, STATE_OFF)
+    assert hass.states.is_state(UUT_GARAGE_SENSOR, STATE_ON)
+
+    # a Stop without regions, as synthesized on resync, ends every region
+    coordinator.async_dispatch_event(motion(EventAction.Stop))
+    await hass.async_block_till_done()
+    assert hass.states.is_state(UUT_GARAGE_SENSOR, STATE_OFF)
+
+
+def test_event_region_names() -> None:
+    """Test region and rule names are read from event payloads."""
+    assert event_region_names(
+        VideoMotionEvent(action=EventAction.Start, raw_data='{"RegionName":["A"]}')
+    ) == ("A",)
+    assert (
+        event_region_names(
+            create_event(EventMessageType.CrossRegionDetection, EventAction.Start)
+        )
+        == ()
+    )
+    assert event_region_names(
+        EventBase(
+            EventMessageType.CrossRegionDetection,
+            EventAction.Start,
+            '{"Name":"Fence","Object":{}}',
+        )
+    ) == ("Fence",)
+    assert motion_regions_from_response(
+        {
+            "MotionDetect": {
+                0: {
+                    "Enable": "true",
+                    "MotionDetectWindow": {
+                        0: {"Id": "0", "Name": "Driveway"},
+                        1: {"Id": "1", "Name": ""},
+                    },
+                }
+            }
+        }
+    ) == ["Driveway"]
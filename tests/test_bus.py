@@ -0,0 +1,77 @@
+"""Test event bus publication."""
+
+from amcrest_api.event import EventMessageType
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from custom_components.amcrest.const import (
+    CONF_BUS_EVENT_CODES,
+    CONF_BUS_EVENT_INTERVAL_SECONDS,
+    CONF_BUS_EVENT_STRIP_FIELDS,
+    EVENT_AMCREST,
+    SIGNAL_CAMERA_EVENT,
+)
+from custom_components.amcrest.events import parse_event
+
+from .utils import setup_integration
+
+
+def _motion(action: str) -> str:
+    return (
+        f"Code=VideoMotion;action={action};index=0;"
+        'data={"Id":[0],"RegionName":["Driveway"]}'
+    )
+
+
+async def test_bus_events(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test opted in codes are fired, limited and stripped."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        options={
+            CONF_BUS_EVENT_CODES: [EventMessageType.VideoMotion],
+            CONF_BUS_EVENT_INTERVAL_SECONDS: 60,
+            CONF_BUS_EVENT_STRIP_FIELDS: ["Id"],
+        },
+    )
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator = entry.runtime_data
+    # the camera is asked for the opted in codes
+    assert coordinator.event_listener_filter == {EventMessageType.VideoMotion}
+    fired = async_capture_events(hass, EVENT_AMCREST)
+
+    motion = SIGNAL_CAMERA_EVENT.format(entry.entry_id, EventMessageType.VideoMotion)
+    for action in ("Start", "Start", "Stop"):
+        async_dispatcher_send(hass, motion, parse_event(_motion(action)))
+    # codes not opted in are not followed
+    async_dispatcher_send(
+        hass,
+        SIGNAL_CAMERA_EVENT.format(entry.entry_id, EventMessageType.AudioMutation),
+        parse_event("Code=AudioMutation;action=Start;index=0"),
+    )
+    await hass.async_block_till_done()
+
+    # the repeated Start is within the interval, the Stop is a change
+    assert [event.data["action"] for event in fired] == ["start", "stop"]
+    assert fired[0].data["code"] == EventMessageType.VideoMotion
+    assert fired[0].data["data"] == {"RegionName": ["Driveway"]}
+    assert fired[0].data["device_id"] is not None
+
+    # opting out stops following the codes at once
+    hass.config_entries.async_update_entry(entry, options={})
+    await hass.async_block_till_done()
+    assert coordinator.event_listener_filter == set()
+    async_dispatcher_send(hass, motion, parse_event(_motion("Start")))
+    await hass.async_block_till_done()
+    assert len(fired) == 2
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,122 @@
+"""Test Button entities."""
+
+import dataclasses
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
+
+from amcrest_api.const import ApiEndpoints
+from amcrest_api.ptz import PtzCapabilityData, PtzStatusData
+from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN
+from homeassistant.components.button import SERVICE_PRESS
+from homeassistant.const import ATTR_ENTITY_ID, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.amcrest.data import AmcrestData
+
+from .const import MOCK_DATA_UPDATE, MOCK_FIXED_CONFIG
+from .utils import setup_integration
+
+if TYPE_CHECKING:
+    from custom_components.amcrest.coordinator import AmcrestDataCoordinator
+
+MOCK_PTZ_FIXED_CONFIG = dataclasses.replace(
+    MOCK_FIXED_CONFIG,
+    ptz_capabilities=PtzCapabilityData(
+        pan=True, tilt=True, zoom=True, preset=True, zoom_max=4.0
+    ),
+)
+
+MOCK_PTZ_STATUS = PtzStatusData(
+    action=None,
+    move_status="Idle",
+    zoom_status="Idle",
+    position_pan=90.0,
+    position_tilt=10.0,
+    position_zoom=2.0,
+    pts=None,
+    utc=None,
+)
+
+
+async def _async_press(hass: HomeAssistant, entity_id: str) -> None:
+    await hass.services.async_call(
+        BUTTON_DOMAIN,
+        SERVICE_PRESS,
+        target={ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+
+async def test_reboot(hass: HomeAssistant, mock_config_entry: MockConfigEntry) -> None:
+    """Test rebooting the camera."""
+    entry = await setup_integration(hass, mock_config_entry)
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+
+    with patch.object(
+        coordinator.api, "_async_api_request", new_callable=AsyncMock
+    ) as mock_request:
+        await _async_press(hass, "button.amc_test_restart")
+    mock_request.assert_awaited_once_with(
+        ApiEndpoints.MAGIC_BOX, params={"action": "reboot"}
+    )
+
+
+async def test_snapshot(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test taking a snapshot updates the snapshot image."""
+    entry = await setup_integration(hass, mock_config_entry)
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+    assert hass.states.is_state("image.amc_test_snapshot", STATE_UNKNOWN)
+
+    with patch.object(
+        coordinator.api,
+        "async_snapshot",
+        new_callable=AsyncMock,
+        return_value=b"\xff\xd8jpeg",
+    ):
+        await _async_press(hass, "button.amc_test_take_snapshot")
+
+    assert coordinator.snapshot == b"\xff\xd8jpeg"
+    assert coordinator.snapshot_time is not None
+    assert hass.states.is_state(
+        "image.amc_test_snapshot", coordinator.snapshot_time.isoformat()
+    )
+
+
+async def test_ptz_home(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test moving the PTZ home, zoomed out."""
+    entry = await setup_integration(
+        hass,
+        mock_config_entry,
+        fixed_config=MOCK_PTZ_FIXED_CONFIG,
+        data=dataclasses.replace(MOCK_DATA_UPDATE, ptz_status=MOCK_PTZ_STATUS),
+    )
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+
+    with (
+        patch.object(
+            coordinator.api, "async_ptz_move_absolute", new_callable=AsyncMock
+        ) as mock_move,
+        patch.object(
+            coordinator,
+            "async_poll_endpoints",
+            new_callable=AsyncMock,
+            return_value=AmcrestData(ptz_status=MOCK_PTZ_STATUS),
+        ),
+    ):
+        await _async_press(hass, "button.amc_test_ptz_home")
+    query = mock_move.await_args.args[0].get_query_dict()
+    assert (query["arg1"], query["arg2"], query["arg3"]) == (0, 0, -1.0)
+
+
+async def test_no_ptz_home(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test there is no home button without pan or tilt."""
+    await setup_integration(hass, mock_config_entry)
+    assert hass.states.get("button.amc_test_ptz_home") is None
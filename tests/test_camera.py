@@ -1,18 +1,50 @@
 """Test the camera entity."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from amcrest_api.const import StreamType
-from homeassistant.components.camera import async_get_image, async_get_stream_source
+from amcrest_api.event import EventAction, VideoMotionEvent
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.camera import (
+    async_get_image,
+    async_get_stream_source,
+    get_camera_from_entity_id,
+)
 from homeassistant.components.camera.const import DOMAIN as CAMERA_DOMAIN
-from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_OFF, SERVICE_TURN_ON
+from homeassistant.components.stream import (
+    CONF_EXTRA_PART_WAIT_TIME,
+    CONF_RTSP_TRANSPORT,
+    CONF_USE_WALLCLOCK_AS_TIMESTAMPS,
+)
+from homeassistant.components.stream.core import IdleTimer
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONF_PASSWORD,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
 
 from custom_components.amcrest.camera import AmcrestCameraEntity
+from custom_components.amcrest.const import (
+    CONF_PRELOAD_IDLE_SECONDS,
+    CONF_PRELOAD_STREAM,
+    CONF_STREAMS,
+    DOMAIN,
+)
 from custom_components.amcrest.coordinator import AmcrestDataCoordinator
+from custom_components.amcrest.data import StreamEncodeConfig
+from custom_components.amcrest.mjpeg import MjpegStreamHub, MultipartParser
 
 from .utils import setup_integration
 
@@ -89,3 +121,345 @@ async def test_get_stream_and_image(
         mock_capture.assert_called_with(subtype=StreamType.MAIN)
         await async_get_image(hass, sub_stream_1.entity_id)
         mock_capture.assert_called_with(subtype=StreamType.SUBSTREAM1)
+
+
+def _fake_mjpeg_payload(frames: list[bytes], boundary: str = "myboundary") -> bytes:
+    """Build a multipart body as the camera's MJPEG CGI would send it."""
+    return b"".join(
+        b"--%s\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n%s\r\n"
+        % (boundary.encode(), len(frame), frame)
+        for frame in frames
+    )
+
+
+def test_mjpeg_frame_parser() -> None:
+    """Test frames are recovered regardless of how the stream is chunked."""
+    frames = [b"\xff\xd8frame%d\xff\xd9" % i for i in range(10)]
+    payload = _fake_mjpeg_payload(frames)
+    parser = MultipartParser("myboundary")
+    parsed: list[bytes] = []
+    for i in range(0, len(payload), 7):
+        parsed.extend(parser.feed(payload[i : i + 7]))
+    assert parsed == frames
+
+
+async def test_mjpeg_fan_out_load() -> None:
+    """Test 20 viewers share one upstream connection and slow viewers drop frames."""
+    n_frames = 50
+    frames = [b"\xff\xd8frame%d\xff\xd9" % i for i in range(n_frames)]
+    payload = _fake_mjpeg_payload(frames)
+    upstream_opened = 0
+    all_sent = asyncio.Event()
+
+    async def fake_source() -> AsyncIterator[bytes]:
+        nonlocal upstream_opened
+        upstream_opened += 1
+        parser = MultipartParser("myboundary")
+        for i in range(0, len(payload), 64):
+            for frame in parser.feed(payload[i : i + 64]):
+                yield frame
+            await asyncio.sleep(0)
+        all_sent.set()
+        await asyncio.Event().wait()  # keep the connection open
+
+    hub = MjpegStreamHub(fake_source, name="test")
+    viewers = [hub.add_viewer() for _ in range(20)]
+    received: list[list[bytes]] = [[] for _ in viewers]
+
+    async def consume(index: int, delay: float) -> None:
+        while (frame := await viewers[index].async_get()) is not None:
+            received[index].append(frame)
+            if frame == frames[-1]:
+                return
+            await asyncio.sleep(delay)
+
+    consumers = [
+        asyncio.create_task(consume(i, 0.05 if i == 0 else 0)) for i in range(20)
+    ]
+    await asyncio.wait_for(all_sent.wait(), timeout=5)
+    await asyncio.wait_for(asyncio.gather(*consumers), timeout=5)
+
+    assert upstream_opened == 1
+    assert hub.upstream_connections == 1
+    assert hub.viewer_count == 20
+    # fast viewers see every frame, in order
+    for frames_received in received[1:]:
+        assert frames_received == frames
+    # the slow viewer never blocks the others, it skips to the latest frame
+    assert received[0][-1] == frames[-1]
+    assert viewers[0].frames_dropped > 0
+    assert len(received[0]) + viewers[0].frames_dropped == n_frames
+
+    for viewer in viewers:
+        hub.remove_viewer(viewer)
+    assert hub.viewer_count == 0
+    await hub.async_close()
+
+
+async def test_mjpeg_viewer_rejoins() -> None:
+    """Test a viewer joining as the last one leaves keeps the new upstream."""
+
+    async def fake_source() -> AsyncIterator[bytes]:
+        yield b"\xff\xd8frame\xff\xd9"
+        await asyncio.Event().wait()  # keep the connection open
+
+    hub = MjpegStreamHub(fake_source, name="test")
+    first = hub.add_viewer()
+    assert await asyncio.wait_for(first.async_get(), timeout=5) is not None
+    hub.remove_viewer(first)
+    # the cancelled upstream has not unwound yet
+    viewer = hub.add_viewer()
+    assert await asyncio.wait_for(viewer.async_get(), timeout=5) is not None
+    assert hub.viewer_count == 1
+    assert hub.upstream_connections == 2
+    await hub.async_close()
+    assert await viewer.async_get() is None
+
+
+async def test_mjpeg_stream_proxy(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    cameras_and_coordinator: tuple[
+        er.RegistryEntry,
+        er.RegistryEntry,
+        AmcrestDataCoordinator,
+    ],
+) -> None:
+    """Test the camera proxy serves the native MJPEG stream."""
+    main_stream, _, _ = cameras_and_coordinator
+    frame = b"\xff\xd8frame\xff\xd9"
+
+    async def fake_frames(*args: Any, **kwargs: Any) -> AsyncIterator[bytes]:
+        while True:
+            yield frame
+            await asyncio.sleep(0.01)
+
+    client = await hass_client()
+    with patch("custom_components.amcrest.camera.async_iter_mjpeg_frames", fake_frames):
+        response = await client.get(f"/api/camera_proxy_stream/{main_stream.entity_id}")
+        assert response.status == 200
+        assert response.content_type == "multipart/x-mixed-replace"
+        body = await response.content.readuntil(b"\xff\xd9")
+        assert body.endswith(frame)
+        response.close()
+
+
+async def test_stream_source_cached(
+    hass: HomeAssistant,
+    cameras_and_coordinator: tuple[
+        er.RegistryEntry,
+        er.RegistryEntry,
+        AmcrestDataCoordinator,
+    ],
+) -> None:
+    """Test the RTSP URL is only requested again after the credentials change."""
+    main_stream, sub_stream_1, coordinator = cameras_and_coordinator
+    with patch.object(
+        coordinator.api,
+        "async_get_rtsp_url",
+        new_callable=AsyncMock,
+        return_value="rtsp://10.0.0.1:554/stream",
+    ) as mock_capture:
+        for _ in range(3):
+            await coordinator.async_get_stream_source(StreamType.MAIN)
+            await coordinator.async_get_stream_source(StreamType.SUBSTREAM1)
+        assert mock_capture.call_count == 2
+
+        entry = coordinator.config_entry
+        assert entry is not None
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_PASSWORD: "NEWPASS"}
+        )
+        await coordinator.async_get_stream_source(StreamType.MAIN)
+        assert mock_capture.call_count == 3
+        await coordinator.async_get_stream_source(StreamType.MAIN)
+        assert mock_capture.call_count == 3
+
+        # RTSP disabled on the camera is not cached
+        mock_capture.return_value = None
+        await coordinator.async_get_stream_source(StreamType.SUBSTREAM2)
+        await coordinator.async_get_stream_source(StreamType.SUBSTREAM2)
+        assert mock_capture.call_count == 5
+
+
+async def test_preload_stream_on_motion(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the selected stream is preloaded when motion starts."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_entry.data,
+        options={
+            CONF_PRELOAD_STREAM: str(StreamType.SUBSTREAM1),
+            CONF_PRELOAD_IDLE_SECONDS: 45,
+        },
+    )
+    entry = await setup_integration(hass, config_entry)
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+
+    mock_stream = MagicMock(start=AsyncMock())
+    with patch.object(
+        AmcrestCameraEntity,
+        "async_create_stream",
+        new_callable=AsyncMock,
+        return_value=mock_stream,
+    ) as mock_create_stream:
+        coordinator.async_dispatch_event(
+            VideoMotionEvent(action=EventAction.Start, raw_data="{}")
+        )
+        await hass.async_block_till_done()
+
+        # only the selected stream is preloaded
+        mock_create_stream.assert_awaited_once()
+        mock_stream.add_provider.assert_called_once_with("hls", timeout=45)
+        mock_stream.add_provider.return_value.idle_timer.awake.assert_called_once()
+        mock_stream.start.assert_awaited_once()
+
+        # an update without a new event does not extend the preload
+        coordinator.async_update_listeners()
+        await hass.async_block_till_done()
+        mock_create_stream.assert_awaited_once()
+
+        # the stop event does not preload again
+        coordinator.async_dispatch_event(
+            VideoMotionEvent(action=EventAction.Stop, raw_data="{}")
+        )
+        await hass.async_block_till_done()
+        mock_create_stream.assert_awaited_once()
+
+        # the next start of motion restarts the idle period
+        coordinator.async_dispatch_event(
+            VideoMotionEvent(action=EventAction.Start, raw_data="{}")
+        )
+        await hass.async_block_till_done()
+        assert mock_stream.add_provider.return_value.idle_timer.awake.call_count == 2
+
+
+async def test_preload_stream_outlasts_idle_period(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the preload lasts while motion does and idles out after it stops."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_entry.data,
+        options={
+            CONF_PRELOAD_STREAM: str(StreamType.SUBSTREAM1),
+            CONF_PRELOAD_IDLE_SECONDS: 30,
+        },
+    )
+    entry = await setup_integration(hass, config_entry)
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+
+    idle_callback = AsyncMock()
+    provider = MagicMock(idle_timer=IdleTimer(hass, 30, idle_callback))
+    mock_stream = MagicMock(start=AsyncMock())
+    mock_stream.add_provider.return_value = provider
+    mock_stream.outputs.return_value = {"hls": provider}
+
+    async def create_stream(camera: AmcrestCameraEntity) -> MagicMock:
+        camera.stream = mock_stream
+        return mock_stream
+
+    async def advance(seconds: float) -> None:
+        for _ in range(int(seconds)):
+            freezer.tick(1)
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+
+    with patch.object(
+        AmcrestCameraEntity,
+        "async_create_stream",
+        autospec=True,
+        side_effect=create_stream,
+    ):
+        coordinator.async_dispatch_event(
+            VideoMotionEvent(action=EventAction.Start, raw_data="{}")
+        )
+        await hass.async_block_till_done()
+
+        # motion lasting longer than the idle period keeps the stream
+        await advance(90)
+        idle_callback.assert_not_called()
+
+        coordinator.async_dispatch_event(
+            VideoMotionEvent(action=EventAction.Stop, raw_data="{}")
+        )
+        await hass.async_block_till_done()
+        await advance(29)
+        idle_callback.assert_not_called()
+        await advance(2)
+        idle_callback.assert_awaited_once()
+
+
+def test_encode_config_from_response() -> None:
+    """Test parsing the encode config of each stream."""
+    video = {"Compression": "H.264", "FPS": "15", "GOP": "30"}
+    response = {
+        "Encode": {
+            0: {
+                "MainFormat": {0: {"Video": {**video, "FPS": "25", "GOP": "50"}}},
+                "ExtraFormat": {0: {"Video": video}, 1: {"Video": video}},
+            }
+        }
+    }
+    encode_config = StreamEncodeConfig.create_from_response(response)
+    assert encode_config[StreamType.MAIN].fps == 25.0
+    assert encode_config[StreamType.MAIN].keyframe_interval_seconds == 2.0
+    assert encode_config[StreamType.SUBSTREAM2].codec == "H.264"
+    assert StreamEncodeConfig(codec="", fps=0, gop=0).keyframe_interval_seconds is None
+
+
+async def test_stream_options_from_encode_config(
+    hass: HomeAssistant,
+    cameras_and_coordinator: tuple[
+        er.RegistryEntry,
+        er.RegistryEntry,
+        AmcrestDataCoordinator,
+    ],
+) -> None:
+    """Test the stream options and attributes follow the encode config."""
+    main_stream, sub_stream_1, _ = cameras_and_coordinator
+    camera = get_camera_from_entity_id(hass, main_stream.entity_id)
+    assert camera.stream_options == {
+        CONF_RTSP_TRANSPORT: "tcp",
+        CONF_USE_WALLCLOCK_AS_TIMESTAMPS: True,
+        CONF_EXTRA_PART_WAIT_TIME: 2.0,
+    }
+    state = hass.states.get(sub_stream_1.entity_id)
+    assert state.attributes["video_codec"] == "H.264"
+    assert state.attributes["gop"] == 30
+    assert state.attributes["keyframe_interval"] == 2.0
+
+
+async def test_selected_streams(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test only selected streams get entities, and options update them in place."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**mock_config_entry.data, CONF_STREAMS: [StreamType.MAIN]},
+    )
+    entry = await setup_integration(hass, config_entry)
+    assert entry is not None
+    ent_reg = er.async_get(hass)
+    assert ent_reg.async_get("camera.amc_test_main_stream") is not None
+    assert ent_reg.async_get("camera.amc_test_sub_stream_1") is None
+
+    with patch(
+        "custom_components.amcrest.async_setup_entry", new_callable=AsyncMock
+    ) as mock_setup_entry:
+        hass.config_entries.async_update_entry(
+            entry, options={CONF_STREAMS: [StreamType.SUBSTREAM1]}
+        )
+        await hass.async_block_till_done()
+        # streams are swapped without reloading the entry
+        mock_setup_entry.assert_not_called()
+
+    assert ent_reg.async_get("camera.amc_test_main_stream") is None
+    assert hass.states.get("camera.amc_test_main_stream") is None
+    assert ent_reg.async_get("camera.amc_test_sub_stream_1") is not None
+    assert hass.states.get("camera.amc_test_sub_stream_1") is not None
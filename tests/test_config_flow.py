@@ -10,8 +10,25 @@ from homeassistant.config_entries import SOURCE_USER, SOURCE_ZEROCONF
 from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
-
-from custom_components.amcrest.const import CONF_STREAMS, DOMAIN
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.amcrest.const import (
+    CONF_API_METRICS,
+    CONF_BUS_EVENT_CODES,
+    CONF_BUS_EVENT_INTERVAL_SECONDS,
+    CONF_BUS_EVENT_STRIP_FIELDS,
+    CONF_EVENT_INGEST_THREAD,
+    CONF_EVENT_MERGE_MS,
+    CONF_EVENT_MIN_ON_SECONDS,
+    CONF_PRELOAD_IDLE_SECONDS,
+    CONF_PRELOAD_STREAM,
+    CONF_STREAMS,
+    DEFAULT_BUS_EVENT_INTERVAL_SECONDS,
+    DEFAULT_EVENT_MIN_ON_SECONDS,
+    DOMAIN,
+)
+
+from .utils import setup_integration
 
 
 async def test_config_flow(
@@ -100,3 +117,40 @@ async def test_zeroconf_flow(
         assert result["type"] is FlowResultType.CREATE_ENTRY
 
         assert result["type"] is FlowResultType.CREATE_ENTRY
+
+
+async def test_options_flow(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the options flow."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_STREAMS: [str(StreamType.MAIN), str(StreamType.SUBSTREAM1)],
+            CONF_PRELOAD_STREAM: str(StreamType.SUBSTREAM1),
+            CONF_PRELOAD_IDLE_SECONDS: 30.0,
+            CONF_EVENT_MERGE_MS: 1500.0,
+        },
+    )
+    await hass.async_block_till_done()
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options == {
+        CONF_STREAMS: [StreamType.MAIN, StreamType.SUBSTREAM1],
+        CONF_PRELOAD_STREAM: str(StreamType.SUBSTREAM1),
+        CONF_PRELOAD_IDLE_SECONDS: 30,
+        CONF_EVENT_MIN_ON_SECONDS: DEFAULT_EVENT_MIN_ON_SECONDS,
+        CONF_EVENT_MERGE_MS: 1500,
+        CONF_EVENT_INGEST_THREAD: False,
+        CONF_API_METRICS: False,
+        CONF_BUS_EVENT_CODES: [],
+        CONF_BUS_EVENT_INTERVAL_SECONDS: DEFAULT_BUS_EVENT_INTERVAL_SECONDS,
+        CONF_BUS_EVENT_STRIP_FIELDS: [],
+    }
@@ -0,0 +1,122 @@
+"""Test Device Triggers."""
+
+import asyncio
+
+from amcrest_api.event import EventMessageType
+from homeassistant.components import automation
+from homeassistant.components.device_automation import DeviceAutomationType
+from homeassistant.const import CONF_URL
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_get_device_automations,
+)
+
+from custom_components.amcrest.const import DOMAIN
+
+from .const import MOCK_FIXED_CONFIG
+from .utils import FakeEventServer, setup_integration
+
+
+def _motion(action: str, region: str) -> str:
+    return (
+        f"Code=VideoMotion;action={action};index=0;"
+        f'data={{"Id":[0],"RegionName":["{region}"]}}'
+    )
+
+
+async def test_get_triggers(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test a trigger is offered for every supported event code."""
+    await setup_integration(hass, mock_config_entry)
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, MOCK_FIXED_CONFIG.serial_number)}
+    )
+    assert device is not None
+
+    triggers = await async_get_device_automations(
+        hass, DeviceAutomationType.TRIGGER, device.id
+    )
+    assert {
+        trigger["type"] for trigger in triggers if trigger["domain"] == DOMAIN
+    } == set(MOCK_FIXED_CONFIG.supported_events)
+
+
+async def test_trigger_fires_for_every_event(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    fake_event_server: FakeEventServer,
+) -> None:
+    """Test triggers fire from the stream, narrowed by action and region."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **mock_config_entry.data,
+            CONF_URL: f"http://127.0.0.1:{fake_event_server.port}",
+        },
+    )
+    entry = await setup_integration(hass, entry)
+    assert entry is not None
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, MOCK_FIXED_CONFIG.serial_number)}
+    )
+    assert device is not None
+
+    fired = async_capture_events(hass, "amcrest_test_trigger")
+    trigger = {
+        "platform": "device",
+        "domain": DOMAIN,
+        "device_id": device.id,
+        "type": EventMessageType.VideoMotion,
+    }
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": alias,
+                    "triggers": [{**trigger, **extra}],
+                    "actions": {
+                        "event": "amcrest_test_trigger",
+                        "event_data": {
+                            "alias": alias,
+                            "action": "{{ trigger.event.action }}",
+                            "regions": "{{ trigger.event.regions }}",
+                        },
+                    },
+                }
+                for alias, extra in (
+                    ("any", {}),
+                    ("driveway_start", {"action": "start", "region": "Driveway"}),
+                )
+            ]
+        },
+    )
+    # the triggers subscribe the camera to motion events
+    assert await hass.async_add_executor_job(fake_event_server.attached.wait, 5)
+
+    # a short Start and Stop pair fires both, nothing is coalesced away
+    fake_event_server.send(_motion("Start", "Driveway"))
+    fake_event_server.send(_motion("Stop", "Driveway"))
+    fake_event_server.send(_motion("Start", "Street"))
+    async with asyncio.timeout(5):
+        while len(fired) < 4:
+            await asyncio.sleep(0.01)
+    await hass.async_block_till_done()
+
+    assert [(e.data["alias"], e.data["action"]) for e in fired] == [
+        ("any", "start"),
+        ("driveway_start", "start"),
+        ("any", "stop"),
+        ("any", "start"),
+    ]
+    assert fired[-1].data["regions"] == ["Street"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
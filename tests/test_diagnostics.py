@@ -0,0 +1,89 @@
+"""Test the Amcrest diagnostics."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+from amcrest_api.const import StreamType
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import ExtendedJSONEncoder
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.amcrest.diagnostics import async_get_config_entry_diagnostics
+from custom_components.amcrest.events import parse_event
+
+from .utils import setup_integration
+
+
+async def test_diagnostics(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test diagnostics are redacted and serializable."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator = entry.runtime_data
+    coordinator.async_dispatch_event(
+        parse_event(
+            "Code=VideoMotion;action=Start;index=0;"
+            'data={"Id":[0],"RegionName":["Region1"]}'
+        )
+    )
+    with patch.object(
+        coordinator.api,
+        "async_get_rtsp_url",
+        new_callable=AsyncMock,
+        return_value="rtsp://10.0.0.1:554/stream",
+    ):
+        for _ in range(3):
+            await coordinator.async_get_stream_source(StreamType.MAIN)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    # downloads are encoded as Home Assistant does
+    json.dumps(diagnostics, cls=ExtendedJSONEncoder)
+
+    fixed_config = diagnostics["fixed_config"]
+    assert fixed_config["serial_number"] == REDACTED
+    assert fixed_config["session_physical_address"] == REDACTED
+    assert fixed_config["machine_name"] == coordinator.fixed_config.machine_name
+    assert diagnostics["data"]["last_events"]["VideoMotion"]["regions"] == ("Region1",)
+    assert "VideoMotion Region1" in diagnostics["data"]["last_region_events"]
+    assert len(diagnostics["polls"]["cycles"]) == 1
+    assert diagnostics["polls"]["worst_seconds"] is not None
+    assert diagnostics["caches"]["stream_sources"] == {
+        "hits": 2,
+        "misses": 1,
+        "hit_ratio": 2 / 3,
+    }
+    assert diagnostics["api_metrics"] is None
+    assert diagnostics["event_stream"]["uptime_seconds"] is None
+
+
+async def test_diagnostics_event_stream_outages(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test outages of the event stream are recorded until it is restored."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator = entry.runtime_data
+
+    assert not coordinator._async_event_stream_alive()
+    stats = coordinator.event_stream_stats
+    assert stats.connected_since is not None
+
+    coordinator._async_event_stream_lost("closed")
+    coordinator._async_event_stream_lost("refused")
+    assert stats.connected_since is None
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    (outage,) = diagnostics["event_stream"]["outages"]
+    assert outage["error"] == "closed"
+    assert outage["attempts"] == 2
+    assert outage["gap_seconds"] is None
+
+    assert coordinator._async_event_stream_alive()
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    (outage,) = diagnostics["event_stream"]["outages"]
+    assert outage["gap_seconds"] is not None
+    assert diagnostics["event_stream"]["uptime_seconds"] >= 0
+    assert diagnostics["event_stream"]["last_error"] == "refused"
@@ -0,0 +1,166 @@
+"""Test Event Entities."""
+
+import asyncio
+import dataclasses
+import statistics
+import time
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from amcrest_api.event import EventAction, EventMessageType
+from homeassistant.components.event import ATTR_EVENT_TYPE
+from homeassistant.const import (
+    CONF_URL,
+    EVENT_STATE_CHANGED,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.amcrest.const import DOMAIN
+from custom_components.amcrest.events import EVENT_DO_TALK_ACTION, create_event
+
+from .const import MOCK_FIXED_CONFIG
+from .test_binary_sensor import _make_mock_event_generator
+from .utils import FakeEventServer, setup_integration
+
+if TYPE_CHECKING:
+    from custom_components.amcrest.coordinator import AmcrestDataCoordinator
+
+UUT_HUMAN_SENSOR = "binary_sensor.amc_test_human_detected"
+UUT_LINE_CROSSED = "event.amc_test_line_crossed"
+UUT_DOORBELL = "event.amc_test_doorbell"
+DOORBELL_LATENCY_BOUND_SECONDS = 0.1
+
+MOCK_SMART_FIXED_CONFIG = dataclasses.replace(
+    MOCK_FIXED_CONFIG,
+    supported_events=[
+        *MOCK_FIXED_CONFIG.supported_events,
+        EventMessageType.SmartMotionHuman,
+        EventMessageType.CrossLineDetection,
+    ],
+)
+
+MOCK_DOORBELL_FIXED_CONFIG = dataclasses.replace(
+    MOCK_FIXED_CONFIG, supported_events=[EVENT_DO_TALK_ACTION]
+)
+
+
+@pytest.fixture(autouse=True)
+def enable_all_entities() -> Generator[None]:
+    """Enable entities that are disabled by default."""
+    with patch(
+        "homeassistant.helpers.entity.Entity.entity_registry_enabled_default",
+        new_callable=PropertyMock,
+        return_value=True,
+    ):
+        yield
+
+
+async def test_event_types_from_table(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test supported event codes become listening entities."""
+    with patch(
+        "custom_components.amcrest.api.AmcrestApi.async_listen_events",
+        _make_mock_event_generator([]),
+    ):
+        entry = await setup_integration(
+            hass, mock_config_entry, fixed_config=MOCK_SMART_FIXED_CONFIG
+        )
+        assert entry is not None
+        coordinator: AmcrestDataCoordinator = entry.runtime_data
+        await hass.async_block_till_done()
+
+        # the entities listen for their codes, unlike the switched ones
+        assert coordinator.event_listener_filter == {
+            EventMessageType.SmartMotionHuman,
+            EventMessageType.CrossLineDetection,
+        }
+        assert hass.states.is_state(UUT_HUMAN_SENSOR, STATE_OFF)
+        assert hass.states.get(UUT_LINE_CROSSED).state != STATE_UNAVAILABLE
+
+        coordinator.async_dispatch_event(
+            create_event(EventMessageType.SmartMotionHuman, EventAction.Start)
+        )
+        coordinator.async_dispatch_event(
+            create_event(EventMessageType.CrossLineDetection, EventAction.Pulse)
+        )
+        await hass.async_block_till_done()
+        assert hass.states.is_state(UUT_HUMAN_SENSOR, STATE_ON)
+        state = hass.states.get(UUT_LINE_CROSSED)
+        assert state.attributes[ATTR_EVENT_TYPE] == "pulse"
+        assert (
+            coordinator.amcrest_data.last_events[
+                EventMessageType.SmartMotionHuman
+            ].action
+            == EventAction.Start
+        )
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        assert not coordinator.is_listening_for_events
+
+
+async def test_doorbell_fast_path(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    fake_event_server: FakeEventServer,
+) -> None:
+    """Test each doorbell press is handled at once, bypassing the queue."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **mock_config_entry.data,
+            CONF_URL: f"http://127.0.0.1:{fake_event_server.port}",
+        },
+    )
+    entry = await setup_integration(
+        hass, entry, fixed_config=MOCK_DOORBELL_FIXED_CONFIG
+    )
+    assert entry is not None
+    coordinator: AmcrestDataCoordinator = entry.runtime_data
+    assert await hass.async_add_executor_job(fake_event_server.attached.wait, 5)
+
+    pressed = asyncio.Event()
+    presses = 0
+    pressed_at = 0.0
+
+    @callback
+    def async_record_press(event: Event[EventStateChangedData]) -> None:
+        nonlocal presses, pressed_at
+        if event.data["entity_id"] == UUT_DOORBELL:
+            presses += 1
+            pressed_at = time.perf_counter()
+            pressed.set()
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, async_record_press)
+
+    latencies: list[float] = []
+    for _ in range(5):
+        pressed.clear()
+        # codes unknown to the integration do not end the stream
+        fake_event_server.send("Code=NewFeature;action=Start;index=0")
+        sent_at = time.perf_counter()
+        fake_event_server.send(
+            f'Code={EVENT_DO_TALK_ACTION};action=Pulse;index=0;data={{"Action":"Invite"}}'
+        )
+        async with asyncio.timeout(5):
+            await pressed.wait()
+        latencies.append(pressed_at - sent_at)
+
+    state = hass.states.get(UUT_DOORBELL)
+    assert state.attributes[ATTR_EVENT_TYPE] == "invite"
+    assert presses == 5
+    # presses were neither queued nor coalesced
+    assert coordinator.event_coalescer.forwarded == 0
+    # from the camera's message to the entity's state, sparing a slow first press
+    assert statistics.median(latencies) < DOORBELL_LATENCY_BOUND_SECONDS, latencies
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,94 @@
+"""Test off-loop event ingestion."""
+
+import asyncio
+import statistics
+from collections.abc import AsyncGenerator
+
+import pytest
+from amcrest_api.event import EventAction, EventBase, HeartbeatEvent, VideoMotionEvent
+
+from custom_components.amcrest.api import AmcrestApi
+from custom_components.amcrest.ingest import EventIngestWorker
+
+from .utils import FakeEventServer
+
+CAMERA_COUNT = 10
+LOAD_SECONDS = 2.0
+# A 5 ms timer is sampled, a loaded loop runs it within a frame
+LAG_SAMPLE_SECONDS = 0.005
+LAG_BOUND_SECONDS = 0.05
+
+
+async def _async_listen_on_loop(
+    api: AmcrestApi, *, heartbeat_seconds: int, filter_events: list[str]
+) -> AsyncGenerator[EventBase | None]:
+    """Read a camera's stream on the event loop, as without the worker."""
+    async for event in api.async_listen_events(
+        heartbeat_seconds=heartbeat_seconds, filter_events=filter_events
+    ):
+        yield event
+
+
+async def _async_measure_loop_lag(stop: asyncio.Event) -> list[float]:
+    """Sample how late the loop runs a short timer."""
+    lags: list[float] = []
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(LAG_SAMPLE_SECONDS)
+        lags.append(loop.time() - start - LAG_SAMPLE_SECONDS)
+    return lags
+
+
+@pytest.mark.parametrize("events_per_second", [1, 10, 100])
+@pytest.mark.parametrize("off_loop", [False, True], ids=["on loop", "off loop"])
+async def test_ingest_load(
+    fake_event_server: FakeEventServer,
+    events_per_second: int,
+    off_loop: bool,
+) -> None:
+    """Test every camera keeps up and the loop stays responsive, on or off it."""
+    fake_event_server.events_per_second = events_per_second
+    worker = EventIngestWorker()
+    cameras = [
+        AmcrestApi(
+            host="127.0.0.1",
+            port=fake_event_server.port,
+            username="admin",
+            password="password",
+        )
+        for _ in range(CAMERA_COUNT)
+    ]
+    received = [0] * CAMERA_COUNT
+
+    async def async_listen(i: int) -> None:
+        listen_events = (
+            worker.async_listen_events if off_loop else _async_listen_on_loop
+        )
+        async for event in listen_events(
+            cameras[i], heartbeat_seconds=10, filter_events=["VideoMotion"]
+        ):
+            assert isinstance(event, (HeartbeatEvent, VideoMotionEvent))
+            if isinstance(event, VideoMotionEvent):
+                assert event.action in (EventAction.Start, EventAction.Stop)
+                assert event.region_name == ["Region1"]
+                received[i] += 1
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_async_measure_loop_lag(stop))
+    listeners = [asyncio.create_task(async_listen(i)) for i in range(CAMERA_COUNT)]
+    await asyncio.sleep(LOAD_SECONDS)
+    stop.set()
+    lags = await lag_task
+    for listener in listeners:
+        listener.cancel()
+    await asyncio.gather(*listeners, return_exceptions=True)
+    worker.stop()
+
+    # every camera kept up with the rate it was sent at
+    assert min(received) >= events_per_second * LOAD_SECONDS * 0.5
+    # and the loop stayed responsive, the median ignoring a stray slow tick
+    assert statistics.median(lags) < LAG_BOUND_SECONDS, (
+        f"loop lag median {statistics.median(lags) * 1000:.2f} ms, "
+        f"max {max(lags) * 1000:.2f} ms"
+    )
@@ -0,0 +1,152 @@
+"""Test request metrics."""
+
+import time
+from collections.abc import Generator
+from unittest.mock import PropertyMock, patch
+
+import httpx
+import pytest
+from amcrest_api.const import ApiEndpoints
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.amcrest.api import AmcrestApi
+from custom_components.amcrest.const import CONF_API_METRICS
+from custom_components.amcrest.diagnostics import async_get_config_entry_diagnostics
+from custom_components.amcrest.metrics import ApiMetrics, endpoint_name
+
+from .utils import setup_integration
+
+UUT_REQUEST_ERRORS = "sensor.amc_test_request_errors"
+
+
+def _make_api(transport: httpx.MockTransport) -> AmcrestApi:
+    api = AmcrestApi(host="127.0.0.1", port=80, username="admin", password="pw")
+    api._client = api._create_async_client(  # pylint: disable=protected-access
+        transport=transport
+    )
+    return api
+
+
+@pytest.fixture
+def enable_all_entities() -> Generator[None]:
+    """Enable entities that are disabled by default."""
+    with patch(
+        "homeassistant.helpers.entity.Entity.entity_registry_enabled_default",
+        new_callable=PropertyMock,
+        return_value=True,
+    ):
+        yield
+
+
+def test_endpoint_name() -> None:
+    """Test endpoints are named with their action and config."""
+    assert (
+        endpoint_name(
+            ApiEndpoints.CONFIG_MANAGER, {"action": "getConfig", "name": "Encode"}
+        )
+        == "configManager.cgi getConfig Encode"
+    )
+    assert endpoint_name(ApiEndpoints.SNAPSHOT, None) == "snapshot.cgi"
+
+
+async def test_api_metrics() -> None:
+    """Test requests are recorded by endpoint when metrics are on."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == ApiEndpoints.SNAPSHOT:
+            return httpx.Response(
+                200, content=b"\xff" * 1000, headers={"content-type": "image/jpeg"}
+            )
+        return httpx.Response(500, text="Error")
+
+    api = _make_api(httpx.MockTransport(handler))
+    # nothing is recorded by default
+    assert await api.async_snapshot() == b"\xff" * 1000
+
+    api.metrics = metrics = ApiMetrics()
+    await api.async_snapshot()
+    with pytest.raises(httpx.HTTPStatusError):
+        await api.async_ptz_status
+
+    assert metrics.requests == 2
+    assert metrics.errors == 1
+    assert metrics.bytes_received == 1000
+    assert metrics.latency.count == 2
+    snapshot = metrics.endpoints["snapshot.cgi"]
+    assert snapshot.requests == 1
+    assert snapshot.errors == 0
+    ptz = metrics.endpoints["ptz.cgi getStatus"]
+    assert ptz.errors == 1
+    assert ptz.last_error is not None
+    assert "500" in ptz.last_error
+    (error,) = metrics.recent_errors
+    assert error["endpoint"] == "ptz.cgi getStatus"
+    # the rate counts every request, with metrics on or off
+    assert api.request_history.events_per_minute(time.monotonic()) == 3
+    await api.aclose_client()
+
+
+@pytest.mark.usefixtures("enable_all_entities")
+async def test_metrics_sensors(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the sensors show the metrics when they are on."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_API_METRICS: True}
+    )
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator = entry.runtime_data
+    metrics = coordinator.api.metrics
+    assert hass.states.get(UUT_REQUEST_ERRORS) is not None
+
+    metrics.add_error("ptz.cgi getStatus", 0.01, httpx.ConnectError("down"))
+    coordinator.async_update_listeners()
+    await hass.async_block_till_done()
+    state = hass.states.get(UUT_REQUEST_ERRORS)
+    assert state.state == str(metrics.errors)
+    assert state.attributes["ptz.cgi getStatus"] == 1
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["api_metrics"]["errors"] == metrics.errors
+
+    # turning metrics off reloads, to remove the sensors
+    with patch.object(hass.config_entries, "async_schedule_reload") as mock_reload:
+        hass.config_entries.async_update_entry(entry, options={})
+        await hass.async_block_till_done()
+    mock_reload.assert_called_once_with(entry.entry_id)
+
+
+async def test_metrics_off(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test there are no metrics or sensors by default."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    assert entry.runtime_data.api.metrics is None
+    assert hass.states.get(UUT_REQUEST_ERRORS) is None
+
+
+async def test_poll_failures_logged_once(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failing poll is logged when it starts failing and recovers."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator = entry.runtime_data
+
+    for _ in range(2):
+        coordinator._async_log_poll_failures(  # pylint: disable=protected-access
+            ["storage_info", "ptz_presets"], [ValueError("Error"), []]
+        )
+    assert caplog.text.count("Polling storage_info") == 1
+    assert "ptz_presets" not in caplog.text
+
+    coordinator._async_log_poll_failures(["storage_info"], [[]])  # pylint: disable=protected-access
+    assert "Polling storage_info from http://10.0.0.2 recovered" in caplog.text
@@ -0,0 +1,188 @@
+"""Test event statistics."""
+
+from collections.abc import Generator
+from datetime import datetime, timedelta
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from amcrest_api.event import EventAction, EventMessageType
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.amcrest.const import EVENT_RATE_WINDOW_SECONDS
+from custom_components.amcrest.data import event_camera_time
+from custom_components.amcrest.diagnostics import async_get_config_entry_diagnostics
+from custom_components.amcrest.events import parse_event
+from custom_components.amcrest.stats import (
+    EventHistory,
+    EventStats,
+    LatencyHistogram,
+    RunningMedian,
+)
+
+from .utils import setup_integration
+
+UUT_EVENT_RATE = "sensor.amc_test_event_rate"
+UUT_MOTION_DURATION = "sensor.amc_test_median_motion_duration"
+UUT_LAST_EVENT = "sensor.amc_test_last_event"
+UUT_LATENCY_P50 = "sensor.amc_test_event_latency_p50"
+
+
+def _motion_at(action: str, camera_time: datetime) -> str:
+    return (
+        f"Code=VideoMotion;action={action};index=0;"
+        f'data={{"LocaleTime":"{camera_time:%Y-%m-%d %H:%M:%S}","RegionName":[]}}'
+    )
+
+
+@pytest.fixture
+def enable_all_entities() -> Generator[None]:
+    """Enable entities that are disabled by default."""
+    with patch(
+        "homeassistant.helpers.entity.Entity.entity_registry_enabled_default",
+        new_callable=PropertyMock,
+        return_value=True,
+    ):
+        yield
+
+
+def test_event_history() -> None:
+    """Test the rate only counts events within the window."""
+    assert EventHistory(size=4).last is None
+    history = EventHistory(size=4)
+    assert history.events_per_minute(0.0) == 0
+
+    for now in (0.0, 1.0, 2.0):
+        history.add(now)
+    assert history.events_per_minute(2.0) == 3
+    assert history.last == 2.0
+    # the first events leave the window
+    assert history.events_per_minute(EVENT_RATE_WINDOW_SECONDS + 1.5) == 1
+
+    # a full ring saturates at its size
+    for i in range(10):
+        history.add(100.0 + i)
+    assert history.events_per_minute(110.0) == 4
+    assert history.last == 109.0
+
+
+def test_running_median() -> None:
+    """Test the median of the latest values."""
+    assert RunningMedian(size=3).median is None
+    median = RunningMedian(size=3)
+    median.add(5.0)
+    assert median.median == 5.0
+    median.add(1.0)
+    assert median.median == 3.0
+    median.add(9.0)
+    assert median.median == 5.0
+    # the oldest value, 5.0, is replaced
+    median.add(2.0)
+    assert median.median == 2.0
+
+
+def test_event_durations() -> None:
+    """Test durations are timed from the first Start to the Stop."""
+    stats = EventStats()
+    motion = EventMessageType.VideoMotion
+    stats.add(motion, EventAction.Start, 10.0)
+    stats.add(motion, EventAction.Start, 12.0)
+    stats.add(motion, EventAction.Stop, 14.0)
+    stats.add(motion, EventAction.Stop, 15.0)
+    stats.add(motion, EventAction.Start, 20.0)
+    stats.add(motion, EventAction.Stop, 26.0)
+    assert stats.median_duration(motion) == 5.0
+    assert stats.median_duration(EventMessageType.AudioMutation) is None
+    assert stats.events_per_minute(26.0) == {motion: 6}
+    assert stats.last == 26.0
+
+
+@pytest.mark.usefixtures("enable_all_entities")
+async def test_event_stats_sensors(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the statistics sensors follow the coordinator."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    assert float(hass.states.get(UUT_EVENT_RATE).state) == 0
+    assert hass.states.is_state(UUT_MOTION_DURATION, "unknown")
+    assert hass.states.is_state(UUT_LAST_EVENT, "unknown")
+
+    coordinator = entry.runtime_data
+    now = hass.loop.time()
+    motion = EventMessageType.VideoMotion
+    coordinator.event_stats.add(motion, EventAction.Start, now - 4.0)
+    coordinator.event_stats.add(motion, EventAction.Stop, now - 1.0)
+    coordinator.async_update_listeners()
+    await hass.async_block_till_done()
+
+    state = hass.states.get(UUT_EVENT_RATE)
+    assert float(state.state) == 2
+    assert state.attributes[motion] == 2
+    assert float(hass.states.get(UUT_MOTION_DURATION).state) == pytest.approx(3.0)
+    assert hass.states.get(UUT_LAST_EVENT).state != "unknown"
+
+
+def test_latency_histogram() -> None:
+    """Test percentiles are read from the bucket counts."""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    for seconds in (0.003, 0.004, 0.004, 0.015, 0.8):
+        histogram.add(seconds)
+    assert histogram.percentile(50) == 5
+    assert histogram.percentile(95) == 1000
+    # past the last bucket, the last bound is the best known
+    histogram.add(600.0)
+    assert histogram.percentile(99) == 60000
+    assert histogram.as_dict()["buckets_ms"]["inf"] == 1
+
+
+def test_event_camera_time() -> None:
+    """Test the camera's time of an event is corrected by its clock offset."""
+    event = parse_event(_motion_at("Start", datetime(2025, 1, 1, 12, 0, 5)))
+    assert (
+        event_camera_time(event, timedelta(seconds=5))
+        == datetime(2025, 1, 1, 12, 0, 0).astimezone()
+    )
+    assert (
+        event_camera_time(
+            parse_event("Code=VideoMotion;action=Start;index=0"), timedelta()
+        )
+        is None
+    )
+
+
+@pytest.mark.usefixtures("enable_all_entities")
+async def test_event_latency(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test latencies are recorded when an event's state is written."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator = entry.runtime_data
+    assert hass.states.is_state(UUT_LATENCY_P50, "unknown")
+
+    # the camera's clock runs an hour ahead
+    coordinator.camera_clock_offset = timedelta(hours=1)
+    camera_time = datetime.now() + timedelta(hours=1) - timedelta(seconds=3)
+    coordinator.async_dispatch_event(parse_event(_motion_at("Start", camera_time)))
+    await hass.async_block_till_done()
+
+    latency = coordinator.event_latency
+    assert latency.handling.count == 1
+    assert latency.handling.percentile(50) <= 100
+    assert latency.camera.count == 1
+    # stamped to the second, the event was seen 3 to 4 seconds ago
+    assert 2000 < latency.total.percentile(50) <= 5000
+
+    coordinator.async_update_listeners()
+    await hass.async_block_till_done()
+    state = hass.states.get(UUT_LATENCY_P50)
+    assert float(state.state) == latency.total.percentile(50)
+    assert state.attributes["handling"] == latency.handling.percentile(50)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["camera_clock_offset_seconds"] == 3600
+    assert diagnostics["event_latency"]["total"]["count"] == 1
@@ -0,0 +1,43 @@
+"""Test the Amcrest system health."""
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    get_system_health_info,
+)
+
+from custom_components.amcrest.const import DOMAIN
+
+from .utils import setup_integration
+
+
+async def test_system_health(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the fleet is reported from what the cameras recorded."""
+    assert await async_setup_component(hass, "system_health", {})
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    MockConfigEntry(domain=DOMAIN, state=ConfigEntryState.SETUP_RETRY).add_to_hass(hass)
+    MockConfigEntry(domain=DOMAIN, state=ConfigEntryState.SETUP_ERROR).add_to_hass(hass)
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info["cameras_configured"] == 3
+    assert info["cameras_online"] == 1
+    assert info["cameras_offline"] == 1
+    assert info["cameras_in_backoff"] == 1
+    assert info["event_streams_active"] == 0
+    assert info["event_streams_reconnecting"] == 0
+    assert info["poll_time_median"].endswith(" s")
+    assert info["poll_time_worst"].endswith(" s")
+    assert info["requests_per_minute"] >= 0
+
+    coordinator = entry.runtime_data
+    coordinator.last_update_success = False
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info["cameras_online"] == 0
+    assert info["cameras_offline"] == 2
@@ -0,0 +1,195 @@
+"""Test request tracing."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from homeassistant.auth.models import User
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.exceptions import ServiceValidationError, Unauthorized
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.amcrest import tracing
+from custom_components.amcrest.api import AmcrestApi
+from custom_components.amcrest.const import DOMAIN
+
+from .utils import setup_integration
+
+
+def _spans(tracer: tracing.Tracer, category: str) -> list[dict]:
+    return [
+        event
+        for event in tracer.events
+        if event["ph"] == "X" and event["cat"] == category
+    ]
+
+
+async def test_tracer_spans() -> None:
+    """Test concurrent tasks are traced on threads of their own."""
+    assert tracing.tracer is None
+    with tracing.span("untraced", "test") as span_args:
+        assert span_args is None
+
+    tracer = tracing.start()
+    assert tracer is not None
+    assert tracing.start() is None
+
+    async def work(name: str) -> None:
+        with tracing.span(name, "test") as span_args:
+            assert span_args is not None
+            span_args["done"] = True
+            await asyncio.sleep(0)
+
+    try:
+        await asyncio.gather(
+            asyncio.create_task(work("a"), name="task a"),
+            asyncio.create_task(work("b"), name="task b"),
+        )
+        with pytest.raises(ValueError), tracing.span("failed", "test"):
+            raise ValueError("boom")
+    finally:
+        assert tracing.stop() is tracer
+    assert tracing.stop() is None
+
+    spans = {span["name"]: span for span in _spans(tracer, "test")}
+    assert spans.keys() == {"a", "b", "failed"}
+    assert spans["a"]["tid"] != spans["b"]["tid"]
+    assert spans["a"]["args"] == {"done": True}
+    assert "boom" in spans["failed"]["args"]["error"]
+    threads = {
+        event["tid"]: event["args"]["name"]
+        for event in tracer.events
+        if event["name"] == "thread_name"
+    }
+    assert threads[spans["a"]["tid"]] == "task a"
+    assert threads[spans["b"]["tid"]] == "task b"
+
+
+async def test_tracer_http_phases() -> None:
+    """Test the phases of a request follow its wait for a connection."""
+    tracer = tracing.Tracer()
+    trace = tracer.http_trace()
+    await trace("connection.connect_tcp.started", {})
+    await trace("connection.connect_tcp.complete", {"return_value": None})
+    await trace("http11.send_request_headers.started", {})
+    await trace("http11.send_request_headers.failed", {"exception": OSError("reset")})
+
+    names = [span["name"] for span in _spans(tracer, "http")]
+    assert names == [
+        "wait for connection",
+        "connection.connect_tcp",
+        "http11.send_request_headers",
+    ]
+    assert "reset" in _spans(tracer, "http")[-1]["args"]["error"]
+
+
+async def test_tracer_max_events() -> None:
+    """Test events past the limit are counted rather than kept."""
+    tracer = tracing.Tracer(max_events=3)
+    for _ in range(3):
+        with tracer.span("span", "test"):
+            pass
+    # names of the process, loop callbacks and this test's task came first
+    assert [event["ph"] for event in tracer.events] == ["M", "M", "M"]
+    assert tracer.as_dict()["otherData"] == {"dropped_events": 3}
+
+
+async def test_trace_requests() -> None:
+    """Test requests are traced while a trace is active."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=b"\xff" * 10, headers={"content-type": "image/jpeg"}
+        )
+
+    api = AmcrestApi(host="127.0.0.1", port=80, username="admin", password="pw")
+    api._client = api._create_async_client(  # pylint: disable=protected-access
+        transport=httpx.MockTransport(handler)
+    )
+    tracer = tracing.start()
+    assert tracer is not None
+    try:
+        await api.async_snapshot()
+    finally:
+        tracing.stop()
+    await api.async_snapshot()
+    await api.aclose_client()
+
+    (span,) = _spans(tracer, "request")
+    assert span["name"] == "snapshot.cgi"
+    assert span["args"] == {
+        "camera": "127.0.0.1",
+        "status": 200,
+        "bytes": 10,
+        "auth_challenges": 0,
+    }
+
+
+async def test_trace_services(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a trace is written to the config directory when stopped."""
+    hass.config.config_dir = str(tmp_path)
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    coordinator = entry.runtime_data
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(DOMAIN, "stop_trace", blocking=True)
+
+    await hass.services.async_call(DOMAIN, "start_trace", blocking=True)
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(DOMAIN, "start_trace", blocking=True)
+    with patch.object(
+        coordinator.api,
+        "async_snapshot",
+        new_callable=AsyncMock,
+        return_value=b"\xff",
+    ):
+        await coordinator.async_take_snapshot()
+    with patch.object(
+        coordinator, "async_poll_endpoints", return_value=coordinator.amcrest_data
+    ):
+        await coordinator.async_refresh()
+    await hass.services.async_call(DOMAIN, "stop_trace", blocking=True)
+    assert tracing.tracer is None
+
+    (path,) = tmp_path.glob(f"{DOMAIN}_trace_*.json")
+    assert f"to {path}" in caplog.text
+    trace = json.loads(path.read_text())
+    assert trace["displayTimeUnit"] == "ms"
+    assert f"trace of {len(trace['traceEvents'])} events" in caplog.text
+    spans = {
+        (event["cat"], event["name"])
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    }
+    assert ("snapshot", "snapshot") in spans
+    assert ("poll", "poll") in spans
+
+
+@pytest.mark.parametrize("service", ["start_trace", "stop_trace"])
+async def test_trace_services_require_admin(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    hass_read_only_user: User,
+    service: str,
+) -> None:
+    """Test only administrators can trace."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+
+    with pytest.raises(Unauthorized):
+        await hass.services.async_call(
+            DOMAIN,
+            service,
+            blocking=True,
+            context=Context(user_id=hass_read_only_user.id),
+        )
+    assert tracing.tracer is None
@@ -0,0 +1,138 @@
+"""Test the WebSocket API."""
+
+from amcrest_api.event import EventAction, EventMessageType
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from custom_components.amcrest.const import (
+    DOMAIN,
+    EVENT_SUBSCRIPTION_BUFFER_SIZE,
+    SIGNAL_CAMERA_EVENT,
+    SIGNAL_CAMERA_EVENTS,
+)
+from custom_components.amcrest.events import create_event
+
+from .const import MOCK_FIXED_CONFIG
+from .utils import setup_integration
+
+
+async def test_subscribe_events(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test events are sent in batches, keeping only the newest of a burst."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, MOCK_FIXED_CONFIG.serial_number)}
+    )
+    assert device is not None
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {
+            "type": "amcrest/subscribe_events",
+            "device_id": device.id,
+            "event_codes": [EventMessageType.VideoMotion],
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    # the camera is asked for the subscribed codes
+    assert entry.runtime_data.event_listener_filter == {EventMessageType.VideoMotion}
+
+    signal = SIGNAL_CAMERA_EVENT.format(entry.entry_id, EventMessageType.VideoMotion)
+    motion = create_event(EventMessageType.VideoMotion, EventAction.Start)
+    async_dispatcher_send(hass, signal, motion)
+    msg = await client.receive_json()
+    assert msg["type"] == "event"
+    assert msg["event"]["dropped"] == 0
+    [event] = msg["event"]["events"]
+    assert event["device_id"] == device.id
+    assert event["code"] == EventMessageType.VideoMotion
+    assert event["action"] == "start"
+    # the time the camera's message arrived, not the time it was sent on
+    assert event["time"] == motion.received_at.isoformat()
+
+    # a burst larger than the buffer drops its oldest events
+    burst = EVENT_SUBSCRIPTION_BUFFER_SIZE + 6
+    for i in range(burst):
+        action = EventAction.Start if i % 2 else EventAction.Stop
+        async_dispatcher_send(
+            hass, signal, create_event(EventMessageType.VideoMotion, action)
+        )
+    msg = await client.receive_json()
+    assert msg["event"]["dropped"] == 6
+    events = msg["event"]["events"]
+    assert len(events) == EVENT_SUBSCRIPTION_BUFFER_SIZE
+    assert events[-1]["action"] == "start"
+
+    await client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": msg["id"]}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert entry.runtime_data.event_listener_filter == set()
+
+
+async def test_subscribe_events_all_cameras(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test without filters, the events cameras already listen for are sent."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "amcrest/subscribe_events"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert entry.runtime_data.event_listener_filter == set()
+
+    async_dispatcher_send(
+        hass,
+        SIGNAL_CAMERA_EVENTS.format(entry.entry_id),
+        create_event(EventMessageType.AudioMutation, EventAction.Start),
+    )
+    msg = await client.receive_json()
+    [event] = msg["event"]["events"]
+    assert event["code"] == EventMessageType.AudioMutation
+
+
+async def test_subscribe_events_unknown_device(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test subscribing to a device that is not a camera fails."""
+    await setup_integration(hass, mock_config_entry)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": "amcrest/subscribe_events", "device_id": "not_a_device"}
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
+async def test_subscribe_events_require_admin(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_read_only_access_token: str,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test only administrators can follow camera events."""
+    entry = await setup_integration(hass, mock_config_entry)
+    assert entry is not None
+    client = await hass_ws_client(hass, hass_read_only_access_token)
+
+    await client.send_json_auto_id({"type": "amcrest/subscribe_events"})
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "unauthorized"
@@ -1,13 +1,23 @@
 """Utils to assist testing."""
 
+import asyncio
+import threading
+from dataclasses import replace
 from unittest.mock import AsyncMock, patch
 
+from aiohttp import web
 from amcrest_api.config import Config as AmcrestFixedConfig
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from tests.const import MOCK_DATA_UPDATE, MOCK_FIXED_CONFIG
+from custom_components.amcrest.data import AmcrestData
+from tests.const import (
+    MOCK_DATA_UPDATE,
+    MOCK_ENCODE_CONFIG,
+    MOCK_FIXED_CONFIG,
+    MOCK_MOTION_REGIONS,
+)
 
 
 async def setup_integration(
@@ -15,6 +25,7 @@ async def setup_integration(
     config_entry: MockConfigEntry,
     *,
     fixed_config: AmcrestFixedConfig = MOCK_FIXED_CONFIG,
+    data: AmcrestData = MOCK_DATA_UPDATE,
 ) -> ConfigEntry | None:
     """Fixture for setting up the component."""
     config_entry.add_to_hass(hass)
@@ -24,11 +35,110 @@ async def setup_integration(
             new_callable=AsyncMock,
             return_value=fixed_config,
         ),
+        patch(
+            "custom_components.amcrest.coordinator.AmcrestDataCoordinator.async_get_encode_config",
+            new_callable=AsyncMock,
+            return_value=MOCK_ENCODE_CONFIG,
+        ),
+        patch(
+            "custom_components.amcrest.coordinator.AmcrestDataCoordinator.async_get_motion_regions",
+            new_callable=AsyncMock,
+            return_value=MOCK_MOTION_REGIONS,
+        ),
         patch(
             "custom_components.amcrest.coordinator.AmcrestDataCoordinator.async_poll_endpoints",
             new_callable=AsyncMock,
-            return_value=MOCK_DATA_UPDATE,
+            # a copy, events received by the coordinator are recorded on it
+            return_value=replace(data, last_events={}, last_region_events={}),
         ),
     ):
         assert await hass.config_entries.async_setup(config_entry.entry_id)
     return hass.config_entries.async_get_entry(config_entry.entry_id)
+
+
+def _event_part(body: str) -> bytes:
+    return (
+        f"--myboundary\r\nContent-Type: text/plain\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n{body}\r\n"
+    ).encode()
+
+
+class FakeEventServer:
+    """
+    Camera event endpoint, on a thread of its own.
+    Motion events are served at a fixed rate if one is set, other messages
+    are sent on demand.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the server."""
+        self.events_per_second = 0.0
+        self.port = 0
+        self.attached = threading.Event()
+        self._responses: set[web.StreamResponse] = set()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever)
+        self._runner: web.AppRunner | None = None
+
+    async def _async_handle_attach(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        response.content_type = "multipart/x-mixed-replace; boundary=myboundary"
+        await response.prepare(request)
+        await response.write(_event_part("Heartbeat"))
+        self._responses.add(response)
+        self.attached.set()
+        actions = ("Start", "Stop")
+        i = 0
+        try:
+            while True:
+                if not self.events_per_second:
+                    await asyncio.sleep(1.0)
+                    await response.write(_event_part("Heartbeat"))
+                    continue
+                await asyncio.sleep(1.0 / self.events_per_second)
+                await response.write(
+                    _event_part(
+                        f"Code=VideoMotion;action={actions[i % 2]};index=0;"
+                        'data={"Id":[0],"RegionName":["Region1"]}'
+                    )
+                )
+                i += 1
+        except ConnectionResetError:
+            pass  # the listener disconnected
+        finally:
+            self._responses.discard(response)
+        return response
+
+    async def _async_send(self, message: str) -> None:
+        for response in tuple(self._responses):
+            await response.write(_event_part(message))
+
+    def send(self, message: str) -> None:
+        """Send an event message to every attached listener."""
+        asyncio.run_coroutine_threadsafe(self._async_send(message), self._loop).result(
+            timeout=5
+        )
+
+    async def _async_start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/cgi-bin/eventManager.cgi", self._async_handle_attach)
+        self._runner = web.AppRunner(app, handle_signals=False, shutdown_timeout=1.0)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    def start(self) -> None:
+        """Start serving."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._async_start(), self._loop).result()
+
+    def stop(self) -> None:
+        """Stop serving."""
+        assert self._runner is not None
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(
+            timeout=5
+        )
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()